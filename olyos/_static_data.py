@@ -0,0 +1,177 @@
+"""
+OLYOS CAPITAL - Static reference tables
+=======================================
+Large literal tables from config.py. They are imported lazily, on first
+access to the matching config attribute, so importing config for
+thresholds or filters does not build them.
+"""
+
+import sys
+from types import MappingProxyType
+from typing import Dict, Mapping, Tuple
+
+
+# =============================================================================
+# TICKER MAPPING
+# =============================================================================
+
+# Mapping of ticker symbols to Yahoo Finance format
+_TICKER_MAP_LITERAL: Dict[str, str] = {
+    # Belgian stocks
+    'SIP': 'SIP.BR',
+    'BEKB': 'BEKB.BR',
+
+    # Danish stocks
+    'PNDORA': 'PNDORA.CO',
+
+    # German stocks
+    'NEAG': 'NEAG.DE',
+    'HBH': 'HBH.DE',
+    'WAC': 'WAC.DE',
+    'NDA': 'NDA.DE',
+    'SZG': 'SZG.DE',
+
+    # Swiss stocks
+    'ZURN': 'ZURN.SW',
+    'IMPN': 'IMPN.SW',
+
+    # US stocks
+    'FCX': 'FCX',
+
+    # Dutch stocks
+    'BAMNB': 'BAMNB.AS',
+    'HEIJM': 'HEIJM.AS',
+
+    # Italian stocks
+    'WBD': 'WBD.MI',
+    'DAN': 'DAN.MI',
+    'MAIRE': 'MAIRE.MI',
+    'BZU': 'BZU.MI',
+    'CEM': 'CEM.MI',
+
+    # Spanish stocks
+    'CAF': 'CAF.MC',
+    'TRE': 'TRE.MC',
+    'IDR': 'IDR.MC',
+    'CIE': 'CIE.MC',
+    'SCYR': 'SCYR.MC',
+
+    # Greek stocks
+    'METLEN': 'METLEN.AT',
+    'MOH': 'MOH.AT',
+    'BELA': 'BELA.AT',
+
+    # Portuguese stocks
+    'EGL': 'EGL.LS',
+
+    # Austrian stocks
+    'POS': 'POS.VI',
+
+    # UK stocks
+    'KLR': 'KLR.L',
+    'MGNS': 'MGNS.L',
+    'IMB': 'IMB.L',
+    'RIO': 'RIO.L',
+    'BA': 'BA.L',
+
+    # French stocks (explicit mapping)
+    'MC': 'MC.PA',
+    'VIE': 'VIE.PA',
+    'GFC': 'GFC.PA',
+    'ALVAP': 'ALVAP.PA',
+    'ALWEC': 'ALWEC.PA',
+    'NXI': 'NXI.PA',
+    'SK': 'SK.PA',
+    'ALCAT': 'ALCAT.PA',
+    'CATG': 'ALCAT.PA',  # Old ticker
+}
+
+# Read-only view with interned keys and values: symbols containing '.' are not
+# interned by the compiler, and interned lookups compare by identity first.
+TICKER_MAP: Mapping[str, str] = MappingProxyType({
+    sys.intern(k): sys.intern(v) for k, v in _TICKER_MAP_LITERAL.items()
+})
+del _TICKER_MAP_LITERAL
+
+
+# =============================================================================
+# EUROPE DATABASE (Legacy Stock List)
+# =============================================================================
+
+_EUROPE_DB_LITERAL: Tuple[Dict[str, str], ...] = (
+    {"ticker": "VCT.PA", "name": "Vicat", "sector": "Materiaux", "country": "France"},
+    {"ticker": "FGR.PA", "name": "Eiffage", "sector": "Construction", "country": "France"},
+    {"ticker": "SPIE.PA", "name": "Spie", "sector": "Services", "country": "France"},
+    {"ticker": "GTT.PA", "name": "GTT", "sector": "Energie", "country": "France"},
+    {"ticker": "TRI.PA", "name": "Trigano", "sector": "Automobile", "country": "France"},
+    {"ticker": "BEN.PA", "name": "Beneteau", "sector": "Nautisme", "country": "France"},
+    {"ticker": "ELIS.PA", "name": "Elis", "sector": "Services", "country": "France"},
+    {"ticker": "STF.PA", "name": "Stef", "sector": "Transport", "country": "France"},
+    {"ticker": "DBG.PA", "name": "Derichebourg", "sector": "Services", "country": "France"},
+    {"ticker": "AUB.PA", "name": "Aubay", "sector": "IT", "country": "France"},
+    {"ticker": "ARG.PA", "name": "Argan", "sector": "Immobilier", "country": "France"},
+    {"ticker": "CARM.PA", "name": "Carmila", "sector": "Immobilier", "country": "France"},
+    {"ticker": "ICAD.PA", "name": "Icade", "sector": "Immobilier", "country": "France"},
+    {"ticker": "ALREW.PA", "name": "Reworld Media", "sector": "Medias", "country": "France"},
+    {"ticker": "ALHOP.PA", "name": "Hopscotch", "sector": "Communication", "country": "France"},
+    {"ticker": "FNAC.PA", "name": "Fnac Darty", "sector": "Distribution", "country": "France"},
+    {"ticker": "MAU.PA", "name": "Maurel Prom", "sector": "Energie", "country": "France"},
+    {"ticker": "RUI.PA", "name": "Rubis", "sector": "Energie", "country": "France"},
+    {"ticker": "VK.PA", "name": "Vallourec", "sector": "Energie", "country": "France"},
+    {"ticker": "TE.PA", "name": "Technip Energies", "sector": "Energie", "country": "France"},
+    {"ticker": "NEX.PA", "name": "Nexans", "sector": "Industrie", "country": "France"},
+    {"ticker": "SK.PA", "name": "SEB", "sector": "Consommation", "country": "France"},
+    {"ticker": "ERA.PA", "name": "Eramet", "sector": "Materiaux", "country": "France"},
+    {"ticker": "COFA.PA", "name": "Coface", "sector": "Finance", "country": "France"},
+    {"ticker": "SW.PA", "name": "Sodexo", "sector": "Services", "country": "France"},
+    {"ticker": "RI.PA", "name": "Pernod Ricard", "sector": "Consommation", "country": "France"},
+    {"ticker": "TTE.PA", "name": "TotalEnergies", "sector": "Energie", "country": "France"},
+    {"ticker": "WBD.MI", "name": "Webuild", "sector": "Construction", "country": "Italie"},
+    {"ticker": "DAN.MI", "name": "Danieli", "sector": "Industrie", "country": "Italie"},
+    {"ticker": "MAIRE.MI", "name": "Maire Tecnimont", "sector": "Ingenierie", "country": "Italie"},
+    {"ticker": "BZU.MI", "name": "Buzzi", "sector": "Materiaux", "country": "Italie"},
+    {"ticker": "CEM.MI", "name": "Cementir", "sector": "Materiaux", "country": "Italie"},
+    {"ticker": "CAF.MC", "name": "CAF", "sector": "Transport", "country": "Espagne"},
+    {"ticker": "TRE.MC", "name": "Tecnicas Reunidas", "sector": "Ingenierie", "country": "Espagne"},
+    {"ticker": "IDR.MC", "name": "Indra Sistemas", "sector": "IT", "country": "Espagne"},
+    {"ticker": "CIE.MC", "name": "CIE Automotive", "sector": "Automobile", "country": "Espagne"},
+    {"ticker": "SCYR.MC", "name": "Sacyr", "sector": "Construction", "country": "Espagne"},
+    {"ticker": "BAMNB.AS", "name": "Royal BAM", "sector": "Construction", "country": "Pays-Bas"},
+    {"ticker": "HEIJM.AS", "name": "Heijmans", "sector": "Construction", "country": "Pays-Bas"},
+    {"ticker": "HBH.DE", "name": "Hornbach", "sector": "Distribution", "country": "Allemagne"},
+    {"ticker": "WAC.DE", "name": "Wacker Neuson", "sector": "Industrie", "country": "Allemagne"},
+    {"ticker": "NDA.DE", "name": "Aurubis", "sector": "Materiaux", "country": "Allemagne"},
+    {"ticker": "SZG.DE", "name": "Salzgitter", "sector": "Materiaux", "country": "Allemagne"},
+    {"ticker": "BEKB.BR", "name": "Bekaert", "sector": "Industrie", "country": "Belgique"},
+    {"ticker": "SIP.BR", "name": "Sipef", "sector": "Agriculture", "country": "Belgique"},
+    {"ticker": "KLR.L", "name": "Keller Group", "sector": "Construction", "country": "UK"},
+    {"ticker": "MGNS.L", "name": "Morgan Sindall", "sector": "Construction", "country": "UK"},
+    {"ticker": "IMB.L", "name": "Imperial Brands", "sector": "Consommation", "country": "UK"},
+    {"ticker": "METLEN.AT", "name": "Metlen Energy", "sector": "Energie", "country": "Grece"},
+    {"ticker": "MOH.AT", "name": "Motor Oil", "sector": "Energie", "country": "Grece"},
+    {"ticker": "BELA.AT", "name": "Jumbo", "sector": "Distribution", "country": "Grece"},
+    {"ticker": "IMPN.SW", "name": "Implenia", "sector": "Construction", "country": "Suisse"},
+    {"ticker": "EGL.LS", "name": "Mota-Engil", "sector": "Construction", "country": "Portugal"},
+    {"ticker": "POS.VI", "name": "PORR", "sector": "Construction", "country": "Autriche"},
+    {"ticker": "PNDORA.CO", "name": "Pandora", "sector": "Luxe", "country": "Danemark"},
+    {"ticker": "ALCAT.PA", "name": "Catana Group", "sector": "Nautisme", "country": "France"},
+)
+
+
+def _intern_fields(row: Dict[str, str], keys: Tuple[str, ...]) -> Dict[str, str]:
+    """Copy of row with the given string fields interned."""
+    return {k: sys.intern(v) if k in keys else v for k, v in row.items()}
+
+
+# Tickers are interned so screener comparisons against TICKER_MAP values and
+# other interned symbols short-circuit on identity; the repeated sector and
+# country labels share one string object per distinct value
+EUROPE_DB: Tuple[Dict[str, str], ...] = tuple(
+    _intern_fields(row, ('ticker', 'sector', 'country')) for row in _EUROPE_DB_LITERAL
+)
+del _EUROPE_DB_LITERAL
+
+# Ticker -> EUROPE_DB row, for O(1) lookups instead of scanning the tuple
+EUROPE_DB_BY_TICKER: Mapping[str, Dict[str, str]] = MappingProxyType(
+    {row['ticker']: row for row in EUROPE_DB}
+)
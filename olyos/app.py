@@ -10,14 +10,16 @@ _parent_dir = os.path.dirname(_current_dir)
 if _parent_dir not in sys.path:
     sys.path.insert(0, _parent_dir)
 
-import json, webbrowser, threading, math, glob, html, tempfile
+import io, json, webbrowser, threading, math, re, html, tempfile
 
 from datetime import datetime, timedelta
 
-from http.server import HTTPServer, SimpleHTTPRequestHandler
-
 import urllib.parse
 
+from dataclasses import asdict
+
+from functools import lru_cache
+
 from typing import List, Dict, Any, Optional, Tuple
 
 try:
@@ -27,6 +29,8 @@ except ImportError:
     REQUESTS_OK = False
 
 from olyos.logger import get_logger, configure as configure_logging
+from olyos import config
+from olyos.config import FILTERS, REFRESH_STATUS_TEMPLATE
 from olyos.services.api_client import ParallelAPIClient, BatchProgress
 from olyos.services.alerts import AlertsService, AlertConfig, create_alerts_service
 from olyos.services.benchmark import BenchmarkService, BENCHMARKS, create_benchmark_service
@@ -82,19 +86,7 @@ EOD_OK = EOD_API_KEY is not None and REQUESTS_OK
 
 # Global variable to track data refresh progress
 
-REFRESH_STATUS = {
-
-    'running': False,
-
-    'progress': 0,
-
-    'total': 0,
-
-    'current_ticker': '',
-
-    'message': ''
-
-}
+REFRESH_STATUS = asdict(REFRESH_STATUS_TEMPLATE)
 
 # Global alerts service (initialized lazily)
 _ALERTS_SERVICE = None
@@ -303,43 +295,11 @@ def load_universe_from_eod(exchange: str = 'PA', max_market_cap: float = 10e9, m
 
             
 
-            # Skip tickers starting with numbers (usually ADRs on LSE like 0ABC)
-
-            if code and code[0].isdigit():
-
-                continue
-
-            
-
-            # Skip very short tickers (often indices or special instruments)
-
-            if len(code) < 2:
-
-                continue
-
-            
-
-            # Skip tickers with special characters
-
-            if any(c in code for c in ['$', '#', '&', ' ', '=']):
-
-                continue
-
-            
-
-            # Skip common ADR/GDR patterns
+            # Skip tickers starting with numbers (usually ADRs on LSE like 0ABC),
 
-            name_upper = name.upper() if name else ''
+            # very short or special-character codes, ADR/GDR and ETF/fund names
 
-            if any(x in name_upper for x in ['ADR', 'GDR', 'DEPOSITARY', 'RECEIPT', 'SPONSORED']):
-
-                continue
-
-            
-
-            # Skip ETFs, funds, warrants, etc.
-
-            if any(x in name_upper for x in ['ETF', 'FUND', 'WARRANT', 'TRACKER', 'CERTIFICATE', 'REIT', 'TRUST']):
+            if FILTERS.is_excluded(code, name):
 
                 continue
 
@@ -437,154 +397,6 @@ def init_universes():
 
 
 
-MEMO_PATTERNS = {
-
-    'CARM.PA': ['Memo_Carmila*', 'Investment_Memo_Carmila*'],
-
-    'MAU.PA': ['Memo_Maurel*', 'Investment_Memo_Maurel*'],
-
-    'STF.PA': ['Memo_STEF*', 'Investment_Memo_STEF*', 'Memo_Stef*'],
-
-    'ALCAT.PA': ['Memo_Catana*', 'Investment_Memo_Catana*'],
-
-    'GTT.PA': ['Memo_GTT*', 'Investment_Memo_GTT*'],
-
-    'ARG.PA': ['Memo_Argan*', 'Investment_Memo_ARGAN*'],
-
-    'ICAD.PA': ['Memo_Icade*', 'Investment_Memo_ICADE*'],
-
-    'ALREW.PA': ['Memo_Reworld*', 'Investment_Memo_Reworld*'],
-
-    'ALHOP.PA': ['Memo_Hopscotch*', 'Investment_Memo_HOPSCOTCH*'],
-
-    'STF': ['Memo_STEF*', 'Memo_Stef*'],
-
-    'ALREW': ['Memo_Reworld*'],
-
-    'ALHOP': ['Memo_Hopscotch*', 'Investment_Memo_HOPSCOTCH*'],
-
-}
-
-
-
-EUROPE_DB = [
-
-    {"ticker": "VCT.PA", "name": "Vicat", "sector": "Materiaux", "country": "France"},
-
-    {"ticker": "FGR.PA", "name": "Eiffage", "sector": "Construction", "country": "France"},
-
-    {"ticker": "SPIE.PA", "name": "Spie", "sector": "Services", "country": "France"},
-
-    {"ticker": "GTT.PA", "name": "GTT", "sector": "Energie", "country": "France"},
-
-    {"ticker": "TRI.PA", "name": "Trigano", "sector": "Automobile", "country": "France"},
-
-    {"ticker": "BEN.PA", "name": "Beneteau", "sector": "Nautisme", "country": "France"},
-
-    {"ticker": "ELIS.PA", "name": "Elis", "sector": "Services", "country": "France"},
-
-    {"ticker": "STF.PA", "name": "Stef", "sector": "Transport", "country": "France"},
-
-    {"ticker": "DBG.PA", "name": "Derichebourg", "sector": "Services", "country": "France"},
-
-    {"ticker": "AUB.PA", "name": "Aubay", "sector": "IT", "country": "France"},
-
-    {"ticker": "ARG.PA", "name": "Argan", "sector": "Immobilier", "country": "France"},
-
-    {"ticker": "CARM.PA", "name": "Carmila", "sector": "Immobilier", "country": "France"},
-
-    {"ticker": "ICAD.PA", "name": "Icade", "sector": "Immobilier", "country": "France"},
-
-    {"ticker": "ALREW.PA", "name": "Reworld Media", "sector": "Medias", "country": "France"},
-
-    {"ticker": "ALHOP.PA", "name": "Hopscotch", "sector": "Communication", "country": "France"},
-
-    {"ticker": "FNAC.PA", "name": "Fnac Darty", "sector": "Distribution", "country": "France"},
-
-    {"ticker": "MAU.PA", "name": "Maurel Prom", "sector": "Energie", "country": "France"},
-
-    {"ticker": "RUI.PA", "name": "Rubis", "sector": "Energie", "country": "France"},
-
-    {"ticker": "VK.PA", "name": "Vallourec", "sector": "Energie", "country": "France"},
-
-    {"ticker": "TE.PA", "name": "Technip Energies", "sector": "Energie", "country": "France"},
-
-    {"ticker": "NEX.PA", "name": "Nexans", "sector": "Industrie", "country": "France"},
-
-    {"ticker": "SK.PA", "name": "SEB", "sector": "Consommation", "country": "France"},
-
-    {"ticker": "ERA.PA", "name": "Eramet", "sector": "Materiaux", "country": "France"},
-
-    {"ticker": "COFA.PA", "name": "Coface", "sector": "Finance", "country": "France"},
-
-    {"ticker": "SW.PA", "name": "Sodexo", "sector": "Services", "country": "France"},
-
-    {"ticker": "RI.PA", "name": "Pernod Ricard", "sector": "Consommation", "country": "France"},
-
-    {"ticker": "TTE.PA", "name": "TotalEnergies", "sector": "Energie", "country": "France"},
-
-    {"ticker": "WBD.MI", "name": "Webuild", "sector": "Construction", "country": "Italie"},
-
-    {"ticker": "DAN.MI", "name": "Danieli", "sector": "Industrie", "country": "Italie"},
-
-    {"ticker": "MAIRE.MI", "name": "Maire Tecnimont", "sector": "Ingenierie", "country": "Italie"},
-
-    {"ticker": "BZU.MI", "name": "Buzzi", "sector": "Materiaux", "country": "Italie"},
-
-    {"ticker": "CEM.MI", "name": "Cementir", "sector": "Materiaux", "country": "Italie"},
-
-    {"ticker": "CAF.MC", "name": "CAF", "sector": "Transport", "country": "Espagne"},
-
-    {"ticker": "TRE.MC", "name": "Tecnicas Reunidas", "sector": "Ingenierie", "country": "Espagne"},
-
-    {"ticker": "IDR.MC", "name": "Indra Sistemas", "sector": "IT", "country": "Espagne"},
-
-    {"ticker": "CIE.MC", "name": "CIE Automotive", "sector": "Automobile", "country": "Espagne"},
-
-    {"ticker": "SCYR.MC", "name": "Sacyr", "sector": "Construction", "country": "Espagne"},
-
-    {"ticker": "BAMNB.AS", "name": "Royal BAM", "sector": "Construction", "country": "Pays-Bas"},
-
-    {"ticker": "HEIJM.AS", "name": "Heijmans", "sector": "Construction", "country": "Pays-Bas"},
-
-    {"ticker": "HBH.DE", "name": "Hornbach", "sector": "Distribution", "country": "Allemagne"},
-
-    {"ticker": "WAC.DE", "name": "Wacker Neuson", "sector": "Industrie", "country": "Allemagne"},
-
-    {"ticker": "NDA.DE", "name": "Aurubis", "sector": "Materiaux", "country": "Allemagne"},
-
-    {"ticker": "SZG.DE", "name": "Salzgitter", "sector": "Materiaux", "country": "Allemagne"},
-
-    {"ticker": "BEKB.BR", "name": "Bekaert", "sector": "Industrie", "country": "Belgique"},
-
-    {"ticker": "SIP.BR", "name": "Sipef", "sector": "Agriculture", "country": "Belgique"},
-
-    {"ticker": "KLR.L", "name": "Keller Group", "sector": "Construction", "country": "UK"},
-
-    {"ticker": "MGNS.L", "name": "Morgan Sindall", "sector": "Construction", "country": "UK"},
-
-    {"ticker": "IMB.L", "name": "Imperial Brands", "sector": "Consommation", "country": "UK"},
-
-    {"ticker": "METLEN.AT", "name": "Metlen Energy", "sector": "Energie", "country": "Grece"},
-
-    {"ticker": "MOH.AT", "name": "Motor Oil", "sector": "Energie", "country": "Grece"},
-
-    {"ticker": "BELA.AT", "name": "Jumbo", "sector": "Distribution", "country": "Grece"},
-
-    {"ticker": "IMPN.SW", "name": "Implenia", "sector": "Construction", "country": "Suisse"},
-
-    {"ticker": "EGL.LS", "name": "Mota-Engil", "sector": "Construction", "country": "Portugal"},
-
-    {"ticker": "POS.VI", "name": "PORR", "sector": "Construction", "country": "Autriche"},
-
-    {"ticker": "PNDORA.CO", "name": "Pandora", "sector": "Luxe", "country": "Danemark"},
-
-    {"ticker": "ALCAT.PA", "name": "Catana Group", "sector": "Nautisme", "country": "France"},
-
-]
-
-
-
 try:
 
     import pandas as pd
@@ -799,21 +611,7 @@ def render_paragraph_html(para):
 
     # Section titles (detect by keywords or style)
 
-    section_keywords = ['SIGNAL', 'RESUME', 'SUMMARY', 'THESIS', 'RISQUES', 'RISK', 'VALORISATION', 
-
-                        'VALUATION', 'FINANCIER', 'FINANCIAL', 'CONCLUSION', 'PROFIL', 'PROFILE',
-
-                        'ACTIONNARIAT', 'SHAREHOLDERS', 'GEOGRAPHIE', 'GEOGRAPHY', 'CATALYSTS',
-
-                        'CATALYSEURS', 'POINTS FORTS', 'STRENGTHS', 'POINTS FAIBLES', 'WEAKNESSES',
-
-                        'RECOMMENDATION', 'RECOMMANDATION', 'OVERVIEW', 'APERÃ‡U', 'DESCRIPTION',
-
-                        'STRUCTURE', 'STRATEGIE', 'STRATEGY', 'HISTORIQUE', 'HISTORY', 'ACQUISITION']
-
-    
-
-    is_section_title = any(kw in text.upper() for kw in section_keywords) or 'Heading' in style_name
+    is_section_title = bool(config.MEMO_SECTION_RE.search(text)) or 'Heading' in style_name
 
     
 
@@ -935,207 +733,115 @@ def get_yf_ticker(ticker):
 
     
 
-    # Special tickers mapping (non-French or special cases)
-
-    TICKER_MAP = {
-
-        # Belgian stocks
-
-        'SIP': 'SIP.BR',           # Sipef
-
-        'BEKB': 'BEKB.BR',         # Bekaert
-
-        
-
-        # Danish stocks  
-
-        'PNDORA': 'PNDORA.CO',     # Pandora
-
-        
-
-        # German stocks
-
-        'NEAG': 'NEAG.DE',         # Nagarro
-
-        'HBH': 'HBH.DE',           # Hornbach
-
-        'WAC': 'WAC.DE',           # Wacker Neuson
-
-        'NDA': 'NDA.DE',           # Aurubis
-
-        'SZG': 'SZG.DE',           # Salzgitter
-
-        
-
-        # Swiss stocks
-
-        'ZURN': 'ZURN.SW',         # Zurich Insurance
-
-        'IMPN': 'IMPN.SW',         # Implenia
-
-        
-
-        # US stocks (no suffix needed)
-
-        'FCX': 'FCX',              # Freeport McMoran
-
-        
-
-        # Dutch stocks
-
-        'BAMNB': 'BAMNB.AS',       # Royal BAM
-
-        'HEIJM': 'HEIJM.AS',       # Heijmans
-
-        
-
-        # Italian stocks
+    # Special tickers mapping (non-French or special cases), loaded on first use
 
-        'WBD': 'WBD.MI',           # Webuild
+    TICKER_MAP = config.TICKER_MAP
 
-        'DAN': 'DAN.MI',           # Danieli
-
-        'MAIRE': 'MAIRE.MI',       # Maire Tecnimont
-
-        'BZU': 'BZU.MI',           # Buzzi
-
-        'CEM': 'CEM.MI',           # Cementir
-
-        
-
-        # Spanish stocks
-
-        'CAF': 'CAF.MC',           # CAF
-
-        'TRE': 'TRE.MC',           # Tecnicas Reunidas
-
-        'IDR': 'IDR.MC',           # Indra
-
-        'CIE': 'CIE.MC',           # CIE Automotive
-
-        'SCYR': 'SCYR.MC',         # Sacyr
-
-        
-
-        # Greek stocks
-
-        'METLEN': 'METLEN.AT',     # Metlen
-
-        'MOH': 'MOH.AT',           # Motor Oil
-
-        'BELA': 'BELA.AT',         # Jumbo
-
-        
+    
 
-        # Portuguese stocks
+    ticker_upper = ticker.upper()
 
-        'EGL': 'EGL.LS',           # Mota-Engil
+    if ticker_upper in TICKER_MAP:
 
-        
+        return TICKER_MAP[ticker_upper]
 
-        # Austrian stocks
+    
 
-        'POS': 'POS.VI',           # PORR
+    # Default: assume French stock
 
-        
+    return ticker + '.PA'
 
-        # UK stocks
 
-        'KLR': 'KLR.L',            # Keller
 
-        'MGNS': 'MGNS.L',          # Morgan Sindall
+@lru_cache(maxsize=256)
 
-        'IMB': 'IMB.L',            # Imperial Brands
+def _generic_memo_patterns(ticker_base):
 
-        'RIO': 'RIO.L',            # Rio Tinto
+    """Compiled fallback memo globs for a ticker base, in priority order"""
 
-        'BA': 'BA.L',              # BAE Systems
+    return config.compile_memo_patterns(
 
-        
+        (f'Memo_{ticker_base}*', f'Investment_Memo_{ticker_base}*', f'Memo_*{ticker_base}*')
 
-        # French stocks (explicit mapping for safety)
+    )
 
-        'MC': 'MC.PA',             # LVMH
 
-        'VIE': 'VIE.PA',           # Veolia
 
-        'GFC': 'GFC.PA',           # Gecina
+def find_memo(ticker):
 
-        'ALVAP': 'ALVAP.PA',       # Valneva
+    """Find memo file for a given ticker"""
 
-        'ALWEC': 'ALWEC.PA',       # We.Connect
+    # One directory listing, matched against precompiled per-ticker patterns
 
-        'NXI': 'NXI.PA',           # Nexity
+    memo_dir = CONFIG['memo_dir']
 
-        'SK': 'SK.PA',             # SEB
+    try:
 
-        'ALCAT': 'ALCAT.PA',       # Catana Group
+        names = [entry.name for entry in os.scandir(memo_dir)]
 
-        'CATG': 'ALCAT.PA',        # Catana Group (old ticker)
+    except OSError:
 
-    }
+        return None
 
-    
 
-    ticker_upper = ticker.upper()
 
-    if ticker_upper in TICKER_MAP:
+    # Try with and without .PA suffix
 
-        return TICKER_MAP[ticker_upper]
+    tickers_to_try = [ticker, ticker.replace('.PA', ''), ticker.split('.')[0]]
 
     
 
-    # Default: assume French stock
+    for t in tickers_to_try:
 
-    return ticker + '.PA'
+        pattern_re = config.MEMO_PATTERNS_RE.get(t)
 
+        if pattern_re is None:
 
+            continue
 
-def find_memo(ticker):
+        name = config.match_memo_name(pattern_re, names)
 
-    """Find memo file for a given ticker"""
+        if name is not None:
 
-    # Try with and without .PA suffix
-
-    tickers_to_try = [ticker, ticker.replace('.PA', ''), ticker.split('.')[0]]
+            return os.path.join(memo_dir, name)
 
     
 
-    for t in tickers_to_try:
+    # Generic patterns
 
-        patterns = MEMO_PATTERNS.get(t, [])
+    name = config.match_memo_name(_generic_memo_patterns(ticker.split('.')[0]), names)
 
-        for pattern in patterns:
+    if name is not None:
 
-            matches = glob.glob(os.path.join(CONFIG['memo_dir'], pattern))
+        return os.path.join(memo_dir, name)
 
-            if matches:
+    return None
 
-                return matches[0]
 
-    
 
-    # Generic patterns
+@lru_cache(maxsize=1)
+def _load_watchlist_cached(path: str, mtime_ns: int) -> List[str]:
 
-    ticker_base = ticker.split('.')[0]
+    return load_json(path, [])
 
-    generic_patterns = [f'Memo_{ticker_base}*', f'Investment_Memo_{ticker_base}*', f'Memo_*{ticker_base}*']
 
-    for pattern in generic_patterns:
 
-        matches = glob.glob(os.path.join(CONFIG['memo_dir'], pattern))
+def load_watchlist() -> List[str]:
 
-        if matches:
+    """Watchlist from disk, re-parsed only when the file's mtime changes"""
 
-            return matches[0]
+    path = CONFIG['watchlist_file']
 
-    return None
+    try:
 
+        mtime_ns = os.stat(path).st_mtime_ns
 
+    except OSError:
+        return []
 
-def load_watchlist() -> List[str]:
+    # Copy so callers can append/filter without touching the cached list
 
-    return load_json(CONFIG['watchlist_file'], [])
+    return list(_load_watchlist_cached(path, mtime_ns))
 
 
 
@@ -1473,59 +1179,7 @@ def run_ai_optimization(scope='france', optimization_goal='balanced'):
 
     
 
-    param_grid = [
-
-        # PE variations
-
-        {'pe_max': 8, 'roe_min': 10, 'pe_sell': 15, 'debt_equity_max': 100, 'max_positions': 20},
-
-        {'pe_max': 10, 'roe_min': 10, 'pe_sell': 17, 'debt_equity_max': 100, 'max_positions': 20},
-
-        {'pe_max': 12, 'roe_min': 10, 'pe_sell': 20, 'debt_equity_max': 100, 'max_positions': 20},
-
-        {'pe_max': 15, 'roe_min': 10, 'pe_sell': 25, 'debt_equity_max': 100, 'max_positions': 20},
-
-        
-
-        # ROE variations
-
-        {'pe_max': 12, 'roe_min': 8, 'pe_sell': 17, 'debt_equity_max': 100, 'max_positions': 20},
-
-        {'pe_max': 12, 'roe_min': 12, 'pe_sell': 17, 'debt_equity_max': 100, 'max_positions': 20},
-
-        {'pe_max': 12, 'roe_min': 15, 'pe_sell': 17, 'debt_equity_max': 100, 'max_positions': 20},
-
-        
-
-        # Debt variations
-
-        {'pe_max': 12, 'roe_min': 10, 'pe_sell': 17, 'debt_equity_max': 50, 'max_positions': 20},
-
-        {'pe_max': 12, 'roe_min': 10, 'pe_sell': 17, 'debt_equity_max': 150, 'max_positions': 20},
-
-        
-
-        # Position count variations
-
-        {'pe_max': 12, 'roe_min': 10, 'pe_sell': 17, 'debt_equity_max': 100, 'max_positions': 10},
-
-        {'pe_max': 12, 'roe_min': 10, 'pe_sell': 17, 'debt_equity_max': 100, 'max_positions': 15},
-
-        {'pe_max': 12, 'roe_min': 10, 'pe_sell': 17, 'debt_equity_max': 100, 'max_positions': 30},
-
-        
-
-        # Combined aggressive value
-
-        {'pe_max': 8, 'roe_min': 12, 'pe_sell': 12, 'debt_equity_max': 50, 'max_positions': 15},
-
-        
-
-        # Combined moderate
-
-        {'pe_max': 15, 'roe_min': 8, 'pe_sell': 25, 'debt_equity_max': 150, 'max_positions': 25},
-
-    ]
+    param_grid = config.CURATED_PARAM_GRID
 
     
 
@@ -1535,7 +1189,7 @@ def run_ai_optimization(scope='france', optimization_goal='balanced'):
 
     for i, params in enumerate(param_grid):
 
-        log_backtest.info(f"[{i+1}/{len(param_grid)}] Testing PE<={params['pe_max']}, ROE>={params['roe_min']}%, {params['max_positions']} positions...")
+        log_backtest.info(f"[{i+1}/{len(param_grid)}] Testing PE<={params.pe_max}, ROE>={params.roe_min}%, P/CF<={params.pcf_max}, {params.max_positions} positions...")
 
         
 
@@ -1549,21 +1203,23 @@ def run_ai_optimization(scope='france', optimization_goal='balanced'):
 
             'universe': [],
 
-            'pe_max': params['pe_max'],
+            'pe_max': params.pe_max,
 
-            'roe_min': params['roe_min'],
+            'roe_min': params.roe_min,
 
-            'pe_sell': params['pe_sell'],
+            'pe_sell': params.pe_sell,
 
             'roe_min_hold': 8,
 
-            'debt_equity_max': params['debt_equity_max'],
+            'debt_equity_max': params.debt_equity_max,
+
+            'pcf_max': params.pcf_max,
 
             'rebalance_freq': 'quarterly',
 
             'initial_capital': 100000,
 
-            'max_positions': params['max_positions'],
+            'max_positions': params.max_positions,
 
             'benchmark': '^FCHI'
 
@@ -1581,7 +1237,7 @@ def run_ai_optimization(scope='france', optimization_goal='balanced'):
 
             grid_results.append({
 
-                'params': params,
+                'params': params._asdict(),
 
                 'metrics': {
 
@@ -1647,7 +1303,7 @@ def run_ai_optimization(scope='france', optimization_goal='balanced'):
 
             m = r['metrics']
 
-            results_summary += f"""Test {i+1}: PE<={p['pe_max']}, ROE>={p['roe_min']}%, Debt<={p['debt_equity_max']}%, {p['max_positions']} positions, Sell@PE>{p['pe_sell']}
+            results_summary += f"""Test {i+1}: PE<={p['pe_max']}, ROE>={p['roe_min']}%, Debt<={p['debt_equity_max']}%, P/CF<={p['pcf_max']}, {p['max_positions']} positions, Sell@PE>{p['pe_sell']}
 
   â†’ Return: {m['total_return']:.1f}%, CAGR: {m['cagr']:.2f}%, Sharpe: {m['sharpe']:.2f}, MaxDD: -{m['max_drawdown']:.1f}%, WinRate: {m['win_rate']:.0f}%, Trades: {m['total_trades']}, Alpha: {m['alpha']:.1f}%
 
@@ -1837,6 +1493,8 @@ Reponds en JSON avec cette structure exacte:
 
                 'debt_equity_max': results['best_params'].get('debt_equity_max', 100),
 
+                'pcf_max': results['best_params'].get('pcf_max', 10),
+
                 'rebalance_freq': 'quarterly',
 
                 'initial_capital': 100000,
@@ -4734,10 +4392,22 @@ def load_portfolio() -> Tuple[Optional[Any], Optional[str]]:
 
     try:
 
+        st = os.stat(CONFIG['portfolio_file'])
+
+        stamp = [st.st_size, st.st_mtime_ns]
+
+        df = _read_portfolio_sidecar(stamp)
+
+        if df is not None:
+
+            return df, None
+
         df = pd.read_excel(CONFIG['portfolio_file'])
 
         df.columns = [c.lower().strip().replace(' ', '_') for c in df.columns]
 
+        _write_portfolio_sidecar(stamp, df)
+
         return df, None
 
     except Exception as e:
@@ -4745,6 +4415,65 @@ def load_portfolio() -> Tuple[Optional[Any], Optional[str]]:
         return None, str(e)
 
 
+
+def _portfolio_sidecar_path() -> str:
+
+    return os.path.splitext(CONFIG['portfolio_file'])[0] + '.cache.json'
+
+
+
+def _read_portfolio_sidecar(stamp: List[int]) -> Optional[Any]:
+
+    """JSON copy of the parsed portfolio, if it matches the xlsx size and mtime"""
+
+    try:
+
+        with open(_portfolio_sidecar_path(), encoding='utf-8') as f:
+
+            payload = json.load(f)
+
+        if payload.get('stamp') != stamp:
+
+            return None
+
+        df = pd.read_json(io.StringIO(payload['frame']), orient='split',
+
+                          dtype=False, convert_dates=False)
+
+        return df.astype(payload['dtypes'])
+
+    except Exception:
+
+        return None
+
+
+
+def _write_portfolio_sidecar(stamp: List[int], df: Any) -> None:
+
+    """Store the parsed portfolio next to the xlsx so reloads skip openpyxl"""
+
+    try:
+
+        payload = {
+
+            'stamp': stamp,
+
+            'dtypes': df.dtypes.astype(str).to_dict(),
+
+            'frame': df.to_json(orient='split', date_format='iso', date_unit='ns'),
+
+        }
+
+        with open(_portfolio_sidecar_path(), 'w', encoding='utf-8') as f:
+
+            json.dump(payload, f)
+
+    except Exception as e:
+
+        log_portfolio.warning(f"Could not write portfolio cache: {e}")
+
+
+
 def build_advisor_portfolio_payload(df: Any, cash: float = 0.0, currency: str = 'EUR') -> Dict[str, Any]:
 
     """Convert current portfolio dataframe to advisor JSON payload."""
@@ -5492,22 +5221,6 @@ def run_screener(force=False, scope='france', use_eod=True, mode='standard'):
 
     
 
-    # AI Optimal criteria (from optimization results)
-
-    AI_OPTIMAL_CRITERIA = {
-
-        'pe_max': 8,
-
-        'roe_min': 12,  # percentage
-
-        'debt_equity_max': 50,  # percentage
-
-        'max_positions': 18
-
-    }
-
-    
-
     # Check cache first (unless force refresh)
 
     cache_key = f"{scope}_{mode}"
@@ -5524,7 +5237,7 @@ def run_screener(force=False, scope='france', use_eod=True, mode='standard'):
 
             if mode == 'ai_optimal':
 
-                return filter_ai_optimal(c, AI_OPTIMAL_CRITERIA)
+                return filter_ai_optimal(c, config.AI_OPTIMAL_CRITERIA)
 
             return c
 
@@ -5570,7 +5283,7 @@ def run_screener(force=False, scope='france', use_eod=True, mode='standard'):
 
     if mode == 'ai_optimal':
 
-        results = filter_ai_optimal(results, AI_OPTIMAL_CRITERIA)
+        results = filter_ai_optimal(results, config.AI_OPTIMAL_CRITERIA)
 
     
 
@@ -5582,7 +5295,7 @@ def run_screener(force=False, scope='france', use_eod=True, mode='standard'):
 
 def filter_ai_optimal(results, criteria):
 
-    """Filter results according to AI optimal criteria"""
+    """Filter results according to AI optimal criteria (a config.AICriteria)"""
 
     filtered = []
 
@@ -5624,11 +5337,11 @@ def filter_ai_optimal(results, criteria):
 
         # Apply strict AI optimal criteria
 
-        if pe and pe <= criteria['pe_max']:
+        if pe and pe <= criteria.pe_max:
 
-            if roe_pct >= criteria['roe_min']:
+            if roe_pct >= criteria.roe_min:
 
-                if debt_pct <= criteria['debt_equity_max']:
+                if debt_pct <= criteria.debt_equity_max:
 
                     # Mark as AI OPTIMAL
 
@@ -5642,7 +5355,7 @@ def filter_ai_optimal(results, criteria):
 
     filtered.sort(key=lambda x: x.get('score', 0), reverse=True)
 
-    top_n = filtered[:criteria['max_positions']]
+    top_n = filtered[:criteria.max_positions]
 
     
 
@@ -6015,7 +5728,7 @@ def run_screener_yahoo():
 
     results = []
 
-    for s in EUROPE_DB:
+    for s in config.EUROPE_DB:
 
         r = s.copy()
 
@@ -6489,13 +6202,11 @@ def get_security_data(ticker: str) -> Dict[str, Any]:
 
     # Find in DB (try with and without .PA)
 
-    for s in EUROPE_DB:
+    s = config.EUROPE_DB_BY_TICKER.get(ticker) or config.EUROPE_DB_BY_TICKER.get(ticker + '.PA')
 
-        if s['ticker'] == ticker or s['ticker'] == ticker + '.PA' or s['ticker'].replace('.PA', '') == ticker:
+    if s:
 
-            data.update({k: s[k] for k in ['name', 'sector', 'country']})
-
-            break
+        data.update({k: s[k] for k in ['name', 'sector', 'country']})
 
     
 
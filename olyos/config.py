@@ -7,9 +7,29 @@ Centralized configuration for Portfolio Terminal v4.0
 All hardcoded values extracted from app.py for easy modification.
 """
 
+import fnmatch
+import os
+import re
+import time
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
-from datetime import datetime
+from types import MappingProxyType
+from typing import Dict, List, Mapping, NamedTuple, Optional, Pattern, Tuple
+from datetime import datetime, time as dt_time, timedelta
+
+__all__ = [
+    'APP_NAME', 'APP_TITLE', 'APP_VERSION', 'APP_SUBTITLE',
+    'FileConfig', 'FILES', 'CONFIG', 'ServerConfig', 'SERVER', 'CacheConfig', 'CACHE',
+    'APIConfig', 'API',
+    'HiggonsConfig', 'HIGGONS', 'AICriteria', 'AI_OPTIMAL_CRITERIA',
+    'BacktestConfig', 'BACKTEST', 'BacktestParams', 'CURATED_PARAM_GRID', 'BACKTEST_PARAM_GRID',
+    'ExchangeConfig', 'EXCHANGES',
+    'TICKER_MAP', 'EUROPE_DB', 'EUROPE_DB_BY_TICKER',
+    'MEMO_PATTERNS', 'MEMO_PATTERNS_RE', 'compile_memo_patterns', 'match_memo_name',
+    'ColorScheme', 'COLORS', 'UILabels', 'LABELS',
+    'SIGNAL_KEYWORDS', 'MEMO_SECTION_KEYWORDS', 'MEMO_SECTION_RE',
+    'FilterKeywords', 'FILTERS', 'RefreshStatus', 'REFRESH_STATUS_TEMPLATE',
+    'get_current_date', 'get_default_end_date', 'get_default_start_date',
+]
 
 
 # =============================================================================
@@ -26,7 +46,7 @@ APP_SUBTITLE: str = "Bloomberg Style with Backtesting"
 # FILE PATHS & DIRECTORIES
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class FileConfig:
     """File and directory paths configuration."""
     portfolio_file: str = 'portfolio.xlsx'
@@ -58,7 +78,7 @@ CONFIG: Dict[str, any] = {
 # SERVER CONFIGURATION
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ServerConfig:
     """HTTP server configuration."""
     port: int = 8080
@@ -72,7 +92,7 @@ SERVER = ServerConfig()
 # CACHE CONFIGURATION
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CacheConfig:
     """Cache duration settings in days."""
     cache_dir: str = 'backtest_cache'
@@ -89,7 +109,7 @@ CACHE = CacheConfig()
 # API CONFIGURATION
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class APIConfig:
     """API endpoints and settings."""
     # EOD Historical Data API
@@ -114,7 +134,7 @@ API = APIConfig()
 # HIGGONS SCORING THRESHOLDS
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class HiggonsConfig:
     """Higgons-style value investing criteria and scoring thresholds."""
 
@@ -193,20 +213,29 @@ class HiggonsConfig:
 
 HIGGONS = HiggonsConfig()
 
-# AI Optimal Criteria dict for backward compatibility
-AI_OPTIMAL_CRITERIA: Dict[str, any] = {
-    'pe_max': HIGGONS.ai_pe_max,
-    'roe_min': HIGGONS.ai_roe_min,
-    'debt_equity_max': HIGGONS.ai_debt_equity_max,
-    'max_positions': HIGGONS.ai_max_positions
-}
+
+class AICriteria(NamedTuple):
+    """Screening criteria found by AI optimization backtesting."""
+    pe_max: float
+    roe_min: float
+    debt_equity_max: float
+    max_positions: int
+
+
+# AI Optimal Criteria (use ._asdict() where a dict is needed)
+AI_OPTIMAL_CRITERIA = AICriteria(
+    pe_max=HIGGONS.ai_pe_max,
+    roe_min=HIGGONS.ai_roe_min,
+    debt_equity_max=HIGGONS.ai_debt_equity_max,
+    max_positions=HIGGONS.ai_max_positions,
+)
 
 
 # =============================================================================
 # BACKTEST CONFIGURATION
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class BacktestConfig:
     """Backtesting default parameters."""
     # Default date range
@@ -235,8 +264,19 @@ class BacktestConfig:
 
 BACKTEST = BacktestConfig()
 
-# Default backtest parameter grid
-BACKTEST_PARAM_GRID: List[Dict[str, any]] = [
+
+class BacktestParams(NamedTuple):
+    """One parameter set of the backtest optimization grid."""
+    pe_max: float
+    roe_min: float
+    pe_sell: float
+    debt_equity_max: float
+    pcf_max: float
+    max_positions: int
+
+
+# Hand-picked backtest parameter sets (use ._asdict() for serialization)
+CURATED_PARAM_GRID: Tuple[BacktestParams, ...] = tuple(BacktestParams(**params) for params in [
     # PE variations
     {'pe_max': 8, 'roe_min': 10, 'pe_sell': 15, 'debt_equity_max': 100, 'pcf_max': 10, 'max_positions': 20},
     {'pe_max': 10, 'roe_min': 10, 'pe_sell': 17, 'debt_equity_max': 100, 'pcf_max': 10, 'max_positions': 20},
@@ -261,14 +301,17 @@ BACKTEST_PARAM_GRID: List[Dict[str, any]] = [
     {'pe_max': 8, 'roe_min': 12, 'pe_sell': 12, 'debt_equity_max': 50, 'pcf_max': 8, 'max_positions': 15},
     # Combined moderate
     {'pe_max': 15, 'roe_min': 8, 'pe_sell': 25, 'debt_equity_max': 150, 'pcf_max': 15, 'max_positions': 25},
-]
+])
+
+# Default backtest parameter grid (kept for backward compatibility)
+BACKTEST_PARAM_GRID = CURATED_PARAM_GRID
 
 
 # =============================================================================
 # EXCHANGE CONFIGURATION
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ExchangeConfig:
     """Stock exchange settings."""
     # Default exchange for French stocks
@@ -295,171 +338,75 @@ EXCHANGES = ExchangeConfig()
 
 
 # =============================================================================
-# TICKER MAPPING
-# =============================================================================
-
-# Mapping of ticker symbols to Yahoo Finance format
-TICKER_MAP: Dict[str, str] = {
-    # Belgian stocks
-    'SIP': 'SIP.BR',
-    'BEKB': 'BEKB.BR',
-
-    # Danish stocks
-    'PNDORA': 'PNDORA.CO',
-
-    # German stocks
-    'NEAG': 'NEAG.DE',
-    'HBH': 'HBH.DE',
-    'WAC': 'WAC.DE',
-    'NDA': 'NDA.DE',
-    'SZG': 'SZG.DE',
-
-    # Swiss stocks
-    'ZURN': 'ZURN.SW',
-    'IMPN': 'IMPN.SW',
-
-    # US stocks
-    'FCX': 'FCX',
-
-    # Dutch stocks
-    'BAMNB': 'BAMNB.AS',
-    'HEIJM': 'HEIJM.AS',
-
-    # Italian stocks
-    'WBD': 'WBD.MI',
-    'DAN': 'DAN.MI',
-    'MAIRE': 'MAIRE.MI',
-    'BZU': 'BZU.MI',
-    'CEM': 'CEM.MI',
-
-    # Spanish stocks
-    'CAF': 'CAF.MC',
-    'TRE': 'TRE.MC',
-    'IDR': 'IDR.MC',
-    'CIE': 'CIE.MC',
-    'SCYR': 'SCYR.MC',
-
-    # Greek stocks
-    'METLEN': 'METLEN.AT',
-    'MOH': 'MOH.AT',
-    'BELA': 'BELA.AT',
-
-    # Portuguese stocks
-    'EGL': 'EGL.LS',
-
-    # Austrian stocks
-    'POS': 'POS.VI',
-
-    # UK stocks
-    'KLR': 'KLR.L',
-    'MGNS': 'MGNS.L',
-    'IMB': 'IMB.L',
-    'RIO': 'RIO.L',
-    'BA': 'BA.L',
-
-    # French stocks (explicit mapping)
-    'MC': 'MC.PA',
-    'VIE': 'VIE.PA',
-    'GFC': 'GFC.PA',
-    'ALVAP': 'ALVAP.PA',
-    'ALWEC': 'ALWEC.PA',
-    'NXI': 'NXI.PA',
-    'SK': 'SK.PA',
-    'ALCAT': 'ALCAT.PA',
-    'CATG': 'ALCAT.PA',  # Old ticker
-}
+# TICKER MAPPING / EUROPE DATABASE (Legacy Stock List)
+# =============================================================================
+
+# TICKER_MAP, EUROPE_DB and EUROPE_DB_BY_TICKER are defined in
+# olyos/_static_data.py and imported on first access (see __getattr__)
+_LAZY_STATIC_DATA = frozenset({'TICKER_MAP', 'EUROPE_DB', 'EUROPE_DB_BY_TICKER'})
 
 
 # =============================================================================
 # MEMO FILE PATTERNS
 # =============================================================================
 
-# Patterns for finding investment memo files by ticker
-MEMO_PATTERNS: Dict[str, List[str]] = {
-    'CARM.PA': ['Memo_Carmila*', 'Investment_Memo_Carmila*'],
-    'MAU.PA': ['Memo_Maurel*', 'Investment_Memo_Maurel*'],
-    'STF.PA': ['Memo_STEF*', 'Investment_Memo_STEF*', 'Memo_Stef*'],
-    'ALCAT.PA': ['Memo_Catana*', 'Investment_Memo_Catana*'],
-    'GTT.PA': ['Memo_GTT*', 'Investment_Memo_GTT*'],
-    'ARG.PA': ['Memo_Argan*', 'Investment_Memo_ARGAN*'],
-    'ICAD.PA': ['Memo_Icade*', 'Investment_Memo_ICADE*'],
-    'ALREW.PA': ['Memo_Reworld*', 'Investment_Memo_Reworld*'],
-    'ALHOP.PA': ['Memo_Hopscotch*', 'Investment_Memo_HOPSCOTCH*'],
-    'STF': ['Memo_STEF*', 'Memo_Stef*'],
-    'ALREW': ['Memo_Reworld*'],
-    'ALHOP': ['Memo_Hopscotch*', 'Investment_Memo_HOPSCOTCH*'],
-}
-
-
-# =============================================================================
-# EUROPE DATABASE (Legacy Stock List)
-# =============================================================================
-
-EUROPE_DB: List[Dict[str, str]] = [
-    {"ticker": "VCT.PA", "name": "Vicat", "sector": "Materiaux", "country": "France"},
-    {"ticker": "FGR.PA", "name": "Eiffage", "sector": "Construction", "country": "France"},
-    {"ticker": "SPIE.PA", "name": "Spie", "sector": "Services", "country": "France"},
-    {"ticker": "GTT.PA", "name": "GTT", "sector": "Energie", "country": "France"},
-    {"ticker": "TRI.PA", "name": "Trigano", "sector": "Automobile", "country": "France"},
-    {"ticker": "BEN.PA", "name": "Beneteau", "sector": "Nautisme", "country": "France"},
-    {"ticker": "ELIS.PA", "name": "Elis", "sector": "Services", "country": "France"},
-    {"ticker": "STF.PA", "name": "Stef", "sector": "Transport", "country": "France"},
-    {"ticker": "DBG.PA", "name": "Derichebourg", "sector": "Services", "country": "France"},
-    {"ticker": "AUB.PA", "name": "Aubay", "sector": "IT", "country": "France"},
-    {"ticker": "ARG.PA", "name": "Argan", "sector": "Immobilier", "country": "France"},
-    {"ticker": "CARM.PA", "name": "Carmila", "sector": "Immobilier", "country": "France"},
-    {"ticker": "ICAD.PA", "name": "Icade", "sector": "Immobilier", "country": "France"},
-    {"ticker": "ALREW.PA", "name": "Reworld Media", "sector": "Medias", "country": "France"},
-    {"ticker": "ALHOP.PA", "name": "Hopscotch", "sector": "Communication", "country": "France"},
-    {"ticker": "FNAC.PA", "name": "Fnac Darty", "sector": "Distribution", "country": "France"},
-    {"ticker": "MAU.PA", "name": "Maurel Prom", "sector": "Energie", "country": "France"},
-    {"ticker": "RUI.PA", "name": "Rubis", "sector": "Energie", "country": "France"},
-    {"ticker": "VK.PA", "name": "Vallourec", "sector": "Energie", "country": "France"},
-    {"ticker": "TE.PA", "name": "Technip Energies", "sector": "Energie", "country": "France"},
-    {"ticker": "NEX.PA", "name": "Nexans", "sector": "Industrie", "country": "France"},
-    {"ticker": "SK.PA", "name": "SEB", "sector": "Consommation", "country": "France"},
-    {"ticker": "ERA.PA", "name": "Eramet", "sector": "Materiaux", "country": "France"},
-    {"ticker": "COFA.PA", "name": "Coface", "sector": "Finance", "country": "France"},
-    {"ticker": "SW.PA", "name": "Sodexo", "sector": "Services", "country": "France"},
-    {"ticker": "RI.PA", "name": "Pernod Ricard", "sector": "Consommation", "country": "France"},
-    {"ticker": "TTE.PA", "name": "TotalEnergies", "sector": "Energie", "country": "France"},
-    {"ticker": "WBD.MI", "name": "Webuild", "sector": "Construction", "country": "Italie"},
-    {"ticker": "DAN.MI", "name": "Danieli", "sector": "Industrie", "country": "Italie"},
-    {"ticker": "MAIRE.MI", "name": "Maire Tecnimont", "sector": "Ingenierie", "country": "Italie"},
-    {"ticker": "BZU.MI", "name": "Buzzi", "sector": "Materiaux", "country": "Italie"},
-    {"ticker": "CEM.MI", "name": "Cementir", "sector": "Materiaux", "country": "Italie"},
-    {"ticker": "CAF.MC", "name": "CAF", "sector": "Transport", "country": "Espagne"},
-    {"ticker": "TRE.MC", "name": "Tecnicas Reunidas", "sector": "Ingenierie", "country": "Espagne"},
-    {"ticker": "IDR.MC", "name": "Indra Sistemas", "sector": "IT", "country": "Espagne"},
-    {"ticker": "CIE.MC", "name": "CIE Automotive", "sector": "Automobile", "country": "Espagne"},
-    {"ticker": "SCYR.MC", "name": "Sacyr", "sector": "Construction", "country": "Espagne"},
-    {"ticker": "BAMNB.AS", "name": "Royal BAM", "sector": "Construction", "country": "Pays-Bas"},
-    {"ticker": "HEIJM.AS", "name": "Heijmans", "sector": "Construction", "country": "Pays-Bas"},
-    {"ticker": "HBH.DE", "name": "Hornbach", "sector": "Distribution", "country": "Allemagne"},
-    {"ticker": "WAC.DE", "name": "Wacker Neuson", "sector": "Industrie", "country": "Allemagne"},
-    {"ticker": "NDA.DE", "name": "Aurubis", "sector": "Materiaux", "country": "Allemagne"},
-    {"ticker": "SZG.DE", "name": "Salzgitter", "sector": "Materiaux", "country": "Allemagne"},
-    {"ticker": "BEKB.BR", "name": "Bekaert", "sector": "Industrie", "country": "Belgique"},
-    {"ticker": "SIP.BR", "name": "Sipef", "sector": "Agriculture", "country": "Belgique"},
-    {"ticker": "KLR.L", "name": "Keller Group", "sector": "Construction", "country": "UK"},
-    {"ticker": "MGNS.L", "name": "Morgan Sindall", "sector": "Construction", "country": "UK"},
-    {"ticker": "IMB.L", "name": "Imperial Brands", "sector": "Consommation", "country": "UK"},
-    {"ticker": "METLEN.AT", "name": "Metlen Energy", "sector": "Energie", "country": "Grece"},
-    {"ticker": "MOH.AT", "name": "Motor Oil", "sector": "Energie", "country": "Grece"},
-    {"ticker": "BELA.AT", "name": "Jumbo", "sector": "Distribution", "country": "Grece"},
-    {"ticker": "IMPN.SW", "name": "Implenia", "sector": "Construction", "country": "Suisse"},
-    {"ticker": "EGL.LS", "name": "Mota-Engil", "sector": "Construction", "country": "Portugal"},
-    {"ticker": "POS.VI", "name": "PORR", "sector": "Construction", "country": "Autriche"},
-    {"ticker": "PNDORA.CO", "name": "Pandora", "sector": "Luxe", "country": "Danemark"},
-    {"ticker": "ALCAT.PA", "name": "Catana Group", "sector": "Nautisme", "country": "France"},
-]
+# Patterns for finding investment memo files by ticker (read-only)
+MEMO_PATTERNS: Mapping[str, Tuple[str, ...]] = MappingProxyType({
+    'CARM.PA': ('Memo_Carmila*', 'Investment_Memo_Carmila*'),
+    'MAU.PA': ('Memo_Maurel*', 'Investment_Memo_Maurel*'),
+    'STF.PA': ('Memo_STEF*', 'Investment_Memo_STEF*', 'Memo_Stef*'),
+    'ALCAT.PA': ('Memo_Catana*', 'Investment_Memo_Catana*'),
+    'GTT.PA': ('Memo_GTT*', 'Investment_Memo_GTT*'),
+    'ARG.PA': ('Memo_Argan*', 'Investment_Memo_ARGAN*'),
+    'ICAD.PA': ('Memo_Icade*', 'Investment_Memo_ICADE*'),
+    'ALREW.PA': ('Memo_Reworld*', 'Investment_Memo_Reworld*'),
+    'ALHOP.PA': ('Memo_Hopscotch*', 'Investment_Memo_HOPSCOTCH*'),
+    'STF': ('Memo_STEF*', 'Memo_Stef*'),
+    'ALREW': ('Memo_Reworld*',),
+    'ALHOP': ('Memo_Hopscotch*', 'Investment_Memo_HOPSCOTCH*'),
+})
+
+# glob matches case-insensitively where the filesystem does (Windows)
+_MEMO_RE_FLAGS = re.IGNORECASE if os.path.normcase('A') != 'A' else 0
+
+
+def compile_memo_patterns(patterns: Tuple[str, ...]) -> Pattern:
+    """Compile memo globs into one regex with a capture group per glob, in
+    priority order, so match_memo_name can rank a single directory pass."""
+    return re.compile(
+        '|'.join(f'({fnmatch.translate(p)})' for p in patterns), _MEMO_RE_FLAGS
+    )
+
+
+def match_memo_name(pattern_re: Pattern, names) -> Optional[str]:
+    """First name matching the highest-priority glob of pattern_re, i.e. what
+    trying each glob in turn against the listing would return."""
+    best_name, best_rank = None, None
+    for name in names:
+        m = pattern_re.match(name)
+        if m is None:
+            continue
+        if m.lastindex == 1:
+            return name
+        if best_rank is None or m.lastindex < best_rank:
+            best_name, best_rank = name, m.lastindex
+    return best_name
+
+
+def _build_memo_patterns_re() -> Mapping[str, Pattern]:
+    """MEMO_PATTERNS_RE: one compiled regex per ticker matching any of its
+    memo globs, so a memo lookup is a single pass over the directory listing."""
+    return MappingProxyType({
+        ticker: compile_memo_patterns(patterns)
+        for ticker, patterns in MEMO_PATTERNS.items()
+    })
 
 
 # =============================================================================
 # UI COLOR SCHEME (Bloomberg-style)
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ColorScheme:
     """Color codes used in the Bloomberg-style UI."""
     # Primary colors
@@ -510,7 +457,7 @@ COLORS = ColorScheme()
 # UI TEXT & LABELS
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class UILabels:
     """UI text strings and labels."""
     # Navigation tabs
@@ -602,8 +549,8 @@ LABELS = UILabels()
 # SIGNAL KEYWORDS
 # =============================================================================
 
-# Signal keyword mappings (used in memo parsing)
-SIGNAL_KEYWORDS: Dict[str, str] = {
+# Signal keyword mappings (used in memo parsing); keys are uppercase
+SIGNAL_KEYWORDS: Mapping[str, str] = MappingProxyType({
     'ACHAT': 'buy',
     'BUY': 'buy',
     'STRONG BUY': 'buy',
@@ -615,7 +562,7 @@ SIGNAL_KEYWORDS: Dict[str, str] = {
     'HOLD': 'hold',
     'NEUTRE': 'hold',
     'NEUTRAL': 'hold',
-}
+})
 
 
 # =============================================================================
@@ -623,7 +570,7 @@ SIGNAL_KEYWORDS: Dict[str, str] = {
 # =============================================================================
 
 # Keywords for detecting section headers in investment memos
-MEMO_SECTION_KEYWORDS: List[str] = [
+MEMO_SECTION_KEYWORDS: Tuple[str, ...] = (
     'SIGNAL', 'RESUME', 'SUMMARY', 'THESIS', 'RISQUES', 'RISK',
     'VALORISATION', 'VALUATION', 'FINANCIER', 'FINANCIAL',
     'CONCLUSION', 'PROFIL', 'PROFILE', 'ACTIONNARIAT', 'SHAREHOLDERS',
@@ -632,14 +579,20 @@ MEMO_SECTION_KEYWORDS: List[str] = [
     'RECOMMENDATION', 'RECOMMANDATION', 'OVERVIEW', 'APERCU',
     'DESCRIPTION', 'STRUCTURE', 'STRATEGIE', 'STRATEGY',
     'HISTORIQUE', 'HISTORY', 'ACQUISITION'
-]
+)
+
+# Single-pass matcher for any section keyword (case-insensitive substring,
+# so e.g. 'RISK' also matches 'RISKS')
+MEMO_SECTION_RE: Pattern[str] = re.compile(
+    '|'.join(map(re.escape, MEMO_SECTION_KEYWORDS)), re.IGNORECASE
+)
 
 
 # =============================================================================
 # FILTER KEYWORDS (For Universe Filtering)
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class FilterKeywords:
     """Keywords used to filter out unwanted securities from universe."""
     # Name patterns to exclude (ADRs, GDRs, etc.)
@@ -660,6 +613,32 @@ class FilterKeywords:
     # Minimum ticker length
     min_ticker_length: int = 2
 
+    # Derived matchers, built in __post_init__ (declared so they get slots)
+    _name_re: Pattern = field(init=False, repr=False, compare=False)
+    _types_re: Pattern = field(init=False, repr=False, compare=False)
+    _chars_set: frozenset = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Compiled once: one regex pass per name instead of a substring
+        # search per pattern, and O(1) set membership for ticker characters
+        # ('(?!)' never matches, for an empty pattern list). The instance is
+        # frozen, hence object.__setattr__.
+        object.__setattr__(self, '_name_re', re.compile('|'.join(map(re.escape, self.exclude_name_patterns)) or '(?!)'))
+        object.__setattr__(self, '_types_re', re.compile('|'.join(map(re.escape, self.exclude_types)) or '(?!)'))
+        object.__setattr__(self, '_chars_set', frozenset(self.exclude_ticker_chars))
+
+    def is_excluded(self, code: str, name: Optional[str]) -> bool:
+        """True if a universe entry should be skipped (ADR listings, funds,
+        malformed or too-short ticker codes)."""
+        if code and code[0].isdigit():
+            return True
+        if len(code) < self.min_ticker_length:
+            return True
+        if not self._chars_set.isdisjoint(code):
+            return True
+        name_upper = name.upper() if name else ''
+        return bool(self._name_re.search(name_upper) or self._types_re.search(name_upper))
+
 
 FILTERS = FilterKeywords()
 
@@ -668,23 +647,72 @@ FILTERS = FilterKeywords()
 # REFRESH STATUS TEMPLATE
 # =============================================================================
 
-# Template for refresh status tracking
-REFRESH_STATUS_TEMPLATE: Dict[str, any] = {
-    'running': False,
-    'progress': 0,
-    'total': 0,
-    'current_ticker': '',
-    'message': ''
+@dataclass(slots=True)
+class RefreshStatus:
+    """State of a screener data refresh."""
+    running: bool = False
+    progress: int = 0
+    total: int = 0
+    current_ticker: str = ''
+    message: str = ''
+
+
+# Initial refresh state. Copy with dataclasses.replace(REFRESH_STATUS_TEMPLATE,
+# ...) (a flat copy of the five scalar fields, no deepcopy), or asdict() where
+# a JSON-ready dict is needed.
+REFRESH_STATUS_TEMPLATE = RefreshStatus()
+
+
+# =============================================================================
+# LAZY ATTRIBUTES
+# =============================================================================
+
+# Derived constants built on first access rather than at import
+_LAZY_BUILDERS = {
+    'MEMO_PATTERNS_RE': _build_memo_patterns_re,
 }
 
 
+def __getattr__(name: str):
+    """Module-level lazy attributes (PEP 562) for the static data tables
+    and the derived constants in _LAZY_BUILDERS."""
+    if name in _LAZY_STATIC_DATA:
+        from olyos import _static_data
+        value = getattr(_static_data, name)
+    elif name in _LAZY_BUILDERS:
+        value = _LAZY_BUILDERS[name]()
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value  # later lookups bypass __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | _LAZY_STATIC_DATA | set(_LAZY_BUILDERS))
+
+
 # =============================================================================
 # UTILITY FUNCTIONS
 # =============================================================================
 
+# (expiry timestamp, date string) for get_current_date
+_current_date_cache: Tuple[float, str] = (0.0, '')
+
+
 def get_current_date() -> str:
-    """Get current date in YYYY-MM-DD format."""
-    return datetime.now().strftime('%Y-%m-%d')
+    """Get current date in YYYY-MM-DD format.
+
+    The formatted date is memoized until the next local midnight, so hot
+    loops pay a time.time() comparison instead of now() + strftime.
+    """
+    global _current_date_cache
+    expires_at, today = _current_date_cache
+    if time.time() >= expires_at:
+        now = datetime.now()
+        today = now.strftime('%Y-%m-%d')
+        midnight = datetime.combine(now.date() + timedelta(days=1), dt_time.min)
+        _current_date_cache = (midnight.timestamp(), today)
+    return today
 
 
 def get_default_end_date() -> str:
@@ -4,7 +4,10 @@ Each service is created once and injected via FastAPI's Depends().
 """
 
 import os
+import time
 from functools import lru_cache
+from pathlib import Path
+from typing import NamedTuple
 
 from olyos.logger import get_logger
 
@@ -15,16 +18,40 @@ log = get_logger('dependencies')
 _BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 _DATA_DIR = os.path.join(_BASE_DIR, 'data')
 
+class _Paths(NamedTuple):
+    """Data file locations as Path objects, resolved once at import."""
+    portfolio_file: Path
+    transactions_file: Path
+    watchlist_file: Path
+    screener_cache_file: Path
+    nav_history_file: Path
+    backtest_cache_dir: Path
+    backtest_history_file: Path
+    benchmark_cache_dir: Path
+    dividends_cache_file: Path
+    insider_cache_file: Path
+    memo_dir: Path
+    reports_dir: Path
+
+
+PATHS = _Paths(
+    portfolio_file=Path(_DATA_DIR, 'portfolio.xlsx'),
+    transactions_file=Path(_DATA_DIR, 'transactions.json'),
+    watchlist_file=Path(_DATA_DIR, 'watchlist.json'),
+    screener_cache_file=Path(_DATA_DIR, 'screener_cache.json'),
+    nav_history_file=Path(_DATA_DIR, 'nav_history.json'),
+    backtest_cache_dir=Path(_DATA_DIR, 'backtest_cache'),
+    backtest_history_file=Path(_DATA_DIR, 'backtest_history.json'),
+    benchmark_cache_dir=Path(_DATA_DIR, 'benchmark_cache'),
+    dividends_cache_file=Path(_DATA_DIR, 'dividends_cache.json'),
+    insider_cache_file=Path(_DATA_DIR, 'insider_cache.json'),
+    memo_dir=Path(_DATA_DIR),
+    reports_dir=Path(_BASE_DIR, 'docs', 'reports'),
+)
+
+# Legacy string-keyed view of PATHS (values as str) plus server settings
 CONFIG = {
-    'portfolio_file': os.path.join(_DATA_DIR, 'portfolio.xlsx'),
-    'transactions_file': os.path.join(_DATA_DIR, 'transactions.json'),
-    'watchlist_file': os.path.join(_DATA_DIR, 'watchlist.json'),
-    'screener_cache_file': os.path.join(_DATA_DIR, 'screener_cache.json'),
-    'nav_history_file': os.path.join(_DATA_DIR, 'nav_history.json'),
-    'backtest_cache_dir': os.path.join(_DATA_DIR, 'backtest_cache'),
-    'backtest_history_file': os.path.join(_DATA_DIR, 'backtest_history.json'),
-    'memo_dir': _DATA_DIR,
-    'reports_dir': os.path.join(_BASE_DIR, 'docs', 'reports'),
+    **{name: str(path) for name, path in PATHS._asdict().items()},
     'port': 8080,
     'cache_days': 30,
 }
@@ -59,10 +86,18 @@ except ImportError:
 # These will be imported from the old app.py during transition,
 # then progressively moved into proper service modules.
 
+_APP_MODULE = None
+
+
 def _get_app_module():
-    """Lazy import of the old app module to access business functions."""
-    import olyos.app as app_module
-    return app_module
+    """Lazy import of the old app module to access business functions.
+    The module handle is kept after the first call, so routers calling this
+    per request skip the import machinery."""
+    global _APP_MODULE
+    if _APP_MODULE is None:
+        import olyos.app as app_module
+        _APP_MODULE = app_module
+    return _APP_MODULE
 
 
 # ─── Service Singletons ───────────────────────────────────────────────────────
@@ -71,7 +106,7 @@ def _get_app_module():
 def get_portfolio_service():
     """Portfolio data access service."""
     from olyos.services.portfolio_service import PortfolioService
-    app = _get_app_module()
+    import olyos.app as app
     return PortfolioService(
         load_portfolio_func=app.load_portfolio,
         save_portfolio_func=app.save_portfolio,
@@ -83,7 +118,7 @@ def get_portfolio_service():
 def get_alerts_service():
     """Alerts service."""
     from olyos.services.alerts import AlertsService
-    app = _get_app_module()
+    import olyos.app as app
     return AlertsService(
         watchlist_file=CONFIG['watchlist_file'],
         get_fundamentals_func=app.eod_get_fundamentals,
@@ -95,10 +130,9 @@ def get_alerts_service():
 def get_benchmark_service():
     """Benchmark comparison service."""
     from olyos.services.benchmark import BenchmarkService
-    app = _get_app_module()
-    benchmark_cache_dir = os.path.join(_DATA_DIR, 'benchmark_cache')
+    import olyos.app as app
     return BenchmarkService(
-        cache_dir=benchmark_cache_dir,
+        cache_dir=CONFIG['benchmark_cache_dir'],
         nav_history_file=CONFIG['nav_history_file'],
         get_prices_func=app.eod_get_historical_prices,
     )
@@ -108,10 +142,9 @@ def get_benchmark_service():
 def get_dividends_service():
     """Dividends tracking service."""
     from olyos.services.dividends import DividendsService
-    app = _get_app_module()
-    dividends_cache_file = os.path.join(_DATA_DIR, 'dividends_cache.json')
+    import olyos.app as app
     return DividendsService(
-        cache_file=dividends_cache_file,
+        cache_file=CONFIG['dividends_cache_file'],
         get_dividends_func=app.eod_get_dividends,
         get_fundamentals_func=app.eod_get_fundamentals,
     )
@@ -121,9 +154,12 @@ def get_dividends_service():
 def get_position_manager():
     """Position & transaction manager."""
     from olyos.services.position_manager import PositionManager
-    app = _get_app_module()
+    import olyos.app as app
 
-    def get_current_price(ticker: str) -> float:
+    # Prices are memoized per 5-minute bucket, so a batch of position
+    # valuations hits the fundamentals cache once per ticker
+    @lru_cache(maxsize=1024)
+    def _price_in_bucket(ticker: str, bucket: int) -> float:
         try:
             fund, err = app.eod_get_fundamentals(ticker, use_cache=True)
             if fund and not err:
@@ -134,6 +170,9 @@ def get_position_manager():
             pass
         return 0.0
 
+    def get_current_price(ticker: str) -> float:
+        return _price_in_bucket(ticker, int(time.time()) // 300)
+
     return PositionManager(
         transactions_file=CONFIG['transactions_file'],
         get_price_func=get_current_price,
@@ -145,7 +184,7 @@ def get_pdf_report_service():
     """PDF report generation service."""
     from olyos.services.pdf_report import PDFReportService
     os.makedirs(CONFIG['reports_dir'], exist_ok=True)
-    app = _get_app_module()
+    import olyos.app as app
     return PDFReportService(
         reports_dir=CONFIG['reports_dir'],
         nav_history_file=CONFIG['nav_history_file'],
@@ -159,10 +198,9 @@ def get_pdf_report_service():
 def get_insider_service():
     """Insider trading service."""
     from olyos.services.insider import InsiderService
-    cache_file = os.path.join(_DATA_DIR, 'insider_cache.json')
     return InsiderService(
         eod_api_key=EOD_API_KEY or '',
-        cache_file=cache_file,
+        cache_file=CONFIG['insider_cache_file'],
         cache_days=3,
     )
 
@@ -180,3 +218,29 @@ def get_rebalancing_service():
             max_pe=17.0,
         )
     )
+
+
+# ─── Startup Warm-up ──────────────────────────────────────────────────────────
+
+def warm_services() -> None:
+    """Build the service singletons once per worker, at startup.
+
+    The lru_cache'd factories are the in-process cache; loading the portfolio
+    here also refreshes the JSON portfolio sidecar next to the xlsx
+    (data/portfolio.cache.json), which is shared on disk by every worker. The first request after a (re)start
+    then skips importing app.py, reading service caches and parsing the xlsx.
+    """
+    factories = (
+        get_portfolio_service, get_alerts_service, get_benchmark_service,
+        get_dividends_service, get_position_manager, get_pdf_report_service,
+        get_insider_service, get_rebalancing_service,
+    )
+    for factory in factories:
+        try:
+            factory()
+        except Exception as e:
+            log.warning(f"Could not warm {factory.__name__}: {e}")
+
+    _, err = get_portfolio_service().load_dataframe()
+    if err:
+        log.warning(f"Could not preload portfolio: {err}")
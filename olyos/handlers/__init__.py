@@ -12,6 +12,8 @@ from .api import (
     json_response,
     json_success,
     json_error,
+    iter_file_chunks,
+    cached_screener,
     # POST handlers
     handle_create_memo,
     handle_generate_ai_memo,
@@ -47,6 +49,7 @@ from .pages import (
     handle_backtest_page,
     handle_ai_optimization_page,
     # Route matching helpers
+    dispatch,
     is_screener_path,
     is_screener_cache_path,
     is_backtest_path,
@@ -59,6 +62,8 @@ __all__ = [
     'json_response',
     'json_success',
     'json_error',
+    'iter_file_chunks',
+    'cached_screener',
     # POST handlers
     'handle_create_memo',
     'handle_generate_ai_memo',
@@ -91,6 +96,7 @@ __all__ = [
     'handle_backtest_page',
     'handle_ai_optimization_page',
     # Route matching helpers
+    'dispatch',
     'is_screener_path',
     'is_screener_cache_path',
     'is_backtest_path',
@@ -6,26 +6,100 @@ Each function takes request data and returns response data.
 """
 
 import json
+import logging
 import os
+import queue
+import re
+import shutil
+import threading
+import time
 import urllib.parse
 from datetime import datetime
+from functools import lru_cache
+from types import MappingProxyType
+
+from olyos.logger import get_logger
+
+try:
+    import orjson
+    ORJSON_OK = True
+except ImportError:
+    ORJSON_OK = False
+
+try:
+    import ujson
+    UJSON_OK = True
+except ImportError:
+    UJSON_OK = False
+
+log = get_logger('api')
 
 
 # ============================================================================
 # JSON Response Helpers
 # ============================================================================
 
-def json_response(data, status=200):
-    """Create a JSON response dict with status code."""
+if ORJSON_OK:
+    _ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+    def _dumps(data):
+        """Encode data as UTF-8 JSON bytes (orjson, NumPy values included)."""
+        return orjson.dumps(data, option=_ORJSON_OPTIONS)
+elif UJSON_OK:
+    def _dumps(data):
+        """Encode data as UTF-8 JSON bytes (ujson)."""
+        return ujson.dumps(data).encode('utf-8')
+else:
+    def _dumps(data):
+        """Encode data as UTF-8 JSON bytes (stdlib json)."""
+        return json.dumps(data).encode('utf-8')
+
+# Decoder for request bodies; both accept str or bytes (no decode step needed)
+_loads = orjson.loads if ORJSON_OK else json.loads
+
+
+def _json_bytes_response(body, status=200):
+    """Create a JSON response dict around an already-encoded body."""
     return {
         'status': status,
         'content_type': 'application/json',
-        'body': json.dumps(data)
+        'body': body,
+        'binary': True
     }
 
 
+def json_response(data, status=200):
+    """Create a JSON response dict with status code (body as bytes)."""
+    return _json_bytes_response(_dumps(data), status)
+
+
+# Constant payloads, encoded once at import
+_SUCCESS_BODY = _dumps({'success': True})
+_CONSTANT_BODIES = {
+    'backtest_error': _dumps({'error': 'Backtest error occurred'}),
+    'download_error': _dumps({'error': 'Download error occurred'}),
+    'optimize_error': _dumps({'error': 'Optimization error occurred'}),
+    'cache_cleared': _dumps({'message': 'Cache cleared successfully'}),
+    'cache_clear_error': _dumps({'error': 'Cache clear error occurred'}),
+    'refresh_running': _dumps({'error': 'Refresh already running'}),
+    'refresh_started': _dumps({'status': 'started'}),
+}
+
+
+def _text_response(success, err):
+    """Plain-text 'OK' (200) or error message (400) response."""
+    return {'status': 200 if success else 400, 'content_type': 'text/plain', 'body': err or 'OK'}
+
+
+def _constant_response(name, status=200):
+    """JSON response for one of the pre-encoded _CONSTANT_BODIES."""
+    return _json_bytes_response(_CONSTANT_BODIES[name], status)
+
+
 def json_success(data=None, **kwargs):
     """Create a success JSON response."""
+    if data is None and not kwargs:
+        return _json_bytes_response(_SUCCESS_BODY)
     response = {'success': True}
     if data is not None:
         response.update(data)
@@ -38,10 +112,66 @@ def json_error(error_message, status=200):
     return json_response({'success': False, 'error': error_message}, status)
 
 
+def iter_file_chunks(filepath, chunk_size=65536):
+    """Yield a file's bytes in chunks of chunk_size (64 KiB by default)."""
+    with open(filepath, 'rb') as f:
+        yield from iter(lambda: f.read(chunk_size), b'')
+
+
+# ============================================================================
+# Query Parameter Helpers
+# ============================================================================
+
+def _q(params, key, default=''):
+    """First value of a parsed query/form parameter, or default."""
+    values = params.get(key)
+    return values[0] if values else default
+
+
+def _unquote(value):
+    """urllib.parse.unquote, skipped entirely for values without escapes."""
+    return urllib.parse.unquote(value) if '%' in value else value
+
+
+def _qu(params, key, default=''):
+    """Like _q, URL-unquoted."""
+    values = params.get(key)
+    return _unquote(values[0]) if values else default
+
+
+def _parse_position_amounts(query_params):
+    """
+    Parse qty and avg_cost as floats once, at the handler boundary.
+
+    Raises:
+        ValueError: If either value is not a number
+    """
+    return float(_q(query_params, 'qty', '0')), float(_q(query_params, 'avg_cost', '0'))
+
+
 # ============================================================================
 # POST API Handlers
 # ============================================================================
 
+# Backtest parameter defaults (end_date None means today)
+_BACKTEST_DEFAULTS = MappingProxyType({
+    'start_date': '2015-01-01',
+    'end_date': None,
+    'universe_scope': 'france',
+    'pe_max': 12,
+    'roe_min': 10,
+    'pe_sell': 17,
+    'roe_min_hold': 8,
+    'debt_equity_max': 100,
+    'rebalance_freq': 'quarterly',
+    'initial_capital': 100000,
+    'max_positions': 20,
+    'benchmark': '^FCHI',
+})
+
+_UNIVERSE_SPLIT_RE = re.compile(r'\s*,\s*')
+
+
 def handle_create_memo(params, create_memo_docx):
     """
     Handle memo creation from form data.
@@ -53,17 +183,17 @@ def handle_create_memo(params, create_memo_docx):
     Returns:
         JSON response with filepath or error
     """
-    ticker = params.get('ticker', [''])[0]
-    name = params.get('name', [''])[0]
-    sector = params.get('sector', [''])[0]
-    country = params.get('country', [''])[0]
-    signal = params.get('signal', ['Surveillance'])[0]
-    target_price = params.get('target_price', [''])[0]
-    thesis = params.get('thesis', [''])[0]
-    strengths = params.get('strengths', [''])[0]
-    risks = params.get('risks', [''])[0]
-    valuation = params.get('valuation', [''])[0]
-    notes = params.get('notes', [''])[0]
+    ticker = _q(params, 'ticker')
+    name = _q(params, 'name')
+    sector = _q(params, 'sector')
+    country = _q(params, 'country')
+    signal = _q(params, 'signal', 'Surveillance')
+    target_price = _q(params, 'target_price')
+    thesis = _q(params, 'thesis')
+    strengths = _q(params, 'strengths')
+    risks = _q(params, 'risks')
+    valuation = _q(params, 'valuation')
+    notes = _q(params, 'notes')
 
     filepath, error = create_memo_docx(
         ticker, name, sector, country, signal, target_price,
@@ -88,7 +218,7 @@ def handle_generate_ai_memo(query_params, get_security_data, generate_memo_with_
     Returns:
         JSON response with filepath or error
     """
-    ticker = query_params.get('ticker', [''])[0]
+    ticker = _q(query_params, 'ticker')
     security_data = get_security_data(ticker)
     filepath, error = generate_memo_with_ai(security_data)
 
@@ -111,33 +241,23 @@ def handle_run_backtest(post_data, run_backtest, save_backtest_result):
         JSON response with backtest results
     """
     try:
-        params = json.loads(post_data)
+        params = _loads(post_data)
 
         # Parse universe from comma-separated string (for custom mode)
         universe_str = params.get('universe', '')
-        universe = [t.strip() for t in universe_str.split(',') if t.strip()]
-
-        backtest_params = {
-            'start_date': params.get('start_date', '2015-01-01'),
-            'end_date': params.get('end_date', datetime.now().strftime('%Y-%m-%d')),
-            'universe_scope': params.get('universe_scope', 'france'),
-            'universe': universe if universe else [],
-            'pe_max': params.get('pe_max', 12),
-            'roe_min': params.get('roe_min', 10),
-            'pe_sell': params.get('pe_sell', 17),
-            'roe_min_hold': params.get('roe_min_hold', 8),
-            'debt_equity_max': params.get('debt_equity_max', 100),
-            'rebalance_freq': params.get('rebalance_freq', 'quarterly'),
-            'initial_capital': params.get('initial_capital', 100000),
-            'max_positions': params.get('max_positions', 20),
-            'benchmark': params.get('benchmark', '^FCHI')
-        }
+        universe = [t for t in _UNIVERSE_SPLIT_RE.split(universe_str.strip()) if t]
 
-        print(f"[BACKTEST] Starting with params:")
-        print(f"   Scope: {backtest_params['universe_scope']}")
-        print(f"   Period: {backtest_params['start_date']} to {backtest_params['end_date']}")
-        print(f"   BUY: PE <= {backtest_params['pe_max']}, ROE >= {backtest_params['roe_min']}%")
-        print(f"   SELL: PE > {backtest_params['pe_sell']} or ROE < {backtest_params['roe_min_hold']}%")
+        backtest_params = {**_BACKTEST_DEFAULTS, **{k: params[k] for k in _BACKTEST_DEFAULTS if k in params}}
+        backtest_params['universe'] = universe
+        if backtest_params['end_date'] is None:
+            backtest_params['end_date'] = datetime.now().strftime('%Y-%m-%d')
+
+        log.info("Backtest starting: scope=%s period=%s to %s",
+                 backtest_params['universe_scope'], backtest_params['start_date'], backtest_params['end_date'])
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("Backtest rules: BUY PE <= %s, ROE >= %s%% / SELL PE > %s or ROE < %s%%",
+                      backtest_params['pe_max'], backtest_params['roe_min'],
+                      backtest_params['pe_sell'], backtest_params['roe_min_hold'])
 
         results = run_backtest(backtest_params)
 
@@ -145,13 +265,13 @@ def handle_run_backtest(post_data, run_backtest, save_backtest_result):
         if results.get('metrics'):
             bt_id = save_backtest_result(results)
             results['saved_id'] = bt_id
-            print(f"[BACKTEST] Saved to history with ID: {bt_id}")
+            log.info("Backtest saved to history with ID: %s", bt_id)
 
         return json_response(results)
 
     except Exception as e:
-        print(f"[BACKTEST ERROR] {e}")
-        return json_response({'error': 'Backtest error occurred'})
+        log.error("Backtest error: %s", e)
+        return _constant_response('backtest_error')
 
 
 def handle_download_data(query_params, download_all_data):
@@ -165,15 +285,15 @@ def handle_download_data(query_params, download_all_data):
     Returns:
         JSON response with download result
     """
-    scope = query_params.get('scope', ['france'])[0]
-    print(f"[CACHE] Downloading all data for {scope}...")
+    scope = _q(query_params, 'scope', 'france')
+    log.info("Downloading all data for %s...", scope)
 
     try:
         result = download_all_data(scope, start_date='2010-01-01')
         return json_response(result)
     except Exception as e:
-        print(f"[DOWNLOAD ERROR] {e}")
-        return json_response({'error': 'Download error occurred'})
+        log.error("Download error: %s", e)
+        return _constant_response('download_error')
 
 
 def handle_ai_optimize(query_params, run_ai_optimization):
@@ -187,16 +307,16 @@ def handle_ai_optimize(query_params, run_ai_optimization):
     Returns:
         JSON response with optimization result
     """
-    scope = query_params.get('scope', ['france'])[0]
-    goal = query_params.get('goal', ['balanced'])[0]
-    print(f"[AI OPTIMIZER] Starting optimization for {scope} with goal: {goal}")
+    scope = _q(query_params, 'scope', 'france')
+    goal = _q(query_params, 'goal', 'balanced')
+    log.info("AI optimization starting for %s with goal: %s", scope, goal)
 
     try:
         result = run_ai_optimization(scope, goal)
         return json_response(result)
     except Exception as e:
-        print(f"[AI OPTIMIZE ERROR] {e}")
-        return json_response({'error': 'Optimization error occurred'})
+        log.error("AI optimization error: %s", e)
+        return _constant_response('optimize_error')
 
 
 def handle_clear_cache(cache_dir, ensure_cache_dir):
@@ -211,14 +331,13 @@ def handle_clear_cache(cache_dir, ensure_cache_dir):
         JSON response with result
     """
     try:
-        import shutil
         if os.path.exists(cache_dir):
             shutil.rmtree(cache_dir)
         ensure_cache_dir()
-        return json_response({'message': 'Cache cleared successfully'})
+        return _constant_response('cache_cleared')
     except Exception as e:
-        print(f"[CLEAR CACHE ERROR] {e}")
-        return json_response({'error': 'Cache clear error occurred'})
+        log.error("Cache clear error: %s", e)
+        return _constant_response('cache_clear_error')
 
 
 def handle_rename_backtest(query_params, rename_backtest):
@@ -232,8 +351,8 @@ def handle_rename_backtest(query_params, rename_backtest):
     Returns:
         JSON response with success status
     """
-    bt_id = query_params.get('id', [''])[0]
-    new_name = urllib.parse.unquote(query_params.get('name', [''])[0])
+    bt_id = _q(query_params, 'id')
+    new_name = _qu(query_params, 'name')
     rename_backtest(bt_id, new_name)
     return json_success()
 
@@ -249,7 +368,7 @@ def handle_delete_backtest(query_params, delete_backtest):
     Returns:
         JSON response with success status
     """
-    bt_id = query_params.get('id', [''])[0]
+    bt_id = _q(query_params, 'id')
     delete_backtest(bt_id)
     return json_success()
 
@@ -284,7 +403,7 @@ def handle_get_backtest_history(load_backtest_history, config):
         JSON response with backtest history
     """
     history = load_backtest_history()
-    print(f"[HISTORY] Loading backtest history: {len(history)} items from {config['backtest_history_file']}")
+    log.debug("Loaded backtest history: %d items from %s", len(history), config['backtest_history_file'])
     return json_response(history)
 
 
@@ -300,10 +419,10 @@ def handle_add_watchlist(query_params, add_to_watchlist):
         Simple success response
     """
     add_to_watchlist(
-        query_params.get('ticker', [''])[0],
-        urllib.parse.unquote(query_params.get('name', [''])[0]),
-        query_params.get('country', [''])[0],
-        urllib.parse.unquote(query_params.get('sector', [''])[0])
+        _q(query_params, 'ticker'),
+        _qu(query_params, 'name'),
+        _q(query_params, 'country'),
+        _qu(query_params, 'sector')
     )
     return {'status': 200, 'body': None}
 
@@ -319,7 +438,7 @@ def handle_remove_watchlist(query_params, remove_from_watchlist):
     Returns:
         Simple success response
     """
-    remove_from_watchlist(query_params.get('ticker', [''])[0])
+    remove_from_watchlist(_q(query_params, 'ticker'))
     return {'status': 200, 'body': None}
 
 
@@ -334,17 +453,15 @@ def handle_add_portfolio(query_params, add_portfolio_position):
     Returns:
         Response with status and message
     """
-    ticker = query_params.get('ticker', [''])[0]
-    name = urllib.parse.unquote(query_params.get('name', [''])[0])
-    qty = query_params.get('qty', ['0'])[0]
-    avg_cost = query_params.get('avg_cost', ['0'])[0]
+    ticker = _q(query_params, 'ticker')
+    name = _qu(query_params, 'name')
+    try:
+        qty, avg_cost = _parse_position_amounts(query_params)
+    except ValueError:
+        return _text_response(False, 'Invalid qty or avg_cost')
     success, err = add_portfolio_position(ticker, name, qty, avg_cost)
 
-    return {
-        'status': 200 if success else 400,
-        'content_type': 'text/plain',
-        'body': err or 'OK'
-    }
+    return _text_response(success, err)
 
 
 def handle_edit_portfolio(query_params, edit_portfolio_position):
@@ -358,16 +475,14 @@ def handle_edit_portfolio(query_params, edit_portfolio_position):
     Returns:
         Response with status and message
     """
-    ticker = query_params.get('ticker', [''])[0]
-    qty = query_params.get('qty', ['0'])[0]
-    avg_cost = query_params.get('avg_cost', ['0'])[0]
+    ticker = _q(query_params, 'ticker')
+    try:
+        qty, avg_cost = _parse_position_amounts(query_params)
+    except ValueError:
+        return _text_response(False, 'Invalid qty or avg_cost')
     success, err = edit_portfolio_position(ticker, qty, avg_cost)
 
-    return {
-        'status': 200 if success else 400,
-        'content_type': 'text/plain',
-        'body': err or 'OK'
-    }
+    return _text_response(success, err)
 
 
 def handle_remove_portfolio(query_params, remove_portfolio_position):
@@ -381,14 +496,16 @@ def handle_remove_portfolio(query_params, remove_portfolio_position):
     Returns:
         Response with status and message
     """
-    ticker = query_params.get('ticker', [''])[0]
+    ticker = _q(query_params, 'ticker')
     success, err = remove_portfolio_position(ticker)
 
-    return {
-        'status': 200 if success else 400,
-        'content_type': 'text/plain',
-        'body': err or 'OK'
-    }
+    return _text_response(success, err)
+
+
+@lru_cache(maxsize=4)
+def _safe_dir(memo_dir):
+    """Absolute memo directory, resolved once per configured value."""
+    return os.path.abspath(memo_dir)
 
 
 def handle_file_download(query_params, config):
@@ -402,29 +519,81 @@ def handle_file_download(query_params, config):
     Returns:
         Response with file content or error
     """
-    fp = urllib.parse.unquote(query_params['download'][0])
-    # Security: Validate path is within allowed directory (prevent path traversal)
+    fp = _unquote(query_params['download'][0])
+    # Security: Validate path is within allowed directory (prevent path traversal).
+    # '..' components are rejected outright, before any path resolution.
+    if '..' in fp.replace('\\', '/').split('/'):
+        log.warning("Blocked path traversal attempt: %s", fp)
+        return {'status': 403, 'body': None}
+
     fp = os.path.abspath(fp)
-    safe_dir = os.path.abspath(config.get('memo_dir', '.'))
+    safe_dir = _safe_dir(config.get('memo_dir', '.'))
+    try:
+        inside = os.path.commonpath((fp, safe_dir)) == safe_dir
+    except ValueError:  # different drives on Windows
+        inside = False
 
-    if not fp.startswith(safe_dir):
-        print(f"[SECURITY] Blocked path traversal attempt: {fp}")
+    if not inside:
+        log.warning("Blocked path traversal attempt: %s", fp)
         return {'status': 403, 'body': None}
 
-    if os.path.exists(fp):
-        with open(fp, 'rb') as f:
-            content = f.read()
+    if os.path.isfile(fp):
+        # The server layer can hand 'file_path' to os.sendfile; 'body' streams
+        # the file in chunks otherwise, so it is never read whole into memory
         return {
             'status': 200,
             'content_type': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
-            'headers': {'Content-Disposition': f'attachment; filename="{os.path.basename(fp)}"'},
-            'body': content,
+            'headers': {
+                'Content-Disposition': f'attachment; filename="{os.path.basename(fp)}"',
+                'Content-Length': str(os.path.getsize(fp)),
+            },
+            'file_path': fp,
+            'body': iter_file_chunks(fp),
             'binary': True
         }
 
     return {'status': 404, 'body': None}
 
 
+# Single long-lived worker for screener refreshes, as in routers/screener.py:
+# one daemon thread fed by a SimpleQueue, so shutdown never waits on a refresh
+# in progress. _refresh_pending is set while a refresh is queued or running and
+# is checked under _refresh_lock to refuse overlapping starts.
+_REFRESH_QUEUE: "queue.SimpleQueue" = queue.SimpleQueue()
+_refresh_lock = threading.Lock()
+_refresh_worker = None
+_refresh_pending = False
+
+
+def _run_refresh_jobs():
+    """Worker loop: run queued refresh jobs one at a time."""
+    global _refresh_pending
+    while True:
+        job = _REFRESH_QUEUE.get()
+        try:
+            job()
+        except Exception as e:
+            log.error(f"Background refresh error: {e}")
+        finally:
+            with _refresh_lock:
+                _refresh_pending = False
+
+
+def _submit_refresh(job):
+    """Queue job for the refresh worker, starting the worker on first use.
+
+    Must be called with _refresh_lock held.
+    """
+    global _refresh_worker, _refresh_pending
+    if _refresh_worker is None or not _refresh_worker.is_alive():
+        _refresh_worker = threading.Thread(
+            target=_run_refresh_jobs, name='screener-refresh', daemon=True
+        )
+        _refresh_worker.start()
+    _refresh_pending = True
+    _REFRESH_QUEUE.put(job)
+
+
 def handle_refresh_screener_data(query_params, refresh_status, refresh_screener_data_background):
     """
     Handle screener data refresh request.
@@ -437,18 +606,17 @@ def handle_refresh_screener_data(query_params, refresh_status, refresh_screener_
     Returns:
         JSON response with status
     """
-    import threading
-
-    scope = query_params.get('scope', ['france'])[0]
+    scope = _q(query_params, 'scope', 'france')
 
-    # Check if already running
-    if refresh_status['running']:
-        return json_response({'error': 'Refresh already running'}, 400)
+    with _refresh_lock:
+        # Check if already running (queued/running here, or started elsewhere)
+        if refresh_status['running'] or _refresh_pending:
+            return _constant_response('refresh_running', 400)
 
-    # Start background refresh in a separate thread
-    threading.Thread(target=refresh_screener_data_background, args=(scope,), daemon=True).start()
+        # Start background refresh on the long-lived refresh worker
+        _submit_refresh(lambda: refresh_screener_data_background(scope))
 
-    return json_response({'status': 'started'})
+    return _constant_response('refresh_started')
 
 
 def handle_refresh_status(refresh_status):
@@ -464,6 +632,28 @@ def handle_refresh_status(refresh_status):
     return json_response(refresh_status)
 
 
+# (scope, mode) -> (monotonic time, run_screener result)
+_SCREENER_CACHE = {}
+SCREENER_CACHE_TTL = 60  # seconds
+
+
+def cached_screener(run_screener, scope, mode, force=False):
+    """
+    Run the screener, reusing a result from the last SCREENER_CACHE_TTL seconds.
+
+    A forced run always executes and replaces the cached entry.
+    """
+    key = (scope, mode)
+    now = time.monotonic()
+    if not force:
+        entry = _SCREENER_CACHE.get(key)
+        if entry and now - entry[0] < SCREENER_CACHE_TTL:
+            return entry[1]
+    result = run_screener(force=force, scope=scope, mode=mode)
+    _SCREENER_CACHE[key] = (now, result)
+    return result
+
+
 def handle_screener_json(query_params, run_screener, load_watchlist):
     """
     Handle screener JSON API request.
@@ -476,13 +666,17 @@ def handle_screener_json(query_params, run_screener, load_watchlist):
     Returns:
         JSON response with screener data
     """
-    scope = query_params.get('scope', ['france'])[0]
-    mode = query_params.get('mode', ['standard'])[0]
+    scope = _q(query_params, 'scope', 'france')
+    mode = _q(query_params, 'mode', 'standard')
     force = 'force' in query_params
 
-    screener_data = run_screener(force=force, scope=scope, mode=mode)
-    watchlist = load_watchlist()
-    wl_tickers = [w.get('ticker', '') for w in watchlist] if isinstance(watchlist, list) and watchlist and isinstance(watchlist[0], dict) else (watchlist or [])
+    screener_data = cached_screener(run_screener, scope, mode, force)
+    # Watchlist entries are dicts from load_watchlist; older callers pass bare tickers
+    watchlist = load_watchlist() or []
+    if watchlist and isinstance(watchlist[0], dict):
+        wl_tickers = [w.get('ticker', '') for w in watchlist]
+    else:
+        wl_tickers = list(watchlist)
 
     response = {
         'screener': screener_data,
@@ -495,13 +689,16 @@ def handle_screener_json(query_params, run_screener, load_watchlist):
             'cached': not force
         }
     }
+    body = _dumps(response)
 
     return {
         'status': 200,
         'content_type': 'application/json',
         'headers': {
             'Cache-Control': 'public, max-age=3600',
-            'Access-Control-Allow-Origin': '*'
+            'Access-Control-Allow-Origin': '*',
+            'Content-Length': str(len(body))
         },
-        'body': json.dumps(response)
+        'body': body,
+        'binary': True
     }
@@ -7,6 +7,41 @@ Each function returns HTML content or response data.
 
 import os
 
+from olyos.logger import get_logger
+
+from .api import cached_screener
+
+log = get_logger('ui')
+
+
+# ============================================================================
+# File Cache
+# ============================================================================
+
+# path -> (st_mtime_ns, bytes); re-read only when the file changes on disk
+_PAGE_CACHE = {}
+
+
+def _read_cached(path):
+    """
+    Read a file's bytes, cached in memory until its mtime changes.
+
+    Returns:
+        File content as bytes, or None if the file does not exist
+    """
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        _PAGE_CACHE.pop(path, None)
+        return None
+    entry = _PAGE_CACHE.get(path)
+    if entry and entry[0] == mtime:
+        return entry[1]
+    with open(path, 'rb') as f:
+        content = f.read()
+    _PAGE_CACHE[path] = (mtime, content)
+    return content
+
 
 # ============================================================================
 # Response Helpers
@@ -26,9 +61,8 @@ def html_response(content, status=200, cache_control=None):
 
 def json_file_response(filepath, cache_control='public, max-age=1800'):
     """Create a JSON file response dict."""
-    if os.path.exists(filepath):
-        with open(filepath, 'rb') as f:
-            content = f.read()
+    content = _read_cached(filepath)
+    if content is not None:
         return {
             'status': 200,
             'content_type': 'application/json',
@@ -51,10 +85,9 @@ def handle_screener_page():
         HTML response with screener page content
     """
     screener_html = 'screener_v2.html'
-    if os.path.exists(screener_html):
-        with open(screener_html, 'r', encoding='utf-8') as f:
-            content = f.read()
-        return html_response(content, cache_control='no-cache')
+    content = _read_cached(screener_html)
+    if content is not None:
+        return html_response(content.decode('utf-8'), cache_control='no-cache')
     return {'status': 404, 'body': None}
 
 
@@ -113,13 +146,13 @@ def handle_home_page(query_params, load_portfolio, update_portfolio, run_screene
 
     do_refresh = 'refresh' in query_params and yfinance_ok
     if do_refresh:
-        print("Refreshing portfolio data...")
+        log.info("Refreshing portfolio data...")
         df = update_portfolio(df)
 
     # Screener with scope and mode support
     screener_scope = query_params.get('scope', ['france'])[0] if 'screener' in query_params else 'france'
     screener_mode = query_params.get('mode', ['standard'])[0] if 'screener' in query_params else 'standard'
-    screener_data = run_screener(force='screener' in query_params, scope=screener_scope, mode=screener_mode)
+    screener_data = cached_screener(run_screener, screener_scope, screener_mode, force='screener' in query_params)
 
     df = calc_scores(df)
     html_content = gen_html(df, screener_data, load_watchlist(), update_history=do_refresh)
@@ -135,10 +168,9 @@ def handle_backtest_page():
     """
     # This would serve a dedicated backtest.html if it exists
     backtest_html = 'backtest.html'
-    if os.path.exists(backtest_html):
-        with open(backtest_html, 'r', encoding='utf-8') as f:
-            content = f.read()
-        return html_response(content, cache_control='no-cache')
+    content = _read_cached(backtest_html)
+    if content is not None:
+        return html_response(content.decode('utf-8'), cache_control='no-cache')
     # Fallback - page not found or handled by home page
     return None
 
@@ -152,10 +184,9 @@ def handle_ai_optimization_page():
     """
     # This would serve a dedicated ai_optimization.html if it exists
     ai_html = 'ai_optimization.html'
-    if os.path.exists(ai_html):
-        with open(ai_html, 'r', encoding='utf-8') as f:
-            content = f.read()
-        return html_response(content, cache_control='no-cache')
+    content = _read_cached(ai_html)
+    if content is not None:
+        return html_response(content.decode('utf-8'), cache_control='no-cache')
     # Fallback - page not found or handled by home page
     return None
 
@@ -164,24 +195,50 @@ def handle_ai_optimization_page():
 # Route Matching Helpers
 # ============================================================================
 
+_SCREENER_PATHS = frozenset({'/screener', '/screener/'})
+_SCREENER_CACHE_PATHS = frozenset({'/screener_cache.json'})
+_BACKTEST_PATHS = frozenset({'/backtest', '/backtest/'})
+_AI_OPTIMIZATION_PATHS = frozenset({'/ai-optimization', '/ai-optimization/'})
+
+# Exact path -> page handler, built once at import. Every handler takes the
+# config dict; the static pages do not need it.
+_ROUTES = {
+    **dict.fromkeys(_SCREENER_PATHS, lambda config: handle_screener_page()),
+    **dict.fromkeys(_SCREENER_CACHE_PATHS, handle_screener_cache_file),
+    **dict.fromkeys(_BACKTEST_PATHS, lambda config: handle_backtest_page()),
+    **dict.fromkeys(_AI_OPTIMIZATION_PATHS, lambda config: handle_ai_optimization_page()),
+}
+
+
+def dispatch(path):
+    """
+    Find the page handler for a path with a single dict lookup.
+
+    Returns:
+        Handler to call as handler(config), or None if the path is not a
+        static page route
+    """
+    return _ROUTES.get(path)
+
+
 def is_screener_path(path):
     """Check if path matches screener page."""
-    return path in ('/screener', '/screener/')
+    return path in _SCREENER_PATHS
 
 
 def is_screener_cache_path(path):
     """Check if path matches screener cache file."""
-    return path == '/screener_cache.json'
+    return path in _SCREENER_CACHE_PATHS
 
 
 def is_backtest_path(path):
     """Check if path matches backtest page."""
-    return path in ('/backtest', '/backtest/')
+    return path in _BACKTEST_PATHS
 
 
 def is_ai_optimization_path(path):
     """Check if path matches AI optimization page."""
-    return path in ('/ai-optimization', '/ai-optimization/')
+    return path in _AI_OPTIMIZATION_PATHS
 
 
 def has_detail_param(query_params):
@@ -7,7 +7,7 @@ Centralized logging configuration for Portfolio Terminal.
 Provides:
 - Console and file logging with different levels
 - Colored console output (with fallback)
-- Log rotation for file logs
+- Log rotation for file logs, written from a background listener thread
 - JSON format option for structured logging
 - Component-specific loggers (api, backtest, screener, etc.)
 
@@ -18,13 +18,24 @@ Usage:
     log.debug("Response data", extra={'data': response})
 """
 
+import atexit
+import copy
 import json
 import logging
 import os
+import queue
 import sys
-from datetime import datetime
-from logging.handlers import RotatingFileHandler
-from typing import Any, Dict, Optional, Union
+import threading
+import time
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+try:
+    import orjson
+    ORJSON_OK = True
+except ImportError:
+    ORJSON_OK = False
 
 
 # =============================================================================
@@ -94,10 +105,15 @@ class Colors:
     BG_YELLOW = "\033[43m"
 
 
+@lru_cache(maxsize=1)
 def supports_color() -> bool:
     """
     Check if the terminal supports ANSI color codes.
 
+    The result is cached: the Windows console probe (ctypes, SetConsoleMode)
+    runs at most once per process, and only on win32 after the cheap
+    environment and isatty checks.
+
     Returns:
         True if colors are supported, False otherwise.
     """
@@ -145,7 +161,33 @@ COLOR_ENABLED = supports_color()
 # CUSTOM FORMATTERS
 # =============================================================================
 
-class ColoredFormatter(logging.Formatter):
+class _SecondCachedFormatter(logging.Formatter):
+    """
+    Formatter base that converts each wall-clock second only once.
+
+    All olyos date formats have whole-second resolution, so formatTime()
+    can reuse the last string while records stay within the same second.
+    """
+
+    def __init__(self, *args, **kwargs):
+        """Initialize the formatter and an empty time cache."""
+        super().__init__(*args, **kwargs)
+        # (second, datefmt, formatted) for the last conversion
+        self._time_cache = (-1, None, "")
+
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        """Format record.created with datefmt, reusing the last second's result."""
+        if datefmt is None or "%f" in datefmt:
+            return super().formatTime(record, datefmt)
+        sec = int(record.created)
+        cached_sec, cached_fmt, formatted = self._time_cache
+        if sec != cached_sec or datefmt != cached_fmt:
+            formatted = time.strftime(datefmt, self.converter(sec))
+            self._time_cache = (sec, datefmt, formatted)
+        return formatted
+
+
+class ColoredFormatter(_SecondCachedFormatter):
     """
     Custom formatter that adds colors to console output.
 
@@ -175,6 +217,10 @@ class ColoredFormatter(logging.Formatter):
         logging.CRITICAL: "CRITICAL",
     }
 
+    # The same mappings as tuples indexed by levelno // 10 (NOTSET..CRITICAL)
+    _COLOR_TABLE = ("",) + tuple(map(LEVEL_COLORS.get, range(10, 60, 10)))
+    _NAME_TABLE = ("",) + tuple(map(LEVEL_NAMES.get, range(10, 60, 10)))
+
     def __init__(
         self,
         fmt: Optional[str] = None,
@@ -189,9 +235,21 @@ class ColoredFormatter(logging.Formatter):
             datefmt: Date format string.
             use_colors: Whether to apply colors (default: True).
         """
-        super().__init__(fmt, datefmt)
+        super().__init__(fmt, datefmt or "%Y-%m-%d %H:%M:%S")
         self.use_colors = use_colors and COLOR_ENABLED
 
+        # Templates are built once, so format() never checks use_colors
+        if self.use_colors:
+            self._template = (
+                f"{Colors.DIM}%(ts)s{Colors.RESET} "
+                f"%(color)s%(lvl)s{Colors.RESET} "
+                f"{Colors.BLUE}[%(name)s]{Colors.RESET} %(msg)s"
+            )
+            self._exc_template = f"\n{Colors.RED}%s{Colors.RESET}"
+        else:
+            self._template = "%(ts)s %(lvl)s [%(name)s] %(msg)s"
+            self._exc_template = "\n%s"
+
     def format(self, record: logging.LogRecord) -> str:
         """
         Format the log record with colors.
@@ -202,44 +260,32 @@ class ColoredFormatter(logging.Formatter):
         Returns:
             Formatted log string with optional colors.
         """
-        # Get color for this level
-        color = self.LEVEL_COLORS.get(record.levelno, "")
-        level_name = self.LEVEL_NAMES.get(record.levelno, record.levelname)
-
-        # Format timestamp
-        timestamp = datetime.fromtimestamp(record.created).strftime(
-            self.datefmt or "%Y-%m-%d %H:%M:%S"
-        )
-
-        # Build the formatted message
-        if self.use_colors:
-            # Colored format
-            formatted = (
-                f"{Colors.DIM}{timestamp}{Colors.RESET} "
-                f"{color}{level_name}{Colors.RESET} "
-                f"{Colors.BLUE}[{record.name}]{Colors.RESET} "
-                f"{record.getMessage()}"
-            )
+        idx, rem = divmod(record.levelno, 10)
+        if rem or not 0 < idx < 6:
+            # Custom level: no color, plain level name
+            color, level_name = "", record.levelname
         else:
-            # Plain format
-            formatted = (
-                f"{timestamp} {level_name} [{record.name}] {record.getMessage()}"
-            )
+            color, level_name = self._COLOR_TABLE[idx], self._NAME_TABLE[idx]
+
+        formatted = self._template % {
+            "ts": self.formatTime(record, self.datefmt),
+            "color": color,
+            "lvl": level_name,
+            "name": record.name,
+            "msg": record.getMessage(),
+        }
 
         # Add exception info if present
         if record.exc_info:
             if not record.exc_text:
                 record.exc_text = self.formatException(record.exc_info)
             if record.exc_text:
-                if self.use_colors:
-                    formatted += f"\n{Colors.RED}{record.exc_text}{Colors.RESET}"
-                else:
-                    formatted += f"\n{record.exc_text}"
+                formatted += self._exc_template % record.exc_text
 
         return formatted
 
 
-class JSONFormatter(logging.Formatter):
+class JSONFormatter(_SecondCachedFormatter):
     """
     Formatter that outputs log records as JSON objects.
 
@@ -247,6 +293,22 @@ class JSONFormatter(logging.Formatter):
     and machine-readable log files.
     """
 
+    # Standard LogRecord attributes, excluded from the "extra" block
+    STANDARD_ATTRS = frozenset({
+        "name", "msg", "args", "created", "filename", "funcName",
+        "levelname", "levelno", "lineno", "module", "msecs",
+        "pathname", "process", "processName", "relativeCreated",
+        "stack_info", "exc_info", "exc_text", "thread", "threadName",
+        "message", "asctime",
+    })
+
+    # Attributes every LogRecord starts with; message/asctime are added
+    # later by other formatters. More than this means extra fields exist.
+    BASE_ATTR_COUNT = len(logging.LogRecord("", 0, "", 0, "", None, None).__dict__)
+
+    if ORJSON_OK:
+        ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
     def __init__(
         self,
         include_extra: bool = True,
@@ -263,6 +325,11 @@ class JSONFormatter(logging.Formatter):
         self.include_extra = include_extra
         self.indent = indent
 
+    def _timestamp(self, record: logging.LogRecord) -> str:
+        """ISO-8601 local timestamp with millisecond precision."""
+        base = self.formatTime(record, "%Y-%m-%dT%H:%M:%S")
+        return f"{base}.{int(record.msecs):03d}"
+
     def format(self, record: logging.LogRecord) -> str:
         """
         Format the log record as JSON.
@@ -275,7 +342,7 @@ class JSONFormatter(logging.Formatter):
         """
         # Base log data
         log_data: Dict[str, Any] = {
-            "timestamp": datetime.fromtimestamp(record.created).isoformat(),
+            "timestamp": self._timestamp(record),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -290,35 +357,38 @@ class JSONFormatter(logging.Formatter):
 
         # Add exception info if present
         if record.exc_info:
+            # Reuse the traceback text if another handler already built it
+            if not record.exc_text:
+                record.exc_text = self.formatException(record.exc_info)
             log_data["exception"] = {
                 "type": record.exc_info[0].__name__ if record.exc_info[0] else None,
                 "message": str(record.exc_info[1]) if record.exc_info[1] else None,
-                "traceback": self.formatException(record.exc_info),
+                "traceback": record.exc_text,
             }
 
         # Add extra fields
-        if self.include_extra:
-            # Standard LogRecord attributes to exclude
-            standard_attrs = {
-                "name", "msg", "args", "created", "filename", "funcName",
-                "levelname", "levelno", "lineno", "module", "msecs",
-                "pathname", "process", "processName", "relativeCreated",
-                "stack_info", "exc_info", "exc_text", "thread", "threadName",
-                "message", "asctime",
-            }
-
+        attrs = record.__dict__
+        n_attrs = len(attrs) - ("message" in attrs) - ("asctime" in attrs)
+        if self.include_extra and n_attrs > self.BASE_ATTR_COUNT:
             # Include any extra attributes
             extra = {
-                k: v for k, v in record.__dict__.items()
-                if k not in standard_attrs and not k.startswith("_")
+                k: attrs[k] for k in attrs.keys() - self.STANDARD_ATTRS
+                if not k.startswith("_")
             }
             if extra:
                 log_data["extra"] = extra
 
+        if ORJSON_OK and self.indent is None:
+            try:
+                return orjson.dumps(
+                    log_data, default=str, option=self.ORJSON_OPTIONS
+                ).decode()
+            except TypeError:
+                pass  # e.g. an integer beyond 64 bits; stdlib json copes
         return json.dumps(log_data, indent=self.indent, default=str)
 
 
-class StandardFormatter(logging.Formatter):
+class StandardFormatter(_SecondCachedFormatter):
     """
     Standard formatter for file logging with consistent format.
     """
@@ -346,6 +416,113 @@ class StandardFormatter(logging.Formatter):
         )
 
 
+# =============================================================================
+# HANDLERS
+# =============================================================================
+
+class BufferedRotatingFileHandler(RotatingFileHandler):
+    """
+    Rotating file handler that batches writes instead of flushing per record.
+
+    Records below WARNING go into a 64 KiB write buffer that a background
+    flusher thread pushes to disk at most flush_interval seconds later;
+    WARNING and above flush immediately. The file size is tracked in memory
+    (in encoded bytes), so the rollover check no longer seeks (and flushes)
+    the stream on every record.
+    logging.shutdown() flushes and closes the handler at interpreter exit.
+    """
+
+    BUFFER_SIZE = 64 * 1024
+
+    def __init__(self, filename: str, *args, flush_interval: float = 1.0, **kwargs):
+        """
+        Initialize the handler.
+
+        Args:
+            filename: Path of the log file.
+            *args: Passed to RotatingFileHandler (mode, maxBytes, ...).
+            flush_interval: Maximum delay in seconds before buffered
+                records reach the file.
+            **kwargs: Passed to RotatingFileHandler.
+        """
+        self.flush_interval = flush_interval
+        self._size = 0
+        self._dirty = threading.Event()
+        self._closing = threading.Event()
+        self._flusher: Optional[threading.Thread] = None
+        super().__init__(filename, *args, **kwargs)
+
+    def _open(self):
+        """Open the log file with a large write buffer."""
+        stream = open(
+            self.baseFilename, self.mode, buffering=self.BUFFER_SIZE,
+            encoding=self.encoding, errors=self.errors,
+        )
+        self._size = os.fstat(stream.fileno()).st_size
+        return stream
+
+    def _flush_loop(self) -> None:
+        """Flusher thread: once records are buffered, wait flush_interval and flush."""
+        while not self._closing.is_set():
+            self._dirty.wait()
+            if self._closing.wait(self.flush_interval):
+                break
+            self._dirty.clear()
+            self.flush()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Format once, roll over if needed, and write to the buffer."""
+        try:
+            msg = self.format(record) + self.terminator
+            size = len(msg.encode(self.encoding or "utf-8", self.errors or "strict"))
+            if self.stream is None:
+                self.stream = self._open()
+            if self.maxBytes > 0 and self._size + size >= self.maxBytes:
+                self.doRollover()
+                if self.stream is None:
+                    self.stream = self._open()
+            self.stream.write(msg)
+            self._size += size
+
+            if record.levelno >= logging.WARNING:
+                self.flush()
+            else:
+                if self._flusher is None:
+                    self._flusher = threading.Thread(
+                        target=self._flush_loop, name="olyos-log-flush", daemon=True
+                    )
+                    self._flusher.start()
+                self._dirty.set()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def close(self) -> None:
+        """Stop the flusher thread, then flush and close the file."""
+        self._closing.set()
+        self._dirty.set()
+        super().close()
+
+
+class _RecordQueueHandler(QueueHandler):
+    """
+    QueueHandler that keeps records intact for the downstream formatters.
+
+    The stock prepare() pre-formats the whole line with a default Formatter
+    and drops exc_info, which would lose ColoredFormatter's layout and the
+    JSON "exception" field. Here only the message is merged with its args
+    (so later mutation of the args cannot change what gets logged).
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Return a copy of record with msg and args already merged."""
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
 # =============================================================================
 # LOGGER CONFIGURATION
 # =============================================================================
@@ -408,6 +585,20 @@ _initialized: bool = False
 # Cache of created loggers
 _loggers: Dict[str, logging.Logger] = {}
 
+# Base for relative log directories, and the resolved, existing log directory
+_BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_resolved_log_dir: Optional[str] = None
+
+# Records travel from the loggers to the real handlers through this queue;
+# the listener thread does all formatting and file I/O
+_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+_listener: Optional[QueueListener] = None
+
+# One queue handler shared by every olyos logger. It has no level of its
+# own: each logger's level does the filtering, so set_level() on one
+# component never affects the others.
+_queue_handler: Optional["_RecordQueueHandler"] = None
+
 
 # =============================================================================
 # INITIALIZATION FUNCTIONS
@@ -448,9 +639,9 @@ def configure(
         >>> log = get_logger('api')
         >>> log.debug("Debug message")
     """
-    global _config, _initialized
+    global _config, _initialized, _resolved_log_dir
 
-    _config = LoggerConfig(
+    new_config = LoggerConfig(
         level=level,
         log_dir=log_dir,
         log_file=log_file,
@@ -463,8 +654,19 @@ def configure(
         use_colors=use_colors,
     )
 
-    # Re-initialize all existing loggers with new config
+    # A level-only change needs no new handlers: keep the open files
+    old_vars, new_vars = vars(_config), vars(new_config)
+    changed = {k for k in new_vars if new_vars[k] != old_vars.get(k)}
+    if _listener is not None and changed <= {"level"}:
+        set_level(new_config.level)
+        _initialized = True
+        return
+
+    # Re-initialize the listener and all existing loggers with new config
+    _config = new_config
+    _resolved_log_dir = None
     _initialized = False
+    _start_listener()
     for name in list(_loggers.keys()):
         _setup_logger(name)
 
@@ -475,80 +677,134 @@ def _ensure_log_dir() -> str:
     """
     Ensure the log directory exists.
 
+    The resolved path is memoized until the next configure().
+
     Returns:
         Path to the log directory.
     """
+    global _resolved_log_dir
+
+    if _resolved_log_dir is not None:
+        return _resolved_log_dir
+
     log_dir = _config.log_dir
     if not os.path.isabs(log_dir):
         # Make relative to the olyos package directory
-        base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        log_dir = os.path.join(base_dir, log_dir)
+        log_dir = os.path.join(_BASE_DIR, log_dir)
 
     os.makedirs(log_dir, exist_ok=True)
+    _resolved_log_dir = log_dir
     return log_dir
 
 
-def _setup_logger(name: str) -> logging.Logger:
+def _build_handlers() -> list:
     """
-    Set up a logger with the configured handlers.
+    Build the console/file/JSON handlers for the current configuration.
 
-    Args:
-        name: Name of the logger.
+    Levels are enforced by each logger, so these handlers accept everything
+    that reaches the queue. The same instances serve every logger.
 
     Returns:
-        Configured logger instance.
+        List of handlers to be driven by the queue listener.
     """
-    # Create logger with olyos namespace
-    full_name = f"olyos.{name}" if name else "olyos"
-    logger = logging.getLogger(full_name)
-
-    # Clear existing handlers
-    logger.handlers.clear()
-
-    # Set level
-    logger.setLevel(_config.level)
-
-    # Don't propagate to root logger
-    logger.propagate = False
+    handlers = []
 
-    # Add console handler
+    # Console handler
     if _config.console_enabled:
         console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setLevel(_config.level)
         console_handler.setFormatter(
             ColoredFormatter(use_colors=_config.use_colors)
         )
-        logger.addHandler(console_handler)
+        handlers.append(console_handler)
 
-    # Add file handler
+    # File handler
     if _config.file_enabled:
         log_dir = _ensure_log_dir()
         log_path = os.path.join(log_dir, _config.log_file)
 
-        file_handler = RotatingFileHandler(
+        file_handler = BufferedRotatingFileHandler(
             log_path,
             maxBytes=_config.max_bytes,
             backupCount=_config.backup_count,
             encoding="utf-8",
         )
-        file_handler.setLevel(_config.level)
         file_handler.setFormatter(StandardFormatter())
-        logger.addHandler(file_handler)
+        handlers.append(file_handler)
 
-    # Add JSON file handler
+    # JSON file handler
     if _config.json_enabled:
         log_dir = _ensure_log_dir()
         json_path = os.path.join(log_dir, _config.json_file)
 
-        json_handler = RotatingFileHandler(
+        json_handler = BufferedRotatingFileHandler(
             json_path,
             maxBytes=_config.max_bytes,
             backupCount=_config.backup_count,
             encoding="utf-8",
         )
-        json_handler.setLevel(_config.level)
         json_handler.setFormatter(JSONFormatter())
-        logger.addHandler(json_handler)
+        handlers.append(json_handler)
+
+    return handlers
+
+
+def _stop_listener() -> None:
+    """Drain the log queue, stop the listener thread and close its handlers."""
+    global _listener
+
+    if _listener is None:
+        return
+    _listener.stop()
+    for handler in _listener.handlers:
+        handler.close()
+    _listener = None
+
+
+# Stop before logging.shutdown() so queued records still reach the files
+atexit.register(_stop_listener)
+
+
+def _start_listener() -> None:
+    """(Re)start the background listener with handlers for the current config."""
+    global _listener, _queue_handler
+
+    _stop_listener()
+    if _queue_handler is None:
+        _queue_handler = _RecordQueueHandler(_queue)
+    _listener = QueueListener(
+        _queue, *_build_handlers(), respect_handler_level=True
+    )
+    _listener.start()
+
+
+def _setup_logger(name: str) -> logging.Logger:
+    """
+    Set up a logger that hands its records to the background listener.
+
+    Args:
+        name: Name of the logger.
+
+    Returns:
+        Configured logger instance.
+    """
+    if _listener is None:
+        _start_listener()
+
+    # Create logger with olyos namespace
+    full_name = f"olyos.{name}" if name else "olyos"
+    logger = logging.getLogger(full_name)
+
+    # Clear existing handlers
+    logger.handlers.clear()
+
+    # Set level
+    logger.setLevel(_config.level)
+
+    # Don't propagate to root logger
+    logger.propagate = False
+
+    # Only enqueue here; formatting and I/O happen on the listener thread
+    logger.addHandler(_queue_handler)
 
     return logger
 
@@ -557,11 +813,14 @@ def _setup_logger(name: str) -> logging.Logger:
 # PUBLIC API
 # =============================================================================
 
+@lru_cache(maxsize=None)
 def get_logger(name: str = "") -> logging.Logger:
     """
     Get a logger for a specific component.
 
     Creates the logger if it doesn't exist, reuses existing loggers.
+    Results are memoized; configure() re-initializes the same Logger
+    objects in place, so cached references stay valid.
 
     Args:
         name: Component name (e.g., 'api', 'backtest', 'screener').
@@ -600,14 +859,10 @@ def set_level(level: Union[int, str], logger_name: Optional[str] = None) -> None
     if logger_name is not None:
         if logger_name in _loggers:
             _loggers[logger_name].setLevel(level)
-            for handler in _loggers[logger_name].handlers:
-                handler.setLevel(level)
     else:
         _config.level = level
         for logger in _loggers.values():
             logger.setLevel(level)
-            for handler in logger.handlers:
-                handler.setLevel(level)
 
 
 def enable_debug() -> None:
@@ -625,11 +880,19 @@ def disable_console() -> None:
 
     Useful for production environments or testing.
     """
-    for logger in _loggers.values():
-        for handler in logger.handlers[:]:
-            if isinstance(handler, logging.StreamHandler) and \
-               not isinstance(handler, logging.FileHandler):
-                logger.removeHandler(handler)
+    # Recorded in the config so a later configure() that asks for the
+    # console again sees a change and rebuilds the handlers
+    _config.console_enabled = False
+    if _listener is None:
+        return
+    # Drain what is already queued so earlier records still reach the console
+    _listener.stop()
+    _listener.handlers = tuple(
+        handler for handler in _listener.handlers
+        if not (isinstance(handler, logging.StreamHandler) and
+                not isinstance(handler, logging.FileHandler))
+    )
+    _listener.start()
 
 
 def get_log_file_path() -> Optional[str]:
@@ -649,60 +912,81 @@ def get_log_file_path() -> Optional[str]:
 # CONVENIENCE FUNCTIONS
 # =============================================================================
 
-def log_api(message: str, level: str = "INFO", **kwargs) -> None:
+# Level names in both spellings the wrappers accept ("INFO" / "info"), so
+# the common case resolves without a str.upper() allocation
+_LEVEL_LOOKUP = {
+    **{name.lower(): levelno for name, levelno in LOG_LEVELS.items()},
+    # Logger method aliases the wrappers used to resolve via getattr
+    "warn": logging.WARNING,
+    "fatal": logging.CRITICAL,
+    "exception": logging.ERROR,
+}
+
+
+def _log_lazy(name: str, level: str, msg: str, args: tuple, extra: dict) -> None:
+    """Forward msg and args unformatted; skip everything when level is off."""
+    logger = get_logger(name)
+    key = level.lower()
+    levelno = _LEVEL_LOOKUP.get(key)
+    if levelno is None:
+        raise ValueError(f"Unknown log level: {level!r}")
+    if logger.isEnabledFor(levelno):
+        logger.log(
+            levelno, msg, *args,
+            exc_info=key == "exception", extra=extra or None, stacklevel=2,
+        )
+
+
+def log_api(msg: str, *args, level: str = "INFO", **kwargs) -> None:
     """
     Log an API-related message.
 
     Args:
-        message: Log message.
+        msg: Log message, optionally with %-style placeholders.
+        *args: Arguments for msg, interpolated only if the record is emitted.
         level: Log level (default: INFO).
         **kwargs: Extra fields to include in the log.
     """
-    logger = get_logger("api")
-    log_func = getattr(logger, level.lower(), logger.info)
-    log_func(message, extra=kwargs if kwargs else None)
+    _log_lazy("api", level, msg, args, kwargs)
 
 
-def log_backtest(message: str, level: str = "INFO", **kwargs) -> None:
+def log_backtest(msg: str, *args, level: str = "INFO", **kwargs) -> None:
     """
     Log a backtest-related message.
 
     Args:
-        message: Log message.
+        msg: Log message, optionally with %-style placeholders.
+        *args: Arguments for msg, interpolated only if the record is emitted.
         level: Log level (default: INFO).
         **kwargs: Extra fields to include in the log.
     """
-    logger = get_logger("backtest")
-    log_func = getattr(logger, level.lower(), logger.info)
-    log_func(message, extra=kwargs if kwargs else None)
+    _log_lazy("backtest", level, msg, args, kwargs)
 
 
-def log_screener(message: str, level: str = "INFO", **kwargs) -> None:
+def log_screener(msg: str, *args, level: str = "INFO", **kwargs) -> None:
     """
     Log a screener-related message.
 
     Args:
-        message: Log message.
+        msg: Log message, optionally with %-style placeholders.
+        *args: Arguments for msg, interpolated only if the record is emitted.
         level: Log level (default: INFO).
         **kwargs: Extra fields to include in the log.
     """
-    logger = get_logger("screener")
-    log_func = getattr(logger, level.lower(), logger.info)
-    log_func(message, extra=kwargs if kwargs else None)
+    _log_lazy("screener", level, msg, args, kwargs)
 
 
-def log_portfolio(message: str, level: str = "INFO", **kwargs) -> None:
+def log_portfolio(msg: str, *args, level: str = "INFO", **kwargs) -> None:
     """
     Log a portfolio-related message.
 
     Args:
-        message: Log message.
+        msg: Log message, optionally with %-style placeholders.
+        *args: Arguments for msg, interpolated only if the record is emitted.
         level: Log level (default: INFO).
         **kwargs: Extra fields to include in the log.
     """
-    logger = get_logger("portfolio")
-    log_func = getattr(logger, level.lower(), logger.info)
-    log_func(message, extra=kwargs if kwargs else None)
+    _log_lazy("portfolio", level, msg, args, kwargs)
 
 
 # =============================================================================
@@ -736,26 +1020,25 @@ class temporary_log_level:
 
         self.level = level
         self.logger_name = logger_name
-        self.previous_levels: Dict[str, int] = {}
+        self.previous_levels: List[Tuple[logging.Logger, int]] = []
 
     def __enter__(self):
         """Save current levels and set temporary level."""
         if self.logger_name is not None:
-            if self.logger_name in _loggers:
-                logger = _loggers[self.logger_name]
-                self.previous_levels[self.logger_name] = logger.level
-                logger.setLevel(self.level)
+            logger = _loggers.get(self.logger_name)
+            targets = (logger,) if logger is not None else ()
         else:
-            for name, logger in _loggers.items():
-                self.previous_levels[name] = logger.level
-                logger.setLevel(self.level)
+            targets = _loggers.values()
+        for logger in targets:
+            self.previous_levels.append((logger, logger.level))
+            logger.setLevel(self.level)
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Restore previous log levels."""
-        for name, level in self.previous_levels.items():
-            if name in _loggers:
-                _loggers[name].setLevel(level)
+        for logger, level in self.previous_levels:
+            logger.setLevel(level)
+        self.previous_levels.clear()
         return False
 
 
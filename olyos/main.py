@@ -12,6 +12,8 @@ import os
 import sys
 import webbrowser
 import threading
+import urllib.parse
+from contextlib import asynccontextmanager
 
 # Add parent directory to path for module imports
 _current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -32,6 +34,7 @@ from fastapi import FastAPI
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 
 from olyos.logger import get_logger, configure as configure_logging
 from olyos.dependencies import CONFIG
@@ -40,7 +43,16 @@ log = get_logger('main')
 
 # ─── Application Setup ────────────────────────────────────────────────────────
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Warm service singletons before the worker accepts requests."""
+    from olyos.dependencies import warm_services
+    warm_services()
+    yield
+
+
 app = FastAPI(
+    lifespan=lifespan,
     title="Olyos Capital - Portfolio Terminal",
     version="5.0",
     description="Bloomberg-style portfolio management with Quality Value methodology (Higgons)",
@@ -58,6 +70,10 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Gzip large responses (heatmap, screener JSON) for clients that accept it.
+# Level 1 keeps the CPU cost negligible while still shrinking repetitive JSON.
+app.add_middleware(GZipMiddleware, minimum_size=1000, compresslevel=1)
+
 # Static files (CSS, JS, images)
 _static_dir = os.path.join(_parent_dir, 'static')
 if os.path.exists(_static_dir):
@@ -65,12 +81,9 @@ if os.path.exists(_static_dir):
 
 # ─── Backward Compatibility Layer ──────────────────────────────────────────────
 # During migration, we maintain backward compatibility with the old ?action= URLs.
-# The frontend JS still uses fetch('/?action=xxx'). This middleware redirects those
+# The frontend JS still uses fetch('/?action=xxx'). This middleware dispatches those
 # to the new /api/ endpoints.
 
-from fastapi import Request
-from fastapi.responses import RedirectResponse
-
 # Map old action names to new API paths
 ACTION_MAP = {
     # Alerts
@@ -150,22 +163,38 @@ ACTION_MAP = {
 }
 
 
-@app.middleware("http")
-async def legacy_action_redirect(request: Request, call_next):
-    """Redirect legacy ?action=xxx URLs to new /api/xxx paths."""
-    action = request.query_params.get('action')
+class LegacyActionMiddleware:
+    """Dispatch legacy ?action=xxx URLs straight to their /api/xxx routes.
+
+    The request is rewritten in place with a single ACTION_MAP lookup rather
+    than answered with a 307, which saved the client a second round trip.
+    Plain ASGI middleware: requests without a raw b"action=" in the query
+    string go straight through, with no Request object or query parsing.
+    """
+
+    def __init__(self, app):
+        self.app = app
 
-    if action and action in ACTION_MAP and request.url.path in ('/', ''):
-        new_path = ACTION_MAP[action]
-        # Rebuild query string without the 'action' parameter
-        params = dict(request.query_params)
-        params.pop('action', None)
-        query_string = '&'.join(f'{k}={v}' for k, v in params.items())
-        new_url = f"{new_path}?{query_string}" if query_string else new_path
+    async def __call__(self, scope, receive, send):
+        if (scope["type"] == "http" and scope["path"] in ('/', '')
+                and b"action=" in scope["query_string"]):
+            params = urllib.parse.parse_qsl(
+                scope["query_string"].decode("latin-1"), keep_blank_values=True
+            )
+            new_path = ACTION_MAP.get(dict(params).get('action'))
+            if new_path:
+                # Rebuild query string without the 'action' parameter
+                rest = [(k, v) for k, v in params if k != 'action']
+                scope = dict(
+                    scope,
+                    path=new_path,
+                    raw_path=new_path.encode(),
+                    query_string=urllib.parse.urlencode(rest).encode(),
+                )
+        await self.app(scope, receive, send)
 
-        return RedirectResponse(url=new_url, status_code=307)
 
-    return await call_next(request)
+app.add_middleware(LegacyActionMiddleware)
 
 
 # ─── Register Routers ─────────────────────────────────────────────────────────
@@ -220,7 +249,9 @@ def main():
     # Open browser after 1 second
     threading.Timer(1, lambda: webbrowser.open(f"http://localhost:{port}")).start()
 
-    uvicorn.run(app, host="localhost", port=port, log_level="warning")
+    # The dashboard fires several API calls in parallel; keep connections
+    # alive long enough for the browser to reuse them between refreshes.
+    uvicorn.run(app, host="localhost", port=port, log_level="warning", timeout_keep_alive=30)
 
 
 if __name__ == "__main__":
@@ -8,6 +8,10 @@ ADVISOR_MODEL_MAX_TOKENS = 3000
 ADVISOR_REPORT_DIR = "olyos_reports"
 ADVISOR_SCRATCHPAD_DIR = "olyos_scratchpad"
 
+# On-disk Yahoo snapshot cache (one JSON file per symbol)
+ADVISOR_SNAPSHOT_CACHE_DIR = "olyos_cache/snapshots"
+ADVISOR_SNAPSHOT_TTL_HOURS = 6
+
 ADVISOR_MACRO_QUERIES = [
     "small caps europeennes performance 2026",
     "taux BCE 2026 perspectives",
@@ -9,15 +9,25 @@ value/growth/cyclical framework inspired by William Higgons.
 from __future__ import annotations
 
 import argparse
+import heapq
 import json
 import logging
 import os
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any, Dict, List, Optional, Tuple
 
+import numpy as np
 import requests
 from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 try:
     import yfinance as yf
@@ -25,6 +35,18 @@ except ImportError:  # pragma: no cover - dependency issue at runtime
     yf = None
 
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - stdlib json fallback
+    orjson = None
+
+try:
+    import lxml  # noqa: F401 - only probed; BeautifulSoup drives it
+    _HTML_PARSER = "lxml"
+except ImportError:  # pragma: no cover - pure-Python parser fallback
+    _HTML_PARSER = "html.parser"
+
+
 try:
     from rich.console import Console
     from rich.markdown import Markdown
@@ -42,12 +64,16 @@ try:
         ADVISOR_MODEL_NAME,
         ADVISOR_REPORT_DIR,
         ADVISOR_SCRATCHPAD_DIR,
+        ADVISOR_SNAPSHOT_CACHE_DIR,
+        ADVISOR_SNAPSHOT_TTL_HOURS,
     )
 except Exception:  # pragma: no cover - fallback when imported standalone
     ADVISOR_MODEL_NAME = "claude-sonnet-4-6"
     ADVISOR_MODEL_MAX_TOKENS = 3000
     ADVISOR_REPORT_DIR = "olyos_reports"
     ADVISOR_SCRATCHPAD_DIR = "olyos_scratchpad"
+    ADVISOR_SNAPSHOT_CACHE_DIR = "olyos_cache/snapshots"
+    ADVISOR_SNAPSHOT_TTL_HOURS = 6
     ADVISOR_MACRO_QUERIES = [
         "small caps europeennes performance 2026",
         "taux BCE 2026 perspectives",
@@ -55,6 +81,10 @@ except Exception:  # pragma: no cover - fallback when imported standalone
     ]
 
 CATEGORY_KEYS = ("value", "croissance", "cyclique", "mixte")
+_CATEGORY_SET = frozenset(CATEGORY_KEYS)
+
+# Concurrent Yahoo lookups in fetch_current_prices
+FETCH_MAX_WORKERS = 16
 
 COUNTRY_SUFFIX_MAP = {
     "FR": ".PA",
@@ -74,7 +104,70 @@ COUNTRY_SUFFIX_MAP = {
     "NO": ".OL",
 }
 
+_COUNTRY_ALIASES = MappingProxyType({
+    "FRANCE": "FR",
+    "GERMANY": "DE",
+    "ALLEMAGNE": "DE",
+    "ITALY": "IT",
+    "ITALIE": "IT",
+    "SPAIN": "ES",
+    "ESPAGNE": "ES",
+    "NETHERLANDS": "NL",
+    "PAYS-BAS": "NL",
+    "BELGIUM": "BE",
+    "BELGIQUE": "BE",
+    "PORTUGAL": "PT",
+    "SWITZERLAND": "CH",
+    "SUISSE": "CH",
+    "UNITED KINGDOM": "UK",
+    "ROYAUME-UNI": "UK",
+    "AUSTRIA": "AT",
+    "AUTRICHE": "AT",
+    "SWEDEN": "SE",
+    "SUEDE": "SE",
+    "DENMARK": "DK",
+    "DANEMARK": "DK",
+    "FINLAND": "FI",
+    "FINLANDE": "FI",
+    "NORWAY": "NO",
+    "NORVEGE": "NO",
+})
+
+_CATEGORY_MAP = MappingProxyType({
+    "value": "value",
+    "valeur": "value",
+    "growth": "croissance",
+    "croissance": "croissance",
+    "cyclique": "cyclique",
+    "cyclical": "cyclique",
+    "cyclic": "cyclique",
+    "mixte": "mixte",
+    "mixed": "mixte",
+    "blend": "mixte",
+})
+
+if orjson is not None:
+    _ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+    def _json_dumps(obj: Any, indent: bool = True) -> str:
+        option = _ORJSON_OPTIONS | orjson.OPT_INDENT_2 if indent else _ORJSON_OPTIONS
+        return orjson.dumps(obj, option=option).decode("utf-8")
+
+    _json_loads = orjson.loads
+else:
+    def _json_dumps(obj: Any, indent: bool = True) -> str:
+        return json.dumps(obj, ensure_ascii=False, indent=2 if indent else None)
+
+    _json_loads = json.loads
+
+
 def _to_float(value: Any, default: Optional[float] = None) -> Optional[float]:
+    # Exact-type fast path for the usual JSON numbers
+    value_type = type(value)
+    if value_type is float:
+        return value
+    if value_type is int:
+        return float(value)
     if value is None:
         return default
     if isinstance(value, (int, float)):
@@ -103,35 +196,7 @@ def _normalize_country(country: Any) -> Optional[str]:
     value = str(country).strip().upper()
     if len(value) == 2:
         return value
-    aliases = {
-        "FRANCE": "FR",
-        "GERMANY": "DE",
-        "ALLEMAGNE": "DE",
-        "ITALY": "IT",
-        "ITALIE": "IT",
-        "SPAIN": "ES",
-        "ESPAGNE": "ES",
-        "NETHERLANDS": "NL",
-        "PAYS-BAS": "NL",
-        "BELGIUM": "BE",
-        "BELGIQUE": "BE",
-        "PORTUGAL": "PT",
-        "SWITZERLAND": "CH",
-        "SUISSE": "CH",
-        "UNITED KINGDOM": "UK",
-        "ROYAUME-UNI": "UK",
-        "AUSTRIA": "AT",
-        "AUTRICHE": "AT",
-        "SWEDEN": "SE",
-        "SUEDE": "SE",
-        "DENMARK": "DK",
-        "DANEMARK": "DK",
-        "FINLAND": "FI",
-        "FINLANDE": "FI",
-        "NORWAY": "NO",
-        "NORVEGE": "NO",
-    }
-    return aliases.get(value, value if len(value) == 2 else None)
+    return _COUNTRY_ALIASES.get(value)
 
 
 def _normalize_category(value: Any) -> str:
@@ -139,19 +204,15 @@ def _normalize_category(value: Any) -> str:
         return "mixte"
 
     text = str(value).strip().lower()
-    mapping = {
-        "value": "value",
-        "valeur": "value",
-        "growth": "croissance",
-        "croissance": "croissance",
-        "cyclique": "cyclique",
-        "cyclical": "cyclique",
-        "cyclic": "cyclique",
-        "mixte": "mixte",
-        "mixed": "mixte",
-        "blend": "mixte",
-    }
-    return mapping.get(text, "mixte")
+    return _CATEGORY_MAP.get(text, "mixte")
+
+
+def _category_of(position: Dict[str, Any]) -> str:
+    """Category of an already-loaded position; normalizes only ad-hoc input."""
+    category = position.get("category")
+    if isinstance(category, str) and category in _CATEGORY_SET:
+        return category
+    return _normalize_category(category)
 
 
 def load_portfolio(json_path: str) -> Dict[str, Any]:
@@ -159,8 +220,8 @@ def load_portfolio(json_path: str) -> Dict[str, Any]:
     Load portfolio JSON file and normalize structure.
     Required fields per position: ticker, shares, avg_price.
     """
-    with open(json_path, "r", encoding="utf-8") as f:
-        raw = json.load(f)
+    with open(json_path, "rb") as f:
+        raw = _json_loads(f.read())
 
     warnings: List[str] = []
 
@@ -243,39 +304,163 @@ def _build_yahoo_candidates(ticker: str, country_code: Optional[str]) -> List[st
         return [base]
 
     candidates: List[str] = []
-    candidates.append(f"{base}.PA")
 
+    # Country-derived listing first, then Paris, then the bare symbol
     suffix = COUNTRY_SUFFIX_MAP.get((country_code or "").upper(), "")
-    if suffix and suffix != ".PA":
+    if suffix:
         candidates.append(f"{base}{suffix}")
+    if suffix != ".PA":
+        candidates.append(f"{base}.PA")
 
     candidates.append(base)  # keep last fallback without suffix
     return candidates
 
 
+def _snapshot_cache_path(symbol: str) -> Path:
+    return Path(ADVISOR_SNAPSHOT_CACHE_DIR) / f"{symbol.replace('/', '_')}.json"
+
+
+def _read_cached_snapshot(symbol: str) -> Optional[Dict[str, Any]]:
+    """Return the cached snapshot for symbol if it is younger than the TTL."""
+    try:
+        payload = _json_loads(_snapshot_cache_path(symbol).read_bytes())
+        if time.time() - float(payload["fetched_at"]) < ADVISOR_SNAPSHOT_TTL_HOURS * 3600:
+            return payload["snapshot"]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    return None
+
+
+def _write_cached_snapshot(symbol: str, snapshot: Dict[str, Any]) -> None:
+    """Store a snapshot atomically (temp file + replace); failures are ignored."""
+    path = _snapshot_cache_path(symbol)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp.write_text(
+            _json_dumps({"fetched_at": time.time(), "snapshot": snapshot}, indent=False),
+            encoding="utf-8",
+        )
+        tmp.replace(path)
+    except OSError as exc:
+        LOG.debug("Could not cache snapshot for %s: %s", symbol, exc)
+
+
 def _fetch_symbol_snapshot(symbol: str) -> Optional[Dict[str, Any]]:
+    cached = _read_cached_snapshot(symbol)
+    if cached is not None:
+        return cached
+
+    snapshot = _download_symbol_snapshot(symbol)
+    if snapshot and snapshot.get("price") is not None:
+        _write_cached_snapshot(symbol, snapshot)
+    return snapshot
+
+
+@lru_cache(maxsize=256)
+def _cached_ticker(symbol: str):
+    """One yf.Ticker per symbol; cleared at the start of each fetch."""
+    return yf.Ticker(symbol)
+
+
+@lru_cache(maxsize=256)
+def _cached_history(symbol: str, period: str = "1y"):
+    """Daily history per (symbol, period); shared by overlapping candidates.
+
+    Like _cached_ticker this only lives for one fetch_current_prices call,
+    so a long-running server never serves a stale history or Ticker.info.
+    """
+    if period == "1y":
+        prefetched = _PREFETCHED_HISTORY.pop(symbol, None)
+        if prefetched is not None:
+            return prefetched
+    return _cached_ticker(symbol).history(period=period, interval="1d", auto_adjust=False)
+
+
+# 1y daily histories downloaded in one batch, consumed by _cached_history
+_PREFETCHED_HISTORY: Dict[str, Any] = {}
+
+
+def _reset_fetch_caches() -> None:
+    """Drop the in-memory Yahoo objects left over from a previous fetch."""
+    _cached_ticker.cache_clear()
+    _cached_history.cache_clear()
+    _PREFETCHED_HISTORY.clear()
+
+
+def _prefetch_histories(symbols: List[str]) -> None:
+    """Download 1y daily history for several symbols in one yf.download call.
+
+    Only the history is batched; info fields (PE, market cap, dividend
+    yield) are still read per symbol. Any failure just leaves the
+    per-symbol path to do the work.
+    """
+    if yf is None or len(symbols) < 2:
+        return
+    try:
+        frame = yf.download(
+            " ".join(symbols),
+            period="1y",
+            interval="1d",
+            group_by="ticker",
+            auto_adjust=False,
+            threads=True,
+            progress=False,
+        )
+    except Exception as exc:
+        LOG.debug("Batch history download failed: %s", exc)
+        return
+    if frame is None or frame.empty:
+        return
+
+    available = set(frame.columns.get_level_values(0))
+    for symbol in symbols:
+        if symbol in available:
+            _PREFETCHED_HISTORY[symbol] = frame[symbol]
+
+
+def _column_values(history: Any, column: str) -> np.ndarray:
+    """Non-NaN float64 values of a history column (empty if absent)."""
+    if column not in history:
+        return np.empty(0)
+    values = history[column].to_numpy(dtype=np.float64, na_value=np.nan)
+    return values[~np.isnan(values)]
+
+
+def _scan_history(history: Any) -> Optional[Tuple[float, Optional[float], Optional[float], Optional[float]]]:
+    """Last close, 30-day average volume and 52-week high/low from daily history.
+
+    Works on the raw column arrays, so no intermediate Series are built.
+    Returns None when there is no close price.
+    """
+    close = _column_values(history, "Close")
+    if not close.size:
+        return None
+    volume = _column_values(history, "Volume")
+    high = _column_values(history, "High")
+    low = _column_values(history, "Low")
+    return (
+        float(close[-1]),
+        float(volume[-30:].mean()) if volume.size else None,
+        float(high.max()) if high.size else None,
+        float(low.min()) if low.size else None,
+    )
+
+
+def _download_symbol_snapshot(symbol: str) -> Optional[Dict[str, Any]]:
     if yf is None:
         raise RuntimeError("yfinance is not installed. Install with: pip install yfinance")
 
     try:
-        ticker_obj = yf.Ticker(symbol)
-        history = ticker_obj.history(period="1y", interval="1d", auto_adjust=False)
+        ticker_obj = _cached_ticker(symbol)
+        history = _cached_history(symbol)
         if history is None or history.empty:
             return None
 
-        close_series = history.get("Close")
-        if close_series is None or close_series.dropna().empty:
+        scanned = _scan_history(history)
+        if scanned is None:
             return None
-
-        current_price = float(close_series.dropna().iloc[-1])
-        volume_series = history.get("Volume")
-        avg_volume_30d = (
-            float(volume_series.dropna().tail(30).mean())
-            if volume_series is not None and not volume_series.dropna().empty
-            else None
-        )
-        high_52w = float(history["High"].dropna().max()) if "High" in history and not history["High"].dropna().empty else None
-        low_52w = float(history["Low"].dropna().min()) if "Low" in history and not history["Low"].dropna().empty else None
+        current_price, avg_volume_30d, high_52w, low_52w = scanned
 
         info = ticker_obj.info or {}
         if info:
@@ -296,6 +481,15 @@ def _fetch_symbol_snapshot(symbol: str) -> Optional[Dict[str, Any]]:
         return None
 
 
+def _resolve_snapshot(candidates: List[str]) -> Optional[Dict[str, Any]]:
+    """Return the snapshot of the first candidate symbol that has a price."""
+    for candidate in candidates:
+        snapshot = _fetch_symbol_snapshot(candidate)
+        if snapshot and snapshot.get("price") is not None:
+            return snapshot
+    return None
+
+
 def fetch_current_prices(tickers: List[str], country_by_ticker: Optional[Dict[str, str]] = None) -> Dict[str, Dict[str, Any]]:
     """
     Fetch market data from Yahoo Finance.
@@ -309,21 +503,36 @@ def fetch_current_prices(tickers: List[str], country_by_ticker: Optional[Dict[st
     - dividend_yield
     """
     prices: Dict[str, Dict[str, Any]] = {}
+    _reset_fetch_caches()
 
+    jobs: Dict[str, List[str]] = {}
     for raw_ticker in tickers:
         ticker = str(raw_ticker).strip().upper()
-        country = (country_by_ticker or {}).get(ticker)
-        candidates = _build_yahoo_candidates(ticker, country)
-        snapshot = None
-        chosen = None
-
-        for candidate in candidates:
-            snapshot = _fetch_symbol_snapshot(candidate)
-            if snapshot and snapshot.get("price") is not None:
-                chosen = candidate
-                break
+        if ticker not in jobs:
+            country = (country_by_ticker or {}).get(ticker)
+            jobs[ticker] = _build_yahoo_candidates(ticker, country)
+
+    # One batched history download for each ticker's preferred symbol
+    _prefetch_histories([
+        candidates[0] for candidates in jobs.values()
+        if _read_cached_snapshot(candidates[0]) is None
+    ])
+
+    # Yahoo calls are I/O-bound: resolve all tickers concurrently
+    snapshots: Dict[str, Optional[Dict[str, Any]]] = {}
+    if jobs:
+        with ThreadPoolExecutor(max_workers=min(FETCH_MAX_WORKERS, len(jobs))) as executor:
+            futures = {
+                executor.submit(_resolve_snapshot, candidates): ticker
+                for ticker, candidates in jobs.items()
+            }
+            for future in as_completed(futures):
+                snapshots[futures[future]] = future.result()
 
-        if snapshot and chosen:
+    # Keep the input order in the returned mapping
+    for ticker in jobs:
+        snapshot = snapshots.get(ticker)
+        if snapshot:
             prices[ticker] = snapshot
         else:
             LOG.warning("Ticker not found on Yahoo Finance: %s", ticker)
@@ -348,69 +557,74 @@ def compute_portfolio_metrics(
     cash: float = 0.0,
     currency: str = "EUR",
 ) -> Dict[str, Any]:
-    provisional_positions: List[Dict[str, Any]] = []
-    total_invested = 0.0
-    total_current_value = 0.0
-
-    for position in portfolio:
-        ticker = position["ticker"]
-        market = prices.get(ticker, {})
-
-        current_price = _to_float(market.get("price"), None)
-        if current_price is None:
-            current_price = _to_float(position.get("current_price"), None)
-        if current_price is None:
-            current_price = _to_float(position.get("avg_price"), 0.0) or 0.0
-
-        shares = _to_float(position.get("shares"), 0.0) or 0.0
-        avg_price = _to_float(position.get("avg_price"), 0.0) or 0.0
-
-        cost_basis = shares * avg_price
-        current_value = shares * current_price
-        pnl_eur = current_value - cost_basis
-        pnl_pct = (pnl_eur / cost_basis) if cost_basis > 0 else 0.0
+    n = len(portfolio)
+    shares = np.empty(n, dtype=np.float64)
+    avg_price = np.empty(n, dtype=np.float64)
+    current_price = np.empty(n, dtype=np.float64)
+    high_52w = np.full(n, np.nan)
+    low_52w = np.full(n, np.nan)
+
+    # Single pass: parse the per-position scalars into flat arrays
+    for i, position in enumerate(portfolio):
+        market = prices.get(position["ticker"], {})
+
+        px = _to_float(market.get("price"), None)
+        if px is None:
+            px = _to_float(position.get("current_price"), None)
+        if px is None:
+            px = _to_float(position.get("avg_price"), 0.0) or 0.0
+        current_price[i] = px
+
+        shares[i] = _to_float(position.get("shares"), 0.0) or 0.0
+        avg_price[i] = _to_float(position.get("avg_price"), 0.0) or 0.0
+
+        high = _to_float(market.get("52w_high"), None)
+        low = _to_float(market.get("52w_low"), None)
+        if high:
+            high_52w[i] = high
+        if low:
+            low_52w[i] = low
+
+    cost_basis = shares * avg_price
+    current_value = shares * current_price
+    pnl_eur = current_value - cost_basis
+    pnl_pct = np.divide(pnl_eur, cost_basis, out=np.zeros(n), where=cost_basis > 0)
+
+    total_invested = float(cost_basis.sum())
+    total_current_value = float(current_value.sum())
+    if total_current_value > 0:
+        weight_pct = current_value / total_current_value
+    else:
+        weight_pct = np.zeros(n)
 
-        total_invested += cost_basis
-        total_current_value += current_value
+    with np.errstate(invalid="ignore"):
+        vs_high = np.divide(current_price - high_52w, high_52w,
+                            out=np.full(n, np.nan), where=high_52w > 0)
+        vs_low = np.divide(current_price - low_52w, low_52w,
+                           out=np.full(n, np.nan), where=low_52w > 0)
 
+    provisional_positions: List[Dict[str, Any]] = []
+    for i, position in enumerate(portfolio):
         provisional_positions.append(
             {
-                "ticker": ticker,
+                "ticker": position["ticker"],
                 "name": position.get("name"),
-                "category": _normalize_category(position.get("category")),
+                "category": _category_of(position),
                 "sector": position.get("sector") or "Unknown",
                 "country": position.get("country") or "Unknown",
-                "shares": shares,
-                "avg_price": avg_price,
-                "current_price": current_price,
-                "cost_basis": cost_basis,
-                "current_value": current_value,
-                "pnl_eur": pnl_eur,
-                "pnl_pct": pnl_pct,
-                "weight_pct": 0.0,
-                "vs_52w_high": None,
-                "vs_52w_low": None,
+                "shares": float(shares[i]),
+                "avg_price": float(avg_price[i]),
+                "current_price": float(current_price[i]),
+                "cost_basis": float(cost_basis[i]),
+                "current_value": float(current_value[i]),
+                "pnl_eur": float(pnl_eur[i]),
+                "pnl_pct": float(pnl_pct[i]),
+                "weight_pct": float(weight_pct[i]),
+                "vs_52w_high": None if np.isnan(vs_high[i]) else float(vs_high[i]),
+                "vs_52w_low": None if np.isnan(vs_low[i]) else float(vs_low[i]),
             }
         )
 
-    for row in provisional_positions:
-        ticker = row["ticker"]
-        market = prices.get(ticker, {})
-
-        if total_current_value > 0:
-            row["weight_pct"] = row["current_value"] / total_current_value
-        else:
-            row["weight_pct"] = 0.0
-
-        high_52w = _to_float(market.get("52w_high"), None)
-        low_52w = _to_float(market.get("52w_low"), None)
-        px = _to_float(row.get("current_price"), None)
-
-        if px is not None and high_52w and high_52w > 0:
-            row["vs_52w_high"] = (px - high_52w) / high_52w
-        if px is not None and low_52w and low_52w > 0:
-            row["vs_52w_low"] = (px - low_52w) / low_52w
-
     total_pnl_eur = total_current_value - total_invested
     total_pnl_pct = (total_pnl_eur / total_invested) if total_invested > 0 else 0.0
 
@@ -437,20 +651,24 @@ def analyze_concentration(metrics: Dict[str, Any]) -> Dict[str, Any]:
             "alerts": [],
         }
 
-    sorted_positions = sorted(positions, key=lambda x: x.get("weight_pct", 0.0), reverse=True)
-    max_single = sorted_positions[0].get("weight_pct", 0.0)
-    top3 = sum(row.get("weight_pct", 0.0) for row in sorted_positions[:3])
-
-    sector_breakdown: Dict[str, float] = {}
-    country_breakdown: Dict[str, float] = {}
+    # One pass: 3 largest weights (min-heap) plus sector/country totals
+    top_heap: List[float] = []
+    sector_breakdown: Dict[str, float] = defaultdict(float)
+    country_breakdown: Dict[str, float] = defaultdict(float)
     alerts: List[str] = []
 
     for row in positions:
-        sector = row.get("sector") or "Unknown"
-        country = row.get("country") or "Unknown"
         weight = row.get("weight_pct", 0.0)
-        sector_breakdown[sector] = sector_breakdown.get(sector, 0.0) + weight
-        country_breakdown[country] = country_breakdown.get(country, 0.0) + weight
+        if len(top_heap) < 3:
+            heapq.heappush(top_heap, weight)
+        elif weight > top_heap[0]:
+            heapq.heapreplace(top_heap, weight)
+        sector_breakdown[row.get("sector") or "Unknown"] += weight
+        country_breakdown[row.get("country") or "Unknown"] += weight
+
+    top_weights = sorted(top_heap, reverse=True)
+    max_single = top_weights[0]
+    top3 = sum(top_weights)
 
     if max_single > 0.20:
         alerts.append("Position unique > 20% du portefeuille")
@@ -464,8 +682,8 @@ def analyze_concentration(metrics: Dict[str, Any]) -> Dict[str, Any]:
     return {
         "max_single_position": max_single,
         "top3_concentration": top3,
-        "sector_breakdown": sector_breakdown,
-        "country_breakdown": country_breakdown,
+        "sector_breakdown": dict(sector_breakdown),
+        "country_breakdown": dict(country_breakdown),
         "alerts": alerts,
     }
 
@@ -479,7 +697,7 @@ def analyze_category_balance(metrics: Dict[str, Any]) -> Dict[str, Any]:
     }
 
     for pos in metrics.get("positions", []):
-        category = _normalize_category(pos.get("category"))
+        category = _category_of(pos)
         categories[category]["positions"].append(pos)
         categories[category]["weight"] += pos.get("weight_pct", 0.0)
 
@@ -502,21 +720,49 @@ def analyze_category_balance(metrics: Dict[str, Any]) -> Dict[str, Any]:
     return {"categories": categories, "alerts": alerts}
 
 
+def _build_http_session() -> requests.Session:
+    """Keep-alive session for outbound web searches, with light retrying."""
+    session = requests.Session()
+    session.headers["User-Agent"] = (
+        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0 Safari/537.36"
+    )
+    adapter = HTTPAdapter(
+        pool_connections=2,
+        pool_maxsize=2,
+        max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=(502, 503, 504)),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+# requests.Session is not documented as thread-safe (cookie jar, adapter
+# state), so each thread running macro queries gets its own session
+_HTTP_LOCAL = threading.local()
+
+
+def _http_session() -> requests.Session:
+    """This thread's keep-alive session, created on first use."""
+    session = getattr(_HTTP_LOCAL, "session", None)
+    if session is None:
+        session = _HTTP_LOCAL.session = _build_http_session()
+    return session
+
+
+# Long-lived pool for the macro queries: its threads, and the sessions they
+# hold in _HTTP_LOCAL, are reused across fetch_macro_context() calls
+_SEARCH_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="advisor-search")
+
+
 def _duckduckgo_search(query: str, limit: int = 2) -> List[Dict[str, str]]:
-    headers = {
-        "User-Agent": (
-            "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0 Safari/537.36"
-        )
-    }
-    response = requests.get(
+    response = _http_session().get(
         "https://duckduckgo.com/html/",
         params={"q": query},
-        headers=headers,
         timeout=10,
     )
     response.raise_for_status()
-    soup = BeautifulSoup(response.text, "html.parser")
+    soup = BeautifulSoup(response.content, _HTML_PARSER)
 
     results: List[Dict[str, str]] = []
     for block in soup.select("div.result"):
@@ -539,8 +785,9 @@ def fetch_macro_context() -> str:
     lines: List[str] = []
 
     try:
-        for query in queries:
-            items = _duckduckgo_search(query, limit=2)
+        # Queries run concurrently; results are consumed in query order
+        all_items = list(_SEARCH_POOL.map(lambda q: _duckduckgo_search(q, limit=2), queries))
+        for items in all_items:
             if not items:
                 continue
             top = items[0]
@@ -569,10 +816,10 @@ def generate_rebalancing_ideas(
     cash: float = 0.0,
 ) -> List[str]:
     ideas: List[str] = []
-    positions = sorted(metrics.get("positions", []), key=lambda p: p.get("weight_pct", 0.0), reverse=True)
+    positions = metrics.get("positions", [])
 
     if positions and concentration.get("max_single_position", 0.0) > 0.20:
-        p = positions[0]
+        p = max(positions, key=lambda p: p.get("weight_pct", 0.0))
         ideas.append(
             f"Alleger {p['ticker']} ({p['weight_pct']:.1%} du portefeuille) pour reduire le risque idiosyncratique."
         )
@@ -582,7 +829,7 @@ def generate_rebalancing_ideas(
 
     sector_breakdown = concentration.get("sector_breakdown", {})
     if sector_breakdown:
-        top_sector, top_weight = sorted(sector_breakdown.items(), key=lambda x: x[1], reverse=True)[0]
+        top_sector, top_weight = max(sector_breakdown.items(), key=lambda x: x[1])
         if top_weight > 0.40:
             ideas.append(f"Limiter l'exposition au secteur {top_sector} ({top_weight:.1%}) via allegements selectifs.")
 
@@ -590,7 +837,7 @@ def generate_rebalancing_ideas(
     value_weight = categories.get("value", {}).get("weight", 0.0)
     if value_weight < 0.50:
         value_positions = categories.get("value", {}).get("positions", [])
-        lagging_value = sorted(value_positions, key=lambda p: p.get("pnl_pct", 0.0))[:1]
+        lagging_value = heapq.nsmallest(1, value_positions, key=lambda p: p.get("pnl_pct", 0.0))
         if lagging_value:
             ideas.append(
                 f"Reexaminer {lagging_value[0]['ticker']} (value) pour potentiel renforcement si these intacte."
@@ -602,7 +849,7 @@ def generate_rebalancing_ideas(
         p for p in categories.get("cyclique", {}).get("positions", []) if p.get("pnl_pct", 0.0) > 0.40
     ]
     if cyclical_winners:
-        best = sorted(cyclical_winners, key=lambda p: p.get("pnl_pct", 0.0), reverse=True)[0]
+        best = max(cyclical_winners, key=lambda p: p.get("pnl_pct", 0.0))
         ideas.append(f"Prendre partiellement des benefices sur {best['ticker']} (cyclique +{best['pnl_pct']:.0%}).")
 
     total_value_with_cash = metrics.get("total_value_with_cash", 0.0)
@@ -641,8 +888,8 @@ def generate_markdown_report(
     macro_context: str,
 ) -> str:
     positions = metrics.get("positions", [])
-    top = sorted(positions, key=lambda p: p.get("pnl_pct", -999), reverse=True)[:3]
-    bottom = sorted(positions, key=lambda p: p.get("pnl_pct", 999))[:3]
+    top = heapq.nlargest(3, positions, key=lambda p: p.get("pnl_pct", -999))
+    bottom = heapq.nsmallest(3, positions, key=lambda p: p.get("pnl_pct", 999))
     currency = metrics.get("currency", "EUR")
 
     categories = category_balance.get("categories", {})
@@ -711,7 +958,37 @@ def generate_markdown_report(
     return "\n".join(lines)
 
 
-def synthesize_with_llm(scratchpad: Dict[str, Any], verbose: bool = False) -> Optional[str]:
+_LLM_SYSTEM_PROMPT = (
+    "Tu es un conseiller en gestion de portefeuille specialise en value investing "
+    "sur les small et mid caps europeennes.\n"
+    "Tu analyses le portefeuille d'Olyos Capital dont la strategie est inspiree de William Higgons :\n"
+    "- Socle value sur des societes decotees avec bilan sain\n"
+    "- Complement croissance et cycliques en zone de rechargement\n"
+    "- Focus small/mid caps francaises et europeennes\n"
+    "- Horizon long terme 2-4 ans\n\n"
+    "Sois factuel, concis, et conclusif. Pas de discours generique.\n"
+    "Formule des observations specifiques a CE portefeuille."
+)
+
+# The user prompt is _LLM_USER_PROMPT_HEAD + scratchpad JSON + _LLM_USER_PROMPT_TAIL
+_LLM_USER_PROMPT_HEAD = "Voici l'etat complet du portefeuille Olyos Capital :\n"
+_LLM_USER_PROMPT_TAIL = (
+    "\n\n"
+    "Produis l'analyse suivante en markdown :\n"
+    "## Vue d'ensemble (snapshot chiffre : valeur totale, PnL global, nb positions)\n"
+    "## Top performers & Laggards (top 3 / bottom 3)\n"
+    "## Risques identifies (concentration, biais sectoriels, desequilibres)\n"
+    "## Equilibre strategique (value/croissance/cyclique - commentaire)\n"
+    "## Actions suggerees (max 5 idees concretes : alleger X, renforcer Y, surveiller Z)\n"
+    "## Contexte macro et impact sur le portefeuille\n"
+)
+
+
+def synthesize_with_llm(
+    scratchpad: Dict[str, Any],
+    verbose: bool = False,
+    scratchpad_json: Optional[str] = None,
+) -> Optional[str]:
     api_key = os.environ.get("ANTHROPIC_API_KEY")
     if not api_key:
         if verbose:
@@ -724,35 +1001,16 @@ def synthesize_with_llm(scratchpad: Dict[str, Any], verbose: bool = False) -> Op
         LOG.warning("Anthropic import failed: %s", exc)
         return None
 
-    system_prompt = (
-        "Tu es un conseiller en gestion de portefeuille specialise en value investing "
-        "sur les small et mid caps europeennes.\n"
-        "Tu analyses le portefeuille d'Olyos Capital dont la strategie est inspiree de William Higgons :\n"
-        "- Socle value sur des societes decotees avec bilan sain\n"
-        "- Complement croissance et cycliques en zone de rechargement\n"
-        "- Focus small/mid caps francaises et europeennes\n"
-        "- Horizon long terme 2-4 ans\n\n"
-        "Sois factuel, concis, et conclusif. Pas de discours generique.\n"
-        "Formule des observations specifiques a CE portefeuille."
-    )
-    user_prompt = (
-        "Voici l'etat complet du portefeuille Olyos Capital :\n"
-        f"{json.dumps(scratchpad, ensure_ascii=False, indent=2)}\n\n"
-        "Produis l'analyse suivante en markdown :\n"
-        "## Vue d'ensemble (snapshot chiffre : valeur totale, PnL global, nb positions)\n"
-        "## Top performers & Laggards (top 3 / bottom 3)\n"
-        "## Risques identifies (concentration, biais sectoriels, desequilibres)\n"
-        "## Equilibre strategique (value/croissance/cyclique - commentaire)\n"
-        "## Actions suggerees (max 5 idees concretes : alleger X, renforcer Y, surveiller Z)\n"
-        "## Contexte macro et impact sur le portefeuille\n"
-    )
+    if scratchpad_json is None:
+        scratchpad_json = _json_dumps(scratchpad)
+    user_prompt = "".join((_LLM_USER_PROMPT_HEAD, scratchpad_json, _LLM_USER_PROMPT_TAIL))
 
     try:
         client = anthropic.Anthropic(api_key=api_key)
         response = client.messages.create(
             model=ADVISOR_MODEL_NAME,
             max_tokens=ADVISOR_MODEL_MAX_TOKENS,
-            system=system_prompt,
+            system=_LLM_SYSTEM_PROMPT,
             messages=[{"role": "user", "content": user_prompt}],
         )
         chunks = []
@@ -779,6 +1037,7 @@ def _save_outputs(
     report_markdown: str,
     scratchpad: Dict[str, Any],
     output_override: Optional[str],
+    scratchpad_json: Optional[str] = None,
 ) -> Tuple[Path, Path, Optional[Path]]:
     stamp = datetime.now().strftime("%Y%m%d")
     reports_dir = Path(ADVISOR_REPORT_DIR)
@@ -791,7 +1050,7 @@ def _save_outputs(
 
     default_report_path.write_text(report_markdown, encoding="utf-8")
     default_scratchpad_path.write_text(
-        json.dumps(scratchpad, ensure_ascii=False, indent=2),
+        scratchpad_json if scratchpad_json is not None else _json_dumps(scratchpad),
         encoding="utf-8",
     )
 
@@ -829,7 +1088,7 @@ def _log_tool_result(tool_name: str, payload: Any, verbose: bool) -> None:
     if not verbose:
         return
     try:
-        pretty = json.dumps(payload, ensure_ascii=False, indent=2)
+        pretty = _json_dumps(payload)
     except TypeError:
         pretty = str(payload)
     LOG.info("%s ->\n%s", tool_name, pretty)
@@ -908,6 +1167,9 @@ def run_analysis(
         actions=rebalancing_ideas,
     )
 
+    # Serialized once; reused for the LLM prompt and the saved scratchpad
+    scratchpad_json = _json_dumps(scratchpad)
+
     report_markdown = generate_markdown_report(
         metrics=metrics,
         concentration=concentration,
@@ -919,7 +1181,7 @@ def run_analysis(
 
     llm_used = False
     if use_llm:
-        llm_report = synthesize_with_llm(scratchpad, verbose=verbose)
+        llm_report = synthesize_with_llm(scratchpad, verbose=verbose, scratchpad_json=scratchpad_json)
         if llm_report:
             report_markdown = llm_report
             llm_used = True
@@ -928,6 +1190,7 @@ def run_analysis(
         report_markdown=report_markdown,
         scratchpad=scratchpad,
         output_override=output_override,
+        scratchpad_json=scratchpad_json,
     )
 
     if render_output:
@@ -5,15 +5,19 @@ The router now uses Jinja2 templates for rendering.
 
 import json
 import html
+import hashlib
 import math
+import os
+import re
 from datetime import datetime
-from typing import Any, Dict, List
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
 
 from fastapi import APIRouter, Query, Request
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.responses import FileResponse, HTMLResponse, JSONResponse, Response
 from fastapi.templating import Jinja2Templates
 
-from olyos.dependencies import YFINANCE_OK, ANTHROPIC_OK
+from olyos.dependencies import CONFIG, PATHS, YFINANCE_OK, ANTHROPIC_OK
 from olyos.logger import get_logger
 
 log = get_logger('router.pages')
@@ -41,6 +45,73 @@ def fmt_val(val: float, decimals: int = 2) -> str:
     return f"{val:,.{decimals}f}"
 
 
+# Last rendered dashboard: cache key -> body. The key holds the mtimes of
+# every file the page is built from, so any write invalidates it.
+_HOME_CACHE: Dict[Tuple, bytes] = {}
+
+# Stands in for the clock in the cached body; filled in on every response
+_CLOCK_SLOT = '__OLYOS_CLOCK__'
+
+
+def _screener_cache_path(scope: str, mode: str) -> Path:
+    """Per scope/mode screener cache file (see app.load_cache)."""
+    path = PATHS.screener_cache_file
+    return path.with_name(f'{path.stem}_{scope}_{mode}{path.suffix}')
+
+
+def _home_cache_key() -> Tuple:
+    """Cache key for a plain dashboard render (no refresh, default screener)."""
+    paths = (
+        PATHS.portfolio_file,
+        PATHS.watchlist_file,
+        PATHS.nav_history_file,
+        PATHS.transactions_file,
+        _screener_cache_path('france', 'standard'),
+    )
+    mtimes: List[Optional[int]] = []
+    for path in paths:
+        try:
+            mtimes.append(path.stat().st_mtime_ns)
+        except OSError:
+            mtimes.append(None)
+    # app.load_cache expires the screener cache by whole days since it was
+    # saved (its write date, i.e. the file's mtime)
+    today = datetime.now().date()
+    screener_mtime = mtimes[-1]
+    screener_fresh = screener_mtime is not None and (
+        today - datetime.fromtimestamp(screener_mtime / 1e9).date()
+    ).days < CONFIG['cache_days']
+    return (today.isoformat(), screener_fresh, *mtimes)
+
+
+def _home_response(request: Request, cache_key: Tuple, body: bytes) -> Response:
+    """Serve a cached dashboard body with the current time filled in.
+
+    The ETag changes every minute, so a revalidated browser copy never shows
+    a clock more than a minute old.
+    """
+    now = datetime.now()
+    etag = '"' + hashlib.sha1(
+        repr((cache_key, now.strftime('%H:%M'))).encode()
+    ).hexdigest()[:16] + '"'
+    if request.headers.get('if-none-match') == etag:
+        return Response(status_code=304, headers={'ETag': etag})
+    body = body.replace(_CLOCK_SLOT.encode(), now.strftime('%H:%M:%S').encode())
+    return HTMLResponse(body, headers={'ETag': etag})
+
+
+DOCX_MEDIA_TYPE = 'application/vnd.openxmlformats-officedocument.wordprocessingml.document'
+
+
+def _memo_download(filepath: str) -> Response:
+    """Stream a memo .docx from the memo directory (the detail page's
+    /?download= links). FileResponse sends it in chunks from disk."""
+    path = Path(filepath).resolve()
+    if path.suffix.lower() != '.docx' or path.parent != PATHS.memo_dir.resolve() or not path.is_file():
+        return HTMLResponse("<h1>Memo not found</h1>", status_code=404)
+    return FileResponse(path, media_type=DOCX_MEDIA_TYPE, filename=path.name)
+
+
 def safe_float(val: Any) -> float:
     """Safely convert value to float."""
     try:
@@ -60,11 +131,20 @@ def home_page(
     screener: str = Query(None),
     scope: str = Query("france"),
     mode: str = Query("standard"),
+    download: str = Query(None),
 ):
     """Main portfolio dashboard."""
     try:
         from olyos.dependencies import _get_app_module
 
+        if download:
+            return _memo_download(download)
+
+        # Plain loads are served from the render cache when no input changed
+        cache_key = _home_cache_key() if refresh is None and screener is None else None
+        if cache_key is not None and cache_key in _HOME_CACHE:
+            return _home_response(request, cache_key, _HOME_CACHE[cache_key])
+
         app = _get_app_module()
 
         # Get PORTFOLIO_ADVISOR_OK from app module
@@ -278,7 +358,7 @@ def home_page(
             "positions": positions,
             "watchlist": watchlist,
             # DateTime
-            "datetime_formatted": datetime.now().strftime('%H:%M:%S'),
+            "datetime_formatted": _CLOCK_SLOT if cache_key is not None else datetime.now().strftime('%H:%M:%S'),
             "datetime_formatted_long": datetime.now().strftime('%d-%b %H:%M').upper(),
             # Feature flags
             "portfolio_advisor_ok": PORTFOLIO_ADVISOR_OK,
@@ -292,7 +372,12 @@ def home_page(
             "screener_count": len(screener_data),
         }
 
-        return _get_templates().TemplateResponse("dashboard.html", context)
+        response = _get_templates().TemplateResponse("dashboard.html", context)
+        if cache_key is not None:
+            _HOME_CACHE.clear()
+            _HOME_CACHE[cache_key] = response.body
+            return _home_response(request, cache_key, response.body)
+        return response
     except Exception as e:
         log.error(f"Error rendering home page: {e}", exc_info=True)
         return HTMLResponse(f"<h1>Error: {e}</h1>", status_code=500)
@@ -557,3 +642,19 @@ def screener_page():
     except Exception as e:
         log.error(f"Error rendering screener page: {e}")
         return HTMLResponse(f"<h1>Error: {e}</h1>", status_code=500)
+
+
+@router.get("/screener_cache.json")
+def screener_cache_file(
+    scope: str = Query("france"),
+    mode: str = Query("standard"),
+):
+    """Raw screener cache file, used as a fallback by the screener page.
+    FileResponse streams it from disk in chunks rather than reading it
+    into memory first."""
+    if not (re.fullmatch(r'\w+', scope) and re.fullmatch(r'\w+', mode)):
+        return JSONResponse(status_code=400, content={'success': False, 'error': 'Invalid scope or mode'})
+    path = _screener_cache_path(scope, mode)
+    if not path.exists():
+        return JSONResponse(status_code=404, content={'success': False, 'error': 'Screener cache not found'})
+    return FileResponse(path, media_type='application/json')
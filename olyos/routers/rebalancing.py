@@ -1,9 +1,12 @@
 """Rebalancing API Router - Portfolio balance checking and trade proposals."""
 
+from functools import lru_cache
+from typing import Optional
+
 from fastapi import APIRouter, Depends, Query
 from fastapi.responses import JSONResponse
 
-from olyos.dependencies import get_rebalancing_service, get_portfolio_service
+from olyos.dependencies import PATHS, get_rebalancing_service, get_portfolio_service
 from olyos.services.rebalancing import RebalancingService
 from olyos.services.portfolio_service import PortfolioService
 from olyos.logger import get_logger
@@ -12,6 +15,25 @@ log = get_logger('router.rebalancing')
 router = APIRouter(prefix="/api/rebalancing", tags=["rebalancing"])
 
 
+def _portfolio_mtime() -> Optional[int]:
+    try:
+        return PATHS.portfolio_file.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+@lru_cache(maxsize=16)
+def _propose(service: RebalancingService, portfolio_svc: PortfolioService,
+             method: str, portfolio_mtime: Optional[int]):
+    """Positions, total value and trade proposals for a weighting method.
+    Shared by /propose and /simulate; portfolio_mtime invalidates the cache
+    whenever the portfolio file is rewritten."""
+    positions, total_value = portfolio_svc.get_positions_list(include_metrics=False)
+    target_weights = service.calculate_target_weights(positions, method)
+    proposals = service.propose_rebalancing(positions, target_weights, total_value)
+    return positions, total_value, proposals
+
+
 @router.get("/check")
 def rebalance_check(
     service: RebalancingService = Depends(get_rebalancing_service),
@@ -43,9 +65,7 @@ def rebalance_propose(
 ):
     """Get trade proposals for rebalancing."""
     try:
-        positions, total_value = portfolio_svc.get_positions_list(include_metrics=False)
-        target_weights = service.calculate_target_weights(positions, method)
-        proposals = service.propose_rebalancing(positions, target_weights, total_value)
+        positions, total_value, proposals = _propose(service, portfolio_svc, method, _portfolio_mtime())
 
         total_buy = sum(t.trade_value for t in proposals if t.trade_value > 0)
         total_sell = sum(abs(t.trade_value) for t in proposals if t.trade_value < 0)
@@ -89,9 +109,7 @@ def rebalance_simulate(
 ):
     """Simulate trade impact."""
     try:
-        positions, total_value = portfolio_svc.get_positions_list(include_metrics=False)
-        target_weights = service.calculate_target_weights(positions, method)
-        proposals = service.propose_rebalancing(positions, target_weights, total_value)
+        positions, total_value, proposals = _propose(service, portfolio_svc, method, _portfolio_mtime())
         simulation = service.simulate_trades(positions, proposals)
         return {'success': True, 'data': simulation}
     except Exception as e:
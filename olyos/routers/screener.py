@@ -1,9 +1,11 @@
 """Screener API Router - Stock screener, data refresh, heatmap."""
 
+import json
+import queue
 import threading
 
 from fastapi import APIRouter, Depends, Query
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 
 from olyos.dependencies import get_portfolio_service
 from olyos.services.portfolio_service import PortfolioService
@@ -12,6 +14,50 @@ from olyos.logger import get_logger
 log = get_logger('router.screener')
 router = APIRouter(prefix="/api/screener", tags=["screener"])
 
+# Single long-lived worker for screener refreshes: reuses one thread and
+# queues overlapping refresh requests instead of running them concurrently.
+# It is a daemon thread so shutdown never waits on a refresh in progress.
+_REFRESH_QUEUE: "queue.SimpleQueue" = queue.SimpleQueue()
+_REFRESH_LOCK = threading.Lock()
+_refresh_worker = None
+
+
+def _run_refresh_jobs():
+    """Worker loop: run queued refresh jobs one at a time."""
+    while True:
+        job = _REFRESH_QUEUE.get()
+        job()
+
+
+def _submit_refresh(job):
+    """Queue job for the refresh worker, starting the worker on first use."""
+    global _refresh_worker
+    with _REFRESH_LOCK:
+        if _refresh_worker is None or not _refresh_worker.is_alive():
+            _refresh_worker = threading.Thread(
+                target=_run_refresh_jobs, name='refresh', daemon=True
+            )
+            _refresh_worker.start()
+    _REFRESH_QUEUE.put(job)
+
+
+def _dumps(obj) -> str:
+    """Compact JSON encoding matching FastAPI's JSONResponse settings."""
+    return json.dumps(obj, ensure_ascii=False, allow_nan=False, separators=(",", ":"))
+
+
+def _iter_heatmap_json(prefix: str, groups: list):
+    """Yield the heatmap response body one group at a time.
+
+    The groups array is the largest part of the payload; emitting it
+    incrementally lets the socket send overlap with serialization instead
+    of building the whole document in memory first.
+    """
+    yield prefix
+    for i, group in enumerate(groups):
+        yield (',' if i else '') + _dumps(group)
+    yield ']}}'
+
 
 @router.get("/data")
 def screener_json(
@@ -51,8 +97,7 @@ def refresh_screener_data(
             except Exception as e:
                 log.error(f"Background refresh error: {e}")
 
-        t = threading.Thread(target=_refresh, daemon=True)
-        t.start()
+        _submit_refresh(_refresh)
         return {'success': True, 'message': 'Refresh started'}
     except Exception as e:
         log.error(f"Error starting refresh: {e}")
@@ -81,29 +126,21 @@ def heatmap_data(
     try:
         positions, total_value = portfolio_svc.get_heatmap_positions()
 
-        # Group positions by the requested grouping field
-        from collections import defaultdict
-        grouped = defaultdict(lambda: {'positions': [], 'value': 0})
-        for p in positions:
-            key = p.get(grouping, 'Other') or 'Other'
-            grouped[key]['positions'].append(p)
-            grouped[key]['value'] += p.get('value', 0)
-
-        groups = [
-            {'name': name, 'value': round(g['value'], 2), 'positions': g['positions']}
-            for name, g in sorted(grouped.items(), key=lambda x: -x[1]['value'])
-        ]
-
-        return {
-            'success': True,
-            'data': {
-                'metric': metric,
-                'grouping': grouping,
-                'total_value': round(total_value, 0),
-                'positions': positions,
-                'groups': groups,
-            },
+        groups = portfolio_svc.group_positions(positions, grouping, total_value)
+
+        head = {
+            'metric': metric,
+            'grouping': grouping,
+            'total_value': round(total_value, 0),
         }
+        # Encode the head eagerly so invalid values still surface as a 500
+        # here rather than as a truncated stream.
+        prefix = ('{"success":true,"data":' + _dumps(head)[:-1]
+                  + ',"positions":' + _dumps(positions) + ',"groups":[')
+        return StreamingResponse(
+            _iter_heatmap_json(prefix, groups),
+            media_type='application/json',
+        )
     except Exception as e:
         log.error(f"Error getting heatmap data: {e}")
         return JSONResponse(status_code=500, content={'success': False, 'error': str(e)})
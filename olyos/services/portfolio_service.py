@@ -4,12 +4,66 @@ Eliminates the duplicated load_portfolio + iterate pattern found ~8 times in app
 """
 
 import math
+from operator import itemgetter
 from typing import Dict, List, Optional, Tuple, Any
 
+import numpy as np
+import pandas as pd
+
 from olyos.logger import get_logger
 
 log = get_logger('portfolio_service')
 
+# Candidate column names for metrics, in order of preference
+PE_COLUMNS = ('pe', 'pe_ttm', 'trailing_pe')
+ROE_COLUMNS = ('roe', 'roe_ttm')
+
+
+def _numeric_column(df, candidates) -> np.ndarray:
+    """Coalesce candidate columns into one float array, resolved once per
+    call. Each row takes its first non-null candidate (like a per-row
+    probe would); non-numeric values count as missing and unresolved rows
+    are NaN."""
+    result = None
+    for col in candidates:
+        if col in df.columns:
+            series = pd.to_numeric(df[col], errors='coerce')
+            result = series if result is None else result.fillna(series)
+    if result is None:
+        return np.full(len(df), np.nan)
+    return result.to_numpy(dtype=float)
+
+
+def _iter_rows(df):
+    """Yield each row as a plain dict. itertuples() avoids building a Series
+    per row like iterrows() does, and the dict keeps row.get(col, default)
+    fallbacks working unchanged."""
+    columns = list(df.columns)
+    for values in df.itertuples(index=False, name=None):
+        yield dict(zip(columns, values))
+
+
+def _position_values(df) -> Tuple[np.ndarray, np.ndarray, np.ndarray, float]:
+    """Vectorized qty, price and value arrays plus the total value of held
+    positions (qty > 0). Missing or non-numeric cells count as 0."""
+    qty = np.nan_to_num(_numeric_column(df, ('qty',)))
+    price = np.nan_to_num(_numeric_column(df, ('price_eur',)))
+    value = qty * price
+    total_value = float(value[qty > 0].sum())
+    return qty, price, value, total_value
+
+
+def _weights(value: np.ndarray, total_value: float) -> np.ndarray:
+    """Portfolio weights in percent, 0 when the portfolio has no value."""
+    if total_value > 0:
+        return value * 100 / total_value
+    return np.zeros(len(value))
+
+
+def _nan_to_none(val: float) -> Optional[float]:
+    """Convert a NaN from a numeric column to None for JSON output."""
+    return None if math.isnan(val) else float(val)
+
 
 class PortfolioService:
     """Centralized portfolio data access."""
@@ -45,7 +99,7 @@ class PortfolioService:
         price_data = {}
         name_data = {}
         if df is not None:
-            for _, row in df.iterrows():
+            for row in _iter_rows(df):
                 ticker = row.get('ticker', '').upper()
                 if ticker:
                     price_data[ticker] = float(row.get('price_eur', 0) or 0)
@@ -58,16 +112,19 @@ class PortfolioService:
         This pattern was duplicated in rebalancing and heatmap endpoints."""
         df = self.load_dataframe_or_raise()
         positions = []
-        total_value = 0.0
+        qty_arr, price_arr, value_arr, total_value = _position_values(df)
+        weight_arr = _weights(value_arr, total_value)
 
-        for _, row in df.iterrows():
-            qty = float(row.get('qty', 0) or 0)
-            if qty <= 0:
+        if include_metrics:
+            pe_arr = _numeric_column(df, PE_COLUMNS)
+            roe_arr = _numeric_column(df, ROE_COLUMNS)
+
+        for i, row in enumerate(_iter_rows(df)):
+            if qty_arr[i] <= 0:
                 continue
 
-            price = float(row.get('price_eur', 0) or 0)
-            value = price * qty
-            total_value += value
+            price = float(price_arr[i])
+            value = float(value_arr[i])
 
             pos_data = {
                 'ticker': str(row.get('ticker', '')),
@@ -79,42 +136,25 @@ class PortfolioService:
             }
 
             if include_metrics:
-                # PE
-                pe = None
-                for col in ['pe', 'pe_ttm', 'trailing_pe']:
-                    if col in df.columns:
-                        val = row.get(col)
-                        if val is not None and not (isinstance(val, float) and math.isnan(val)):
-                            pe = float(val)
-                            break
-                pos_data['pe'] = pe
-
-                # ROE
-                roe = None
-                for col in ['roe', 'roe_ttm']:
-                    if col in df.columns:
-                        val = row.get(col)
-                        if val is not None and not (isinstance(val, float) and math.isnan(val)):
-                            roe = float(val)
-                            if -1 < roe < 1:
-                                roe = roe * 100
-                            break
+                pos_data['pe'] = _nan_to_none(pe_arr[i])
+
+                # ROE (fractions are converted to percentages)
+                roe = _nan_to_none(roe_arr[i])
+                if roe is not None and -1 < roe < 1:
+                    roe = roe * 100
                 pos_data['roe'] = roe
                 pos_data['verdict'] = str(row.get('verdict', '') or '')
 
+            pos_data['weight'] = float(weight_arr[i])
             positions.append(pos_data)
 
-        # Add weights
-        for pos in positions:
-            pos['weight'] = (pos['value'] / total_value * 100) if total_value > 0 else 0
-
         return positions, total_value
 
     def get_dividend_positions(self, include_price: bool = True) -> List[Dict]:
         """Build positions list for dividends service."""
         df = self.load_dataframe_or_raise()
         positions = []
-        for _, row in df.iterrows():
+        for row in _iter_rows(df):
             pos = {
                 'ticker': row.get('ticker', ''),
                 'name': row.get('name', row.get('ticker', '')),
@@ -134,7 +174,7 @@ class PortfolioService:
 
         df, _ = self._load_portfolio()
         if df is not None and 'ticker' in df.columns:
-            for _, row in df.iterrows():
+            for row in _iter_rows(df):
                 t = row.get('ticker', '').upper()
                 if t:
                     tickers.append(t)
@@ -156,16 +196,17 @@ class PortfolioService:
         """Build positions list with full metrics for heatmap visualization."""
         df = self.load_dataframe_or_raise()
         positions = []
-        total_value = 0.0
+        qty_arr, price_arr, value_arr, total_value = _position_values(df)
+        weight_arr = _weights(value_arr, total_value)
+        pe_arr = _numeric_column(df, PE_COLUMNS)
 
-        for _, row in df.iterrows():
-            qty = float(row.get('qty', 0) or 0)
+        for i, row in enumerate(_iter_rows(df)):
+            qty = float(qty_arr[i])
             if qty <= 0:
                 continue
 
-            price = float(row.get('price_eur', 0) or 0)
-            value = price * qty
-            total_value += value
+            price = float(price_arr[i])
+            value = float(value_arr[i])
 
             cost = float(row.get('avg_cost_eur', 0) or 0)
             total_cost = cost * qty
@@ -179,13 +220,7 @@ class PortfolioService:
             if -1 < ytd_pct < 1 and ytd_pct != 0:
                 ytd_pct = ytd_pct * 100
 
-            pe = None
-            for col in ['pe', 'pe_ttm', 'trailing_pe']:
-                if col in df.columns:
-                    val = row.get(col)
-                    if val is not None and not (isinstance(val, float) and math.isnan(val)):
-                        pe = float(val)
-                        break
+            pe = _nan_to_none(pe_arr[i])
 
             pos_data = {
                 'ticker': str(row.get('ticker', '')),
@@ -200,14 +235,46 @@ class PortfolioService:
                 'pnl_pct': pnl_pct,
                 'pe': pe,
                 'higgons_score': int(row.get('score_higgons', row.get('higgons_score', 5)) or 5),
+                'weight': float(weight_arr[i]),
             }
             positions.append(pos_data)
 
-        for pos in positions:
-            pos['weight'] = (pos['value'] / total_value * 100) if total_value > 0 else 0
-
         return positions, total_value
 
+    @staticmethod
+    def group_positions(positions: List[Dict], grouping: str, total_value: float = 0.0) -> List[Dict]:
+        """Group positions by a field (sector, country...) for the heatmap.
+        Value sums and value-weighted daily change are aggregated in one
+        pandas groupby. Groups, and the positions inside each group, are
+        returned sorted by value, descending, as the treemap layout expects."""
+        if not positions:
+            return []
+
+        keys = [p.get(grouping, 'Other') or 'Other' for p in positions]
+        pf = pd.DataFrame({
+            'value': [p.get('value', 0) for p in positions],
+            'change_pct': [p.get('change_pct', 0) for p in positions],
+        })
+        pf['vc'] = pf['value'] * pf['change_pct']
+
+        grouped = pf.groupby(keys, sort=False)
+        agg = grouped.agg(value=('value', 'sum'), vc=('vc', 'sum'))
+        agg = agg.sort_values('value', ascending=False, kind='stable')
+        members = grouped.indices
+        by_value = itemgetter('value')
+
+        groups = []
+        for name, value, vc in agg.itertuples():
+            value = float(value)
+            groups.append({
+                'name': name,
+                'value': round(value, 2),
+                'weight': (value / total_value * 100) if total_value > 0 else 0,
+                'change_pct': (float(vc) / value) if value else 0,
+                'positions': sorted((positions[i] for i in members[name]), key=by_value, reverse=True),
+            })
+        return groups
+
     def sync_transaction_to_portfolio(self, ticker: str, txn_type: str, quantity: float, price: float):
         """Sync a transaction to portfolio.xlsx (update qty and avg cost)."""
         try:
@@ -0,0 +1,138 @@
+"""
+Unit tests for olyos/app.py helpers.
+
+Tests cover:
+- Memo lookup (find_memo) pattern priority
+- Yahoo ticker mapping (get_yf_ticker)
+- Parsed portfolio sidecar (JSON round trip, size/mtime key)
+- AI optimal filter (filter_ai_optimal) with config.AI_OPTIMAL_CRITERIA
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Import the module under test
+import sys
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from olyos import app
+
+
+def _touch(directory, *names):
+    for name in names:
+        open(os.path.join(directory, name), 'w').close()
+
+
+# =============================================================================
+# FIND_MEMO TESTS
+# =============================================================================
+
+class TestFindMemo:
+    """Tests for find_memo() function."""
+
+    def test_ticker_patterns_in_priority_order(self, temp_dir, monkeypatch):
+        """Test Memo_STEF* wins over Investment_Memo_STEF* whatever the listing order."""
+        monkeypatch.setitem(app.CONFIG, 'memo_dir', temp_dir)
+        _touch(temp_dir, 'Investment_Memo_STEF_2024.docx', 'Memo_STEF_v2.docx')
+        assert app.find_memo('STF.PA') == os.path.join(temp_dir, 'Memo_STEF_v2.docx')
+
+    def test_generic_patterns(self, temp_dir, monkeypatch):
+        """Test tickers without configured patterns use the generic globs in order."""
+        monkeypatch.setitem(app.CONFIG, 'memo_dir', temp_dir)
+        _touch(temp_dir, 'Memo_x_ABC.docx', 'Investment_Memo_ABC.docx')
+        assert app.find_memo('ABC.PA') == os.path.join(temp_dir, 'Investment_Memo_ABC.docx')
+
+    def test_missing_directory(self, temp_dir, monkeypatch):
+        """Test a missing memo directory returns None."""
+        monkeypatch.setitem(app.CONFIG, 'memo_dir', os.path.join(temp_dir, 'missing'))
+        assert app.find_memo('STF.PA') is None
+
+
+# =============================================================================
+# GET_YF_TICKER TESTS
+# =============================================================================
+
+class TestGetYfTicker:
+    """Tests for get_yf_ticker() function."""
+
+    def test_mapped_ticker(self):
+        """Test special tickers come from config.TICKER_MAP."""
+        assert app.get_yf_ticker('SIP') == 'SIP.BR'
+        assert app.get_yf_ticker('catg') == 'ALCAT.PA'
+
+    def test_default_and_suffixed(self):
+        """Test unknown tickers default to Paris and suffixed ones pass through."""
+        assert app.get_yf_ticker('XYZ') == 'XYZ.PA'
+        assert app.get_yf_ticker('SAP.DE') == 'SAP.DE'
+
+
+# =============================================================================
+# PORTFOLIO SIDECAR TESTS
+# =============================================================================
+
+class TestPortfolioSidecar:
+    """Tests for the parsed-portfolio JSON sidecar."""
+
+    @pytest.fixture
+    def portfolio_file(self, temp_dir, monkeypatch):
+        path = os.path.join(temp_dir, 'portfolio.xlsx')
+        monkeypatch.setitem(app.CONFIG, 'portfolio_file', path)
+        return path
+
+    def test_round_trip_keeps_values_and_dtypes(self, portfolio_file):
+        """Test a frame read back from the sidecar equals the one written."""
+        df = pd.DataFrame({
+            'ticker': ['AI.PA', 'MC.PA', None],
+            'qty': [10, 'x', 3.5],
+            'price_eur': [150.2, np.nan, 2.0],
+            'score_higgons': [7, 5, 3],
+            'date': pd.to_datetime(['2024-01-01', None, '2024-03-01']),
+            'name': ['Air Liquide', 'LVMH é', 'Autre'],
+        })
+        app._write_portfolio_sidecar([123, 456], df)
+
+        assert os.path.basename(app._portfolio_sidecar_path()) == 'portfolio.cache.json'
+        pd.testing.assert_frame_equal(app._read_portfolio_sidecar([123, 456]), df)
+
+    def test_stale_stamp_ignored(self, portfolio_file):
+        """Test a size or mtime change invalidates the sidecar."""
+        app._write_portfolio_sidecar([123, 456], pd.DataFrame({'qty': [1]}))
+        assert app._read_portfolio_sidecar([124, 456]) is None
+        assert app._read_portfolio_sidecar([123, 457]) is None
+
+    def test_missing_or_corrupt_sidecar(self, portfolio_file):
+        """Test an absent or unreadable sidecar is a cache miss."""
+        assert app._read_portfolio_sidecar([1, 2]) is None
+        with open(app._portfolio_sidecar_path(), 'w', encoding='utf-8') as f:
+            f.write('{not json')
+        assert app._read_portfolio_sidecar([1, 2]) is None
+
+
+# =============================================================================
+# FILTER_AI_OPTIMAL TESTS
+# =============================================================================
+
+class TestFilterAiOptimal:
+    """Tests for filter_ai_optimal() with the config criteria."""
+
+    def test_config_criteria(self):
+        """Test the AICriteria thresholds, ratio/percent ROE and D/E, and ordering."""
+        results = [
+            {'ticker': 'A', 'pe': 7, 'roe': 0.15, 'debt_equity': 0.3, 'score': 60},
+            {'ticker': 'B', 'pe': 6, 'roe': 20, 'debt_equity': 40, 'score': 80},
+            {'ticker': 'C', 'pe': 9, 'roe': 0.30, 'debt_equity': 0.1, 'score': 90},
+            {'ticker': 'D', 'pe': 5, 'roe': 0.10, 'debt_equity': 0.1, 'score': 90},
+            {'ticker': 'E', 'pe': 5, 'roe': 0.20, 'debt_equity': 0.6, 'score': 90},
+        ]
+        filtered = app.filter_ai_optimal(results, app.config.AI_OPTIMAL_CRITERIA)
+        assert [r['ticker'] for r in filtered] == ['B', 'A']
+        assert all(r['signal'] == 'AI BUY' for r in filtered)
+
+    def test_max_positions(self):
+        """Test only the top max_positions candidates are kept."""
+        criteria = app.config.AI_OPTIMAL_CRITERIA._replace(max_positions=2)
+        results = [{'ticker': str(i), 'pe': 5, 'roe': 20, 'debt_equity': 10, 'score': i} for i in range(5)]
+        assert [r['ticker'] for r in app.filter_ai_optimal(results, criteria)] == ['4', '3']
@@ -0,0 +1,106 @@
+"""
+Unit tests for olyos/config.py module.
+
+Tests cover:
+- Memo glob matching (compile_memo_patterns, match_memo_name)
+- Memo section title matching (MEMO_SECTION_RE)
+- Lazy static tables (PEP 562 module __getattr__)
+"""
+
+import os
+import random
+
+import pytest
+
+# Import the module under test
+import sys
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from olyos import config
+from olyos.config import compile_memo_patterns, match_memo_name
+
+
+# =============================================================================
+# MEMO PATTERN TESTS
+# =============================================================================
+
+def _reference_match(patterns, names):
+    """Trying each glob in turn, as the glob.glob loop did (POSIX case rules)."""
+    import fnmatch
+    for pattern in patterns:
+        for name in names:
+            if fnmatch.fnmatchcase(name, pattern):
+                return name
+    return None
+
+
+class TestMemoPatterns:
+    """Tests for compile_memo_patterns() and match_memo_name()."""
+
+    def test_pattern_priority_beats_listing_order(self):
+        """Test the first glob wins even if a later glob matches earlier in the listing."""
+        names = ['Investment_Memo_STEF_2024.docx', 'Memo_Stef_old.docx', 'Memo_STEF_v2.docx']
+        pattern_re = compile_memo_patterns(('Memo_STEF*', 'Investment_Memo_STEF*', 'Memo_Stef*'))
+        assert match_memo_name(pattern_re, names) == 'Memo_STEF_v2.docx'
+
+    def test_falls_back_to_later_patterns(self):
+        """Test a lower-priority glob is used when the first one has no match."""
+        names = ['notes.txt', 'Memo_Stef_old.docx', 'Investment_Memo_STEF_2024.docx']
+        pattern_re = compile_memo_patterns(('Memo_STEF*', 'Investment_Memo_STEF*', 'Memo_Stef*'))
+        assert match_memo_name(pattern_re, names) == 'Investment_Memo_STEF_2024.docx'
+
+    def test_no_match(self):
+        """Test None when nothing matches."""
+        pattern_re = compile_memo_patterns(('Memo_GTT*',))
+        assert match_memo_name(pattern_re, ['Memo_ABC.docx']) is None
+
+    @pytest.mark.skipif(os.path.normcase('A') != 'A', reason="case-sensitive filesystems only")
+    def test_matches_glob_loop(self):
+        """Test random listings give the same result as the per-glob loop."""
+        rng = random.Random(7)
+        pool = ['Memo_ABC.docx', 'Investment_Memo_ABC.docx', 'Memo_x_ABC.docx', 'memo_abc.docx',
+                'Memo_ABCD.pdf', 'README.md', 'Investment_Memo_XYZ.docx']
+        patterns = ('Memo_ABC*', 'Investment_Memo_ABC*', 'Memo_*ABC*')
+        pattern_re = compile_memo_patterns(patterns)
+        for _ in range(200):
+            names = rng.sample(pool, rng.randint(0, len(pool)))
+            assert match_memo_name(pattern_re, names) == _reference_match(patterns, names)
+
+    def test_ticker_patterns_keep_order(self):
+        """Test MEMO_PATTERNS_RE ranks each ticker's globs in MEMO_PATTERNS order."""
+        names = ['Investment_Memo_Carmila.docx', 'Memo_Carmila.docx']
+        assert match_memo_name(config.MEMO_PATTERNS_RE['CARM.PA'], names) == 'Memo_Carmila.docx'
+
+
+# =============================================================================
+# MEMO SECTION TESTS
+# =============================================================================
+
+class TestMemoSectionRe:
+    """Tests for MEMO_SECTION_RE."""
+
+    @pytest.mark.parametrize("text", [
+        "1. Resume executif", "RISQUES PRINCIPAUX", "Key risks", "Profile de la societe",
+        "Points forts", "Notes diverses", "Chiffre d'affaires 2024", "",
+    ])
+    def test_matches_keyword_substring_scan(self, text):
+        """Test the regex agrees with scanning the keywords in text.upper()."""
+        expected = any(kw in text.upper() for kw in config.MEMO_SECTION_KEYWORDS)
+        assert bool(config.MEMO_SECTION_RE.search(text)) == expected
+
+
+# =============================================================================
+# LAZY STATIC DATA TESTS
+# =============================================================================
+
+class TestLazyStaticData:
+    """Tests for the PEP 562 lazy tables."""
+
+    def test_ticker_map_available(self):
+        """Test TICKER_MAP resolves through the module __getattr__."""
+        assert config.TICKER_MAP['SIP'] == 'SIP.BR'
+
+    def test_unknown_attribute_raises(self):
+        """Test unknown names still raise AttributeError."""
+        with pytest.raises(AttributeError):
+            config.NOT_A_SETTING
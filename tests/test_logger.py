@@ -0,0 +1,213 @@
+"""
+Unit tests for olyos/logger.py module.
+
+Tests cover:
+- Level names accepted by the log_* wrappers
+- JSON formatter output for extra fields
+- Buffered rotating file handler (byte-accurate rotation, flushing)
+- Queue handler record preparation
+- configure() after disable_console()
+"""
+
+import json
+import logging
+import os
+import queue
+import time
+from datetime import datetime
+
+import pytest
+
+# Import the module under test
+import sys
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from olyos import logger as olyos_logger
+from olyos.logger import (
+    BufferedRotatingFileHandler, JSONFormatter, _RecordQueueHandler, log_api,
+)
+
+
+def _record(msg="message", level=logging.INFO, **extra):
+    record = logging.LogRecord("olyos.test", level, __file__, 1, msg, None, None)
+    record.__dict__.update(extra)
+    return record
+
+
+# =============================================================================
+# LEVEL NAME TESTS
+# =============================================================================
+
+class TestLevelNames:
+    """Tests for level names in the log_* wrappers."""
+
+    @pytest.mark.parametrize("name,levelno", [
+        ("INFO", logging.INFO),
+        ("debug", logging.DEBUG),
+        ("Warning", logging.WARNING),
+        ("warn", logging.WARNING),
+        ("fatal", logging.CRITICAL),
+        ("exception", logging.ERROR),
+    ])
+    def test_known_names(self, name, levelno):
+        """Test standard names and logger-method aliases resolve."""
+        assert olyos_logger._LEVEL_LOOKUP[name.lower()] == levelno
+
+    def test_unknown_name_raises(self):
+        """Test an unknown level is rejected rather than logged as INFO."""
+        with pytest.raises(ValueError):
+            log_api("message", level="verbose")
+
+
+# =============================================================================
+# JSON FORMATTER TESTS
+# =============================================================================
+
+class TestJSONFormatter:
+    """Tests for JSONFormatter."""
+
+    def test_extra_fields_included(self):
+        """Test extra attributes land under 'extra'."""
+        data = json.loads(JSONFormatter().format(_record(ticker="AI.PA", count=3)))
+        assert data["extra"] == {"ticker": "AI.PA", "count": 3}
+        assert data["message"] == "message"
+
+    def test_no_extra_key_without_extra_fields(self):
+        """Test records without extra attributes get no 'extra' key."""
+        data = json.loads(JSONFormatter().format(_record()))
+        assert "extra" not in data
+        assert data["level"] == "INFO"
+
+    def test_naive_datetime_not_marked_utc(self):
+        """Test naive datetimes in extra fields keep no UTC offset."""
+        data = json.loads(JSONFormatter().format(_record(at=datetime(2026, 1, 1, 12))))
+        assert "+00:00" not in data["extra"]["at"]
+        assert data["extra"]["at"].startswith("2026-01-01")
+
+
+# =============================================================================
+# BUFFERED ROTATING FILE HANDLER TESTS
+# =============================================================================
+
+class TestBufferedRotatingFileHandler:
+    """Tests for BufferedRotatingFileHandler."""
+
+    def _logger(self, handler):
+        log = logging.getLogger(f"olyos.test.buffered.{id(handler)}")
+        log.propagate = False
+        log.setLevel(logging.INFO)
+        log.addHandler(handler)
+        return log
+
+    def test_rotation_counts_encoded_bytes(self, temp_dir):
+        """Test rotated files stay under maxBytes with multi-byte text."""
+        path = os.path.join(temp_dir, "olyos.log")
+        handler = BufferedRotatingFileHandler(path, maxBytes=2000, backupCount=5, encoding="utf-8")
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        log = self._logger(handler)
+        for i in range(200):
+            log.info("rééquilibrage du portefeuille é è à %d", i)
+        handler.close()
+
+        files = sorted(os.listdir(temp_dir))
+        assert len(files) > 1
+        for name in files:
+            assert os.path.getsize(os.path.join(temp_dir, name)) <= 2000
+
+    def test_warning_flushes_immediately(self, temp_dir):
+        """Test WARNING records reach the file without waiting."""
+        path = os.path.join(temp_dir, "olyos.log")
+        handler = BufferedRotatingFileHandler(path, encoding="utf-8", flush_interval=60)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        self._logger(handler).warning("alerte")
+        try:
+            with open(path, encoding="utf-8") as f:
+                assert f.read() == "alerte\n"
+        finally:
+            handler.close()
+
+    def test_info_buffered_until_close(self, temp_dir):
+        """Test INFO records are held in the buffer and written on close."""
+        path = os.path.join(temp_dir, "olyos.log")
+        handler = BufferedRotatingFileHandler(path, encoding="utf-8", flush_interval=60)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        self._logger(handler).info("info")
+        assert os.path.getsize(path) == 0
+        handler.close()
+        with open(path, encoding="utf-8") as f:
+            assert f.read() == "info\n"
+
+    def test_info_flushed_by_background_thread(self, temp_dir):
+        """Test buffered records are flushed after flush_interval."""
+        path = os.path.join(temp_dir, "olyos.log")
+        handler = BufferedRotatingFileHandler(path, encoding="utf-8", flush_interval=0.05)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        self._logger(handler).info("info")
+        try:
+            deadline = time.time() + 5
+            while os.path.getsize(path) == 0 and time.time() < deadline:
+                time.sleep(0.02)
+            with open(path, encoding="utf-8") as f:
+                assert f.read() == "info\n"
+        finally:
+            handler.close()
+        handler._flusher.join(timeout=5)
+        assert not handler._flusher.is_alive()
+
+
+# =============================================================================
+# QUEUE HANDLER TESTS
+# =============================================================================
+
+class TestRecordQueueHandler:
+    """Tests for _RecordQueueHandler."""
+
+    def test_handle_enqueues_merged_record(self):
+        """Test handle() enqueues a copy with msg and args merged."""
+        q = queue.SimpleQueue()
+        handler = _RecordQueueHandler(q)
+        assert handler.lock is not None
+
+        record = logging.LogRecord("olyos.test", logging.INFO, __file__, 1, "a %s", ("b",), None)
+        handler.handle(record)
+
+        queued = q.get_nowait()
+        assert queued.msg == "a b"
+        assert queued.args is None
+        assert record.args == ("b",)
+
+
+# =============================================================================
+# CONFIGURE TESTS
+# =============================================================================
+
+class TestConfigure:
+    """Tests for configure() and the console switch."""
+
+    @pytest.fixture(autouse=True)
+    def restore_config(self):
+        saved = dict(vars(olyos_logger._config))
+        yield
+        olyos_logger.configure(**saved)
+
+    def _console_handlers(self):
+        return [h for h in olyos_logger._listener.handlers
+                if isinstance(h, logging.StreamHandler) and not isinstance(h, logging.FileHandler)]
+
+    def test_configure_restores_disabled_console(self):
+        """Test configure() brings the console back after disable_console()."""
+        olyos_logger.configure(file_enabled=False)
+        olyos_logger.disable_console()
+        assert self._console_handlers() == []
+
+        olyos_logger.configure(file_enabled=False)
+        assert len(self._console_handlers()) == 1
+
+    def test_level_only_change_keeps_handlers(self):
+        """Test a level-only configure() reuses the running handlers."""
+        olyos_logger.configure(file_enabled=False)
+        handlers = olyos_logger._listener.handlers
+
+        olyos_logger.configure(level="DEBUG", file_enabled=False)
+        assert olyos_logger._listener.handlers is handlers
+        assert olyos_logger._config.level == logging.DEBUG
@@ -0,0 +1,279 @@
+"""
+Unit tests for olyos/olyos_portfolio_advisor.py module.
+
+Tests cover:
+- Yahoo symbol candidate order (_build_yahoo_candidates)
+- Portfolio metrics (compute_portfolio_metrics) against the former scalar loop
+- Concentration stats (analyze_concentration) against the former sort-based version
+- Per-fetch Yahoo caches (fetch_current_prices)
+"""
+
+import os
+import random
+
+import pandas as pd
+import pytest
+
+# Import the module under test
+import sys
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from olyos import olyos_portfolio_advisor as advisor
+from olyos.olyos_portfolio_advisor import (
+    _build_yahoo_candidates, _to_float, _normalize_category,
+    compute_portfolio_metrics, analyze_concentration, fetch_current_prices,
+)
+
+
+# =============================================================================
+# REFERENCE IMPLEMENTATIONS (pre-vectorization)
+# =============================================================================
+
+def _reference_compute_portfolio_metrics(portfolio, prices, cash=0.0, currency="EUR"):
+    """Two-pass scalar loop compute_portfolio_metrics replaced."""
+    rows = []
+    total_invested = 0.0
+    total_current_value = 0.0
+    for position in portfolio:
+        market = prices.get(position["ticker"], {})
+        current_price = _to_float(market.get("price"), None)
+        if current_price is None:
+            current_price = _to_float(position.get("current_price"), None)
+        if current_price is None:
+            current_price = _to_float(position.get("avg_price"), 0.0) or 0.0
+        shares = _to_float(position.get("shares"), 0.0) or 0.0
+        avg_price = _to_float(position.get("avg_price"), 0.0) or 0.0
+        cost_basis = shares * avg_price
+        current_value = shares * current_price
+        pnl_eur = current_value - cost_basis
+        total_invested += cost_basis
+        total_current_value += current_value
+        rows.append({
+            "ticker": position["ticker"],
+            "name": position.get("name"),
+            "category": _normalize_category(position.get("category")),
+            "sector": position.get("sector") or "Unknown",
+            "country": position.get("country") or "Unknown",
+            "shares": shares,
+            "avg_price": avg_price,
+            "current_price": current_price,
+            "cost_basis": cost_basis,
+            "current_value": current_value,
+            "pnl_eur": pnl_eur,
+            "pnl_pct": (pnl_eur / cost_basis) if cost_basis > 0 else 0.0,
+            "weight_pct": 0.0,
+            "vs_52w_high": None,
+            "vs_52w_low": None,
+        })
+    for row in rows:
+        market = prices.get(row["ticker"], {})
+        if total_current_value > 0:
+            row["weight_pct"] = row["current_value"] / total_current_value
+        high_52w = _to_float(market.get("52w_high"), None)
+        low_52w = _to_float(market.get("52w_low"), None)
+        px = row["current_price"]
+        if high_52w and high_52w > 0:
+            row["vs_52w_high"] = (px - high_52w) / high_52w
+        if low_52w and low_52w > 0:
+            row["vs_52w_low"] = (px - low_52w) / low_52w
+    total_pnl_eur = total_current_value - total_invested
+    return {
+        "currency": currency,
+        "cash": cash,
+        "total_invested": total_invested,
+        "total_current_value": total_current_value,
+        "total_value_with_cash": total_current_value + cash,
+        "total_pnl_eur": total_pnl_eur,
+        "total_pnl_pct": (total_pnl_eur / total_invested) if total_invested > 0 else 0.0,
+        "positions": rows,
+    }
+
+
+def _reference_analyze_concentration(metrics):
+    """Full-sort version analyze_concentration replaced."""
+    positions = metrics.get("positions", [])
+    sorted_positions = sorted(positions, key=lambda x: x.get("weight_pct", 0.0), reverse=True)
+    sector_breakdown = {}
+    country_breakdown = {}
+    for row in positions:
+        sector = row.get("sector") or "Unknown"
+        country = row.get("country") or "Unknown"
+        sector_breakdown[sector] = sector_breakdown.get(sector, 0.0) + row.get("weight_pct", 0.0)
+        country_breakdown[country] = country_breakdown.get(country, 0.0) + row.get("weight_pct", 0.0)
+    return {
+        "max_single_position": sorted_positions[0].get("weight_pct", 0.0),
+        "top3_concentration": sum(row.get("weight_pct", 0.0) for row in sorted_positions[:3]),
+        "sector_breakdown": sector_breakdown,
+        "country_breakdown": country_breakdown,
+    }
+
+
+def _random_inputs(seed, n=25):
+    """Random positions and prices, including missing and string values."""
+    rng = random.Random(seed)
+    portfolio, prices = [], {}
+    for i in range(n):
+        ticker = f"T{i}"
+        portfolio.append({
+            "ticker": ticker,
+            "name": f"Company {i}",
+            "category": rng.choice(["value", "Croissance", "cyclique", None, "other"]),
+            "sector": rng.choice(["Energy", "Industrials", None]),
+            "country": rng.choice(["FR", "DE", ""]),
+            "shares": rng.choice([rng.randint(1, 400), "12", None]),
+            "avg_price": rng.choice([round(rng.uniform(1, 200), 2), "45,5", 0]),
+            "current_price": rng.choice([None, round(rng.uniform(1, 200), 2)]),
+        })
+        if rng.random() < 0.8:
+            prices[ticker] = {
+                "price": rng.choice([round(rng.uniform(1, 200), 2), None]),
+                "52w_high": rng.choice([round(rng.uniform(50, 300), 2), None, 0, -1]),
+                "52w_low": rng.choice([round(rng.uniform(1, 50), 2), None]),
+            }
+    return portfolio, prices
+
+
+def _assert_close(got, want):
+    if isinstance(want, dict):
+        assert got.keys() == want.keys()
+        for key in want:
+            _assert_close(got[key], want[key])
+    elif isinstance(want, list):
+        assert len(got) == len(want)
+        for g, w in zip(got, want):
+            _assert_close(g, w)
+    elif isinstance(want, float):
+        assert got == pytest.approx(want)
+    else:
+        assert got == want
+
+
+# =============================================================================
+# CANDIDATE ORDER TESTS
+# =============================================================================
+
+class TestBuildYahooCandidates:
+    """Tests for _build_yahoo_candidates() function."""
+
+    def test_country_suffix_first(self):
+        """Test the country's listing is tried before Paris."""
+        assert _build_yahoo_candidates("sap", "DE") == ["SAP.DE", "SAP.PA", "SAP"]
+
+    def test_french_ticker_not_duplicated(self):
+        """Test .PA appears once for French tickers."""
+        assert _build_yahoo_candidates("AI", "FR") == ["AI.PA", "AI"]
+
+    def test_unknown_country_defaults_to_paris(self):
+        """Test tickers without a known country try Paris then the bare symbol."""
+        assert _build_yahoo_candidates(" MC ", None) == ["MC.PA", "MC"]
+        assert _build_yahoo_candidates("XYZ", "ZZ") == ["XYZ.PA", "XYZ"]
+
+    def test_explicit_suffix_kept(self):
+        """Test a symbol that already has a suffix is used as-is."""
+        assert _build_yahoo_candidates("asml.as", "FR") == ["ASML.AS"]
+
+
+# =============================================================================
+# PORTFOLIO METRICS TESTS
+# =============================================================================
+
+class TestComputePortfolioMetrics:
+    """Tests for compute_portfolio_metrics() function."""
+
+    @pytest.mark.parametrize("seed", range(10))
+    def test_matches_scalar_loop(self, seed):
+        """Test vectorized metrics match the former scalar loop."""
+        portfolio, prices = _random_inputs(seed)
+        got = compute_portfolio_metrics(portfolio, prices, cash=1000.0)
+        want = _reference_compute_portfolio_metrics(portfolio, prices, cash=1000.0)
+        _assert_close(got, want)
+
+    def test_empty_portfolio(self):
+        """Test an empty portfolio gives zero totals."""
+        result = compute_portfolio_metrics([], {}, cash=50.0)
+        assert result["positions"] == []
+        assert result["total_current_value"] == 0.0
+        assert result["total_value_with_cash"] == 50.0
+
+    def test_price_fallbacks(self):
+        """Test market price, then current_price, then avg_price."""
+        portfolio = [
+            {"ticker": "A", "shares": 1, "avg_price": 10.0, "current_price": 12.0},
+            {"ticker": "B", "shares": 1, "avg_price": 10.0, "current_price": 12.0},
+            {"ticker": "C", "shares": 1, "avg_price": 10.0},
+        ]
+        prices = {"A": {"price": 15.0}}
+        rows = compute_portfolio_metrics(portfolio, prices)["positions"]
+        assert [r["current_price"] for r in rows] == [15.0, 12.0, 10.0]
+
+
+# =============================================================================
+# CONCENTRATION TESTS
+# =============================================================================
+
+class TestAnalyzeConcentration:
+    """Tests for analyze_concentration() function."""
+
+    @pytest.mark.parametrize("seed", range(10))
+    def test_matches_sort_based_version(self, seed):
+        """Test heap-based top-3 and breakdowns match the full sort."""
+        portfolio, prices = _random_inputs(seed)
+        metrics = compute_portfolio_metrics(portfolio, prices)
+        got = analyze_concentration(metrics)
+        want = _reference_analyze_concentration(metrics)
+        for key, value in want.items():
+            _assert_close(got[key], value)
+
+    def test_fewer_than_three_positions(self):
+        """Test top-3 with fewer than three positions."""
+        metrics = {"positions": [{"weight_pct": 0.7, "sector": "Energy"}, {"weight_pct": 0.3}]}
+        result = analyze_concentration(metrics)
+        assert result["max_single_position"] == 0.7
+        assert result["top3_concentration"] == pytest.approx(1.0)
+        assert result["sector_breakdown"] == {"Energy": 0.7, "Unknown": 0.3}
+        assert "Position unique > 20% du portefeuille" in result["alerts"]
+
+    def test_empty(self):
+        """Test no positions gives empty stats."""
+        assert analyze_concentration({"positions": []})["alerts"] == []
+
+
+# =============================================================================
+# FETCH CACHE TESTS
+# =============================================================================
+
+class _FakeTicker:
+    calls = 0
+
+    def __init__(self, symbol):
+        self.info = {}
+
+    def history(self, **kwargs):
+        _FakeTicker.calls += 1
+        return pd.DataFrame({"Close": [100.0 + _FakeTicker.calls], "Volume": [1.0],
+                             "High": [200.0], "Low": [50.0]})
+
+
+class _FakeYF:
+    Ticker = _FakeTicker
+
+    @staticmethod
+    def download(*args, **kwargs):
+        raise RuntimeError("no batch download in tests")
+
+
+class TestFetchCurrentPrices:
+    """Tests for fetch_current_prices() caching."""
+
+    def test_history_refetched_after_ttl(self, temp_dir, monkeypatch):
+        """Test a new fetch does not reuse the previous fetch's history."""
+        monkeypatch.setattr(advisor, "yf", _FakeYF)
+        monkeypatch.setattr(advisor, "ADVISOR_SNAPSHOT_TTL_HOURS", 0)
+        monkeypatch.setattr(advisor, "ADVISOR_SNAPSHOT_CACHE_DIR", temp_dir)
+        _FakeTicker.calls = 0
+
+        first = fetch_current_prices(["AI.PA"])["AI.PA"]["price"]
+        second = fetch_current_prices(["AI.PA"])["AI.PA"]["price"]
+
+        assert _FakeTicker.calls == 2
+        assert second != first
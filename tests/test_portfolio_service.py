@@ -0,0 +1,233 @@
+"""
+Unit tests for olyos/services/portfolio_service.py module.
+
+Tests cover:
+- Position lists and weights (get_positions_list)
+- Non-numeric and missing qty/price cells
+- PE/ROE candidate column fallback
+- Heatmap grouping (group_positions) against the former dict-based grouping
+- Row-dict fallbacks (get_dividend_positions, get_all_tickers, get_price_name_data)
+"""
+
+import os
+import random
+from collections import defaultdict
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Import the module under test
+import sys
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from olyos.services.portfolio_service import PortfolioService
+
+
+def _service(df):
+    """PortfolioService over an in-memory DataFrame."""
+    return PortfolioService(lambda: (df, None), lambda _df: None, lambda: [])
+
+
+# =============================================================================
+# REFERENCE IMPLEMENTATIONS (pre-vectorization)
+# =============================================================================
+
+def _reference_positions_list(df):
+    """Row-by-row loop get_positions_list replaced (numeric cells only)."""
+    positions = []
+    total_value = 0.0
+    for _, row in df.iterrows():
+        qty = float(row.get('qty', 0) or 0)
+        if qty <= 0:
+            continue
+        price = float(row.get('price_eur', 0) or 0)
+        value = price * qty
+        total_value += value
+        positions.append({
+            'ticker': str(row.get('ticker', '')),
+            'name': str(row.get('name', '')),
+            'value': value,
+            'price': price,
+            'sector': str(row.get('sector', 'Other') or 'Other'),
+            'higgons_score': int(row.get('score_higgons', row.get('higgons_score', 5)) or 5),
+        })
+    for pos in positions:
+        pos['weight'] = (pos['value'] / total_value * 100) if total_value > 0 else 0
+    return positions, total_value
+
+
+def _reference_group_positions(positions, grouping):
+    """defaultdict grouping the heatmap router used before group_positions."""
+    grouped = defaultdict(lambda: {'positions': [], 'value': 0})
+    for p in positions:
+        key = p.get(grouping, 'Other') or 'Other'
+        grouped[key]['positions'].append(p)
+        grouped[key]['value'] += p.get('value', 0)
+    return [
+        {
+            'name': name,
+            'value': round(g['value'], 2),
+            'positions': sorted(g['positions'], key=lambda p: p['value'], reverse=True),
+        }
+        for name, g in sorted(grouped.items(), key=lambda x: -x[1]['value'])
+    ]
+
+
+def _random_portfolio(seed, n=40):
+    rng = random.Random(seed)
+    return pd.DataFrame({
+        'ticker': [f'T{i}.PA' for i in range(n)],
+        'name': [f'Company {i}' for i in range(n)],
+        'qty': [rng.choice([0, rng.randint(1, 500)]) for _ in range(n)],
+        'price_eur': [round(rng.uniform(1, 300), 2) for _ in range(n)],
+        'sector': [rng.choice(['Industrials', 'Energy', None, 'Tech']) for _ in range(n)],
+        'score_higgons': [rng.randint(0, 10) for _ in range(n)],
+    })
+
+
+# =============================================================================
+# GET_POSITIONS_LIST TESTS
+# =============================================================================
+
+class TestGetPositionsList:
+    """Tests for PortfolioService.get_positions_list()."""
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_matches_row_loop(self, seed):
+        """Test vectorized values and weights match the former row loop."""
+        df = _random_portfolio(seed)
+        positions, total = _service(df).get_positions_list()
+        expected, expected_total = _reference_positions_list(df)
+
+        assert total == pytest.approx(expected_total)
+        assert [p['ticker'] for p in positions] == [p['ticker'] for p in expected]
+        for got, want in zip(positions, expected):
+            assert got['value'] == pytest.approx(want['value'])
+            assert got['weight'] == pytest.approx(want['weight'])
+            assert got['sector'] == want['sector']
+            assert got['higgons_score'] == want['higgons_score']
+
+    def test_weights_sum_to_100(self):
+        """Test weights of held positions sum to 100%."""
+        positions, _ = _service(_random_portfolio(1)).get_positions_list()
+        assert sum(p['weight'] for p in positions) == pytest.approx(100.0)
+
+    def test_non_numeric_cells_count_as_zero(self):
+        """Test non-numeric qty is skipped and non-numeric/NaN price is 0."""
+        df = pd.DataFrame({
+            'ticker': ['A', 'B', 'C', 'D'],
+            'qty': [10, 'abc', 5, 4],
+            'price_eur': [10.0, 20.0, 'n/a', np.nan],
+        })
+        positions, total = _service(df).get_positions_list()
+
+        assert [p['ticker'] for p in positions] == ['A', 'C', 'D']
+        assert total == 100.0
+        assert [p['value'] for p in positions] == [100.0, 0.0, 0.0]
+        assert [p['weight'] for p in positions] == [100.0, 0.0, 0.0]
+
+    def test_metric_column_fallback(self):
+        """Test PE/ROE fall back to the next candidate column per row."""
+        df = pd.DataFrame({
+            'ticker': ['A', 'B', 'C'],
+            'qty': [1, 1, 1],
+            'price_eur': [10.0, 10.0, 10.0],
+            'pe': [8.0, np.nan, np.nan],
+            'pe_ttm': [9.0, 12.0, np.nan],
+            'roe_ttm': [0.15, 18.0, np.nan],
+        })
+        positions, _ = _service(df).get_positions_list(include_metrics=True)
+
+        assert [p['pe'] for p in positions] == [8.0, 12.0, None]
+        assert [p['roe'] for p in positions] == [pytest.approx(15.0), 18.0, None]
+
+    def test_non_numeric_metric_falls_back(self):
+        """Test a non-numeric PE cell counts as missing, not as an error."""
+        df = pd.DataFrame({
+            'ticker': ['A', 'B'],
+            'qty': [1, 1],
+            'price_eur': [10.0, 10.0],
+            'pe': ['n/a', '7.5'],
+            'trailing_pe': [11.0, 20.0],
+        })
+        positions, _ = _service(df).get_positions_list(include_metrics=True)
+        assert [p['pe'] for p in positions] == [11.0, 7.5]
+
+    def test_zero_total_gives_zero_weights(self):
+        """Test a portfolio with no value does not divide by zero."""
+        df = pd.DataFrame({'ticker': ['A'], 'qty': [3], 'price_eur': [0.0]})
+        positions, total = _service(df).get_positions_list()
+        assert total == 0.0
+        assert positions[0]['weight'] == 0.0
+
+
+# =============================================================================
+# GROUP_POSITIONS TESTS
+# =============================================================================
+
+class TestGroupPositions:
+    """Tests for PortfolioService.group_positions()."""
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_matches_dict_grouping(self, seed):
+        """Test groups, their order and members match the former grouping."""
+        df = _random_portfolio(seed)
+        df['country'] = [random.Random(seed + i).choice(['FR', 'DE', '']) for i in range(len(df))]
+        positions, total = _service(df).get_heatmap_positions()
+
+        for grouping in ('sector', 'country'):
+            groups = PortfolioService.group_positions(positions, grouping, total)
+            expected = _reference_group_positions(positions, grouping)
+            assert [g['name'] for g in groups] == [g['name'] for g in expected]
+            for got, want in zip(groups, expected):
+                assert got['value'] == pytest.approx(want['value'])
+                assert [p['ticker'] for p in got['positions']] == [p['ticker'] for p in want['positions']]
+
+    def test_weight_and_value_weighted_change(self):
+        """Test group weight and value-weighted daily change."""
+        positions = [
+            {'ticker': 'A', 'sector': 'Energy', 'value': 300.0, 'change_pct': 2.0},
+            {'ticker': 'B', 'sector': 'Energy', 'value': 100.0, 'change_pct': -2.0},
+            {'ticker': 'C', 'sector': None, 'value': 600.0, 'change_pct': 1.0},
+        ]
+        groups = PortfolioService.group_positions(positions, 'sector', 1000.0)
+
+        assert [g['name'] for g in groups] == ['Other', 'Energy']
+        energy = groups[1]
+        assert energy['weight'] == pytest.approx(40.0)
+        assert energy['change_pct'] == pytest.approx(1.0)
+        assert [p['ticker'] for p in energy['positions']] == ['A', 'B']
+
+    def test_empty(self):
+        """Test no positions gives no groups."""
+        assert PortfolioService.group_positions([], 'sector') == []
+
+
+# =============================================================================
+# ROW ITERATION TESTS
+# =============================================================================
+
+class TestRowFallbacks:
+    """Tests for the row.get(col, default) fallbacks over itertuples rows."""
+
+    def test_dividend_positions_fallback_columns(self):
+        """Test quantity/price/cost fall back to their alternate columns."""
+        df = pd.DataFrame({'ticker': ['AI.PA'], 'quantity': [4], 'price': [150.0], 'cost': [120.0]})
+        assert _service(df).get_dividend_positions() == [
+            {'ticker': 'AI.PA', 'name': 'AI.PA', 'quantity': 4, 'price': 150.0, 'cost': 120.0},
+        ]
+
+    def test_all_tickers_and_names(self):
+        """Test tickers are upper-cased and named from the name column."""
+        df = pd.DataFrame({'ticker': ['ai.pa', 'MC.PA'], 'name': ['Air Liquide', 'LVMH']})
+        tickers, names = _service(df).get_all_tickers()
+        assert tickers == ['AI.PA', 'MC.PA']
+        assert names == {'AI.PA': 'Air Liquide', 'MC.PA': 'LVMH'}
+
+    def test_price_name_data(self):
+        """Test price and name lookups keyed by upper-cased ticker."""
+        df = pd.DataFrame({'ticker': ['ai.pa', 'MC.PA'], 'price_eur': [152.5, 0], 'name': ['Air Liquide', 'LVMH']})
+        prices, names = _service(df).get_price_name_data()
+        assert prices == {'AI.PA': 152.5, 'MC.PA': 0.0}
+        assert names == {'AI.PA': 'Air Liquide', 'MC.PA': 'LVMH'}